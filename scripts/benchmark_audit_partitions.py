@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+Benchmark da auditoria particionada por mês contra a tabela única.
+
+Cria dois bancos temporários com o mesmo histórico (``--rows`` registros
+espalhados por ``--months`` meses): um com tudo em ``auditoria`` e outro
+com uma partição ``auditoria_AAAA_MM`` por mês. Mede pelo
+``AuditRepository``:
+- página e contagem dos últimos 7 dias (filtro padrão da tela)
+- contagem de um mês inteiro
+- página sem filtro de data (todas as partições)
+- remoção do mês mais antigo (DELETE contra DROP TABLE)
+
+Uso:
+    python scripts/benchmark_audit_partitions.py [--rows 10000000] [--months 24]
+        [--iterations 20] [--index-single-table]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.repositories.audit_archive import next_month  # noqa: E402
+from ozempic_seguro.repositories.audit_partitions import (  # noqa: E402
+    drop_partition,
+    ensure_partition,
+)
+from ozempic_seguro.repositories.audit_repository import AuditRepository  # noqa: E402
+from ozempic_seguro.repositories.connection import DatabaseConnection  # noqa: E402
+
+ACOES = ("LOGIN", "LOGOUT", "ABRIR_GAVETA", "FECHAR_GAVETA", "CRIAR")
+
+
+def _months(count: int):
+    months = [datetime.now(timezone.utc).strftime("%Y-%m")]
+    while len(months) < count:
+        year, mon = int(months[0][:4]), int(months[0][5:7])
+        months.insert(0, f"{year - (mon == 1):04d}-{(mon - 2) % 12 + 1:02d}")
+    return months
+
+
+def _seed_month(db: DatabaseConnection, table: str, month: str, rows: int) -> None:
+    """``rows`` registros espalhados uniformemente pelo mês"""
+    start = f"{month}-01 00:00:00"
+    first = datetime.strptime(month, "%Y-%m")
+    span = int((datetime.strptime(next_month(month), "%Y-%m") - first).total_seconds())
+    acoes = " ".join(f"WHEN {i} THEN '{acao}'" for i, acao in enumerate(ACOES))
+    db.execute(
+        f"""
+        WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < ?)
+        INSERT INTO {table} (usuario_id, acao, tabela_afetada, id_afetado, data_hora)
+        SELECT 1, CASE i % {len(ACOES)} {acoes} END, 'gavetas', i % 8,
+               datetime(?, '+' || (i * ? / ?) || ' seconds')
+        FROM n
+        """,
+        (rows - 1, start, span, rows),
+    )
+    db.commit()
+
+
+def _seed(db: DatabaseConnection, partitioned: bool, months, rows: int, index: bool) -> None:
+    db.execute("DELETE FROM auditoria")
+    db.commit()
+    for month in months:
+        table = ensure_partition(db, month) if partitioned else "auditoria"
+        _seed_month(db, table, month, rows // len(months))
+    if index and not partitioned:
+        db.execute("CREATE INDEX IF NOT EXISTS idx_auditoria_data_hora ON auditoria (data_hora)")
+        db.commit()
+    db.execute("ANALYZE")
+    db.commit()
+
+
+def _measure(operation, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_layout(partitioned: bool, months, rows: int, iterations: int, index: bool):
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "benchmark.db")
+    try:
+        with patch.object(DatabaseConnection, "_get_db_path", return_value=db_path):
+            DatabaseConnection.reset_instance()
+            db = DatabaseConnection.get_instance()
+            seed_start = time.perf_counter()
+            _seed(db, partitioned, months, rows, index)
+            seed_s = time.perf_counter() - seed_start
+
+            repo = AuditRepository(partitioned=partitioned)
+            today = datetime.now(timezone.utc)
+            week = ((today - timedelta(days=7)).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+            middle = months[len(months) // 2]
+            month_range = (f"{middle}-01", f"{middle}-31")
+            workloads = {
+                "página 7 dias": lambda: repo.get_logs(
+                    limit=20, data_inicio=week[0], data_fim=week[1]
+                ),
+                "contagem 7 dias": lambda: repo.count_logs(data_inicio=week[0], data_fim=week[1]),
+                "contagem 1 mês": lambda: repo.count_logs(
+                    data_inicio=month_range[0], data_fim=month_range[1]
+                ),
+                "página sem filtro": lambda: repo.get_logs(limit=20),
+            }
+            results = {name: _measure(op, iterations) for name, op in workloads.items()}
+
+            # Remoção do mês mais antigo: uma vez só, é destrutiva
+            start = time.perf_counter()
+            if partitioned:
+                drop_partition(db, months[0])
+            else:
+                db.execute(
+                    "DELETE FROM auditoria WHERE data_hora >= ? AND data_hora < ?",
+                    (months[0], next_month(months[0])),
+                )
+            db.commit()
+            results["remover mês antigo"] = (time.perf_counter() - start) * 1000
+
+            DatabaseConnection.reset_instance()
+        return seed_s, results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark da auditoria particionada")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--index-single-table",
+        action="store_true",
+        help="cria índice em data_hora também na tabela única",
+    )
+    args = parser.parse_args()
+
+    months = _months(args.months)
+    print(f"Registros: {args.rows}, meses: {args.months} ({months[0]} a {months[-1]})")
+    layouts = {}
+    for name, partitioned in (("tabela única", False), ("particionada", True)):
+        seed_s, layouts[name] = run_layout(
+            partitioned, months, args.rows, args.iterations, args.index_single_table
+        )
+        print(f"{name}: carga em {seed_s:.1f} s")
+
+    single, partitioned = layouts["tabela única"], layouts["particionada"]
+    print(f"{'Operação':<20} {'única (ms)':>12} {'partições (ms)':>15} {'ganho':>8}")
+    print("-" * 58)
+    for operation in single:
+        a, b = single[operation], partitioned[operation]
+        print(f"{operation:<20} {a:>12.2f} {b:>15.2f} {a / b if b else 0:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark dos perfis de PRAGMA nas operações reais dos repositórios.
+
+Para cada perfil de ``DatabaseConfig.PRAGMA_PROFILES`` cria um banco
+temporário com histórico de auditoria e mede:
+- login: busca do usuário + registro de auditoria LOGIN (o bcrypt é igual
+  em todos os perfis e fica de fora)
+- gaveta: abrir e fechar uma gaveta (estado + histórico) com auditoria
+- auditoria: página da listagem de auditoria + contagem
+
+Uso:
+    python scripts/benchmark_db_profiles.py [--iterations 300] [--audit-rows 20000]
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.config import Config  # noqa: E402
+from ozempic_seguro.repositories.audit_repository import AuditRepository  # noqa: E402
+from ozempic_seguro.repositories.connection import DatabaseConnection  # noqa: E402
+from ozempic_seguro.repositories.gaveta_repository import GavetaRepository  # noqa: E402
+from ozempic_seguro.repositories.pragmas import PROFILE_ENV_VAR  # noqa: E402
+from ozempic_seguro.repositories.user_repository import UserRepository  # noqa: E402
+
+GAVETAS = 8
+ACOES = ("LOGIN", "LOGOUT", "ABRIR_GAVETA", "FECHAR_GAVETA", "CRIAR")
+
+
+def _seed(db: DatabaseConnection, audit_rows: int) -> int:
+    db.execute("SELECT id FROM usuarios WHERE username = '00'")
+    user_id = db.fetchone()[0]
+    db.executemany(
+        "INSERT INTO auditoria (usuario_id, acao, tabela_afetada, id_afetado) VALUES (?, ?, ?, ?)",
+        [(user_id, ACOES[i % len(ACOES)], "gavetas", i % GAVETAS) for i in range(audit_rows)],
+    )
+    db.commit()
+    return user_id
+
+
+def _workloads(user_id: int):
+    users = UserRepository()
+    gavetas = GavetaRepository()
+    audit = AuditRepository()
+    rng = random.Random(42)
+
+    def login():
+        users.get_user_by_username("00")
+        audit.create_log(user_id, "LOGIN", "usuarios", user_id)
+
+    def gaveta():
+        numero = rng.randint(1, GAVETAS)
+        gavetas.set_state(numero, True, "administrador", user_id)
+        audit.create_log(user_id, "ABRIR_GAVETA", "gavetas", numero)
+        gavetas.set_state(numero, False, "administrador", user_id)
+        audit.create_log(user_id, "FECHAR_GAVETA", "gavetas", numero)
+
+    def auditoria():
+        page = rng.randint(0, 50)
+        audit.get_logs(offset=page * 20, limit=20)
+        audit.count_logs()
+
+    return {"login": login, "gaveta": gaveta, "auditoria": auditoria}
+
+
+def _measure(operation, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def run_profile(profile: str, iterations: int, audit_rows: int):
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "benchmark.db")
+    try:
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: profile}), patch.object(
+            DatabaseConnection, "_get_db_path", return_value=db_path
+        ):
+            DatabaseConnection.reset_instance()
+            db = DatabaseConnection.get_instance()
+            user_id = _seed(db, audit_rows)
+            results = {
+                name: _measure(operation, iterations)
+                for name, operation in _workloads(user_id).items()
+            }
+            DatabaseConnection.reset_instance()
+        return results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dos perfis de PRAGMA")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--audit-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"Iterações: {args.iterations}, registros de auditoria: {args.audit_rows}")
+    print(f"{'Perfil':<12} {'Operação':<12} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    print("-" * 48)
+    for profile in Config.Database.PRAGMA_PROFILES:
+        results = run_profile(profile, args.iterations, args.audit_rows)
+        for name, (p50, p95) in results.items():
+            print(f"{profile:<12} {name:<12} {p50:>10.3f} {p95:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Benchmark da latência por chamada de log no thread do chamador.
+
+Compara o FileHandler síncrono (formatação + E/S no chamador) com o mesmo
+handler atrás da fila de ``core.log_queue``, onde o chamador só enfileira.
+O cenário "disco lento" acrescenta 0,5 ms por escrita (antivírus, HD).
+
+Uso:
+    python scripts/benchmark_logging.py [n_chamadas]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.config import LoggingConfig  # noqa: E402
+from ozempic_seguro.core.log_queue import LogDispatcher, QueueingHandler  # noqa: E402
+
+
+class _SlowFileHandler(logging.FileHandler):
+    def emit(self, record):
+        time.sleep(0.0005)
+        super().emit(record)
+
+
+def _file_handler(path: str, slow: bool = False) -> logging.Handler:
+    handler_cls = _SlowFileHandler if slow else logging.FileHandler
+    handler = handler_cls(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(LoggingConfig.LOG_FORMAT, LoggingConfig.DATE_FORMAT))
+    return handler
+
+
+def _measure(log: logging.Logger, calls: int) -> list:
+    samples = []
+    for i in range(calls):
+        start = time.perf_counter_ns()
+        log.info("Service accessed: %s (%d)", "user_service", i)
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+    return samples
+
+
+def _report(name: str, samples: list) -> None:
+    def pct(p: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * p))] / 1000
+
+    mean = sum(samples) / len(samples) / 1000
+    print(f"{name:<22} {mean:>9.2f} {pct(0.5):>9.2f} {pct(0.99):>9.2f} {pct(0.999):>9.2f}")
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    log = logging.getLogger(name)
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    log.addHandler(handler)
+    return log
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    slow_calls = min(calls, 2000)
+    temp_dir = tempfile.mkdtemp()
+    dispatchers = []
+
+    def queued(name: str, slow: bool) -> logging.Logger:
+        dispatcher = LogDispatcher(maxsize=calls + 1)
+        dispatchers.append(dispatcher)
+        handler = _file_handler(os.path.join(temp_dir, f"{name}.log"), slow)
+        return _logger(f"benchmark.{name}", QueueingHandler(dispatcher, [handler]))
+
+    print(f"Latência no chamador (µs); {calls} chamadas, {slow_calls} no disco lento")
+    print(f"{'Handler':<22} {'média':>9} {'p50':>9} {'p99':>9} {'p99.9':>9}")
+    print("-" * 62)
+    sync = _logger("benchmark.sync", _file_handler(os.path.join(temp_dir, "sync.log")))
+    _report("FileHandler síncrono", _measure(sync, calls))
+    _report("Fila (log-writer)", _measure(queued("queued", False), calls))
+
+    slow = _logger("benchmark.slow", _file_handler(os.path.join(temp_dir, "slow.log"), True))
+    _report("Disco lento síncrono", _measure(slow, slow_calls))
+    _report("Disco lento na fila", _measure(queued("slow_queued", True), slow_calls))
+
+    start = time.perf_counter()
+    for dispatcher in dispatchers:
+        dispatcher.stop()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\nEsvaziamento das filas no encerramento: {elapsed_ms:.1f} ms")
+    print(f"Descartes: {sum(d.stats()['dropped_total'] for d in dispatchers)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Benchmark de objetos de serviço/repositório alocados por tela.
+
+Resolve as mesmas dependências que cada tela resolve na construção e conta
+quantas instâncias de classes de ``services`` e ``repositories`` passaram a
+existir. Com o container compartilhado, reabrir uma tela não deve alocar nada.
+
+Uso:
+    python scripts/benchmark_screen_objects.py
+"""
+import gc
+import os
+import sys
+import tempfile
+from collections import Counter
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.repositories.connection import DatabaseConnection  # noqa: E402
+from ozempic_seguro.services.service_factory import ServiceFactory  # noqa: E402
+from ozempic_seguro.services.auth_service import get_auth_service  # noqa: E402
+from ozempic_seguro.services.audit_view_service import get_audit_view_service  # noqa: E402
+from ozempic_seguro.services.timer_control_service import get_timer_control_service  # noqa: E402
+from ozempic_seguro.services.user_management_service import (  # noqa: E402
+    get_user_management_service,
+)
+from ozempic_seguro.services.user_registration_service import (  # noqa: E402
+    get_user_registration_service,
+)
+
+TRACKED_PACKAGES = ("ozempic_seguro.services.", "ozempic_seguro.repositories.")
+
+
+def _gaveta_page():
+    # GavetaButtonGrid: 8 botões por página
+    for _ in range(8):
+        ServiceFactory.get_gaveta_service()
+        get_timer_control_service()
+        get_auth_service()
+
+
+SCREENS = {
+    "login": lambda: get_auth_service(),
+    "gavetas (8 botões)": _gaveta_page,
+    "auditoria": lambda: get_audit_view_service(),
+    "gerenciamento de usuários": lambda: get_user_management_service(),
+    "cadastro de usuário": lambda: get_user_registration_service(),
+    "controle de timer": lambda: (get_timer_control_service(), get_auth_service()),
+    "parâmetros do sistema": lambda: get_timer_control_service(),
+}
+
+
+def _count_tracked() -> Counter:
+    gc.collect()
+    counts: Counter = Counter()
+    for obj in gc.get_objects():
+        module = getattr(type(obj), "__module__", "")
+        if module.startswith(TRACKED_PACKAGES):
+            counts[type(obj).__name__] += 1
+    return counts
+
+
+def _measure(open_screen) -> Counter:
+    before = _count_tracked()
+    open_screen()
+    return _count_tracked() - before
+
+
+def main() -> None:
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "benchmark.db")
+
+    with patch.object(DatabaseConnection, "_get_db_path", return_value=db_path):
+        DatabaseConnection.get_instance()
+
+        print(f"{'Tela':<28} {'1ª abertura':>12} {'reabertura':>12}  detalhes (1ª abertura)")
+        print("-" * 90)
+        for name, open_screen in SCREENS.items():
+            ServiceFactory.reset_all_services()
+            first = _measure(open_screen)
+            again = _measure(open_screen)
+            details = ", ".join(f"{cls}={n}" for cls, n in sorted(first.items()))
+            print(f"{name:<28} {sum(first.values()):>12} {sum(again.values()):>12}  {details}")
+
+        DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Benchmark do custo por registro do SensitiveDataFilter.
+
+Mede registros comuns (caminho rápido da pré-varredura), registros com
+segredo na mensagem e registros com campos extras sensíveis.
+
+Uso:
+    python scripts/benchmark_sensitive_filter.py [n_registros]
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.core.structured_logger import SensitiveDataFilter  # noqa: E402
+
+
+def _plain():
+    return logging.makeLogRecord(
+        {"msg": "Service accessed: %s", "args": ("user_service",), "levelno": logging.INFO}
+    )
+
+
+def _secret_message():
+    return logging.makeLogRecord({"msg": 'login falhou username=joao senha="abc123" ip=local'})
+
+
+def _secret_extra():
+    return logging.makeLogRecord({"msg": "Starting login", "event": "x", "auth_token": "abc"})
+
+
+CASES = {
+    "mensagem comum": _plain,
+    "segredo na mensagem": _secret_message,
+    "extra sensível": _secret_extra,
+}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sensitive_filter = SensitiveDataFilter()
+
+    print(f"{n} registros por caso")
+    print(f"{'Caso':<22} {'µs/registro':>12}")
+    print("-" * 36)
+    for name, factory in CASES.items():
+        records = [factory() for _ in range(n)]
+        start = time.perf_counter()
+        for record in records:
+            sensitive_filter.filter(record)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<22} {elapsed / n * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Benchmark do custo por registro do StructuredFormatter.
+
+Compara o serializador da biblioteca padrão com o orjson (quando
+instalado) para registros simples, com contexto de auditoria e com
+campos extras.
+
+Uso:
+    python scripts/benchmark_structured_formatter.py [n_registros]
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.core import structured_logger  # noqa: E402
+from ozempic_seguro.core.structured_logger import StructuredFormatter  # noqa: E402
+
+
+def _plain():
+    return logging.makeLogRecord(
+        {"msg": "Service accessed: %s", "args": ("user_service",), "levelno": logging.INFO}
+    )
+
+
+def _audit():
+    return logging.makeLogRecord(
+        {"msg": "Login ok", "user_id": 42, "action": "LOGIN", "ip_address": "127.0.0.1"}
+    )
+
+
+def _extra():
+    return logging.makeLogRecord(
+        {"msg": "Gaveta aberta", "event": "drawer_open", "gaveta": 7, "duracao_ms": 12.5}
+    )
+
+
+CASES = {
+    "simples": _plain,
+    "auditoria": _audit,
+    "campos extras": _extra,
+}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    formatters = {"json": StructuredFormatter(use_orjson=False)}
+    if structured_logger.orjson is not None:
+        formatters["orjson"] = StructuredFormatter(use_orjson=True)
+
+    print(f"{n} registros por caso")
+    print(f"{'Caso':<16} {'Serializador':<14} {'µs/registro':>12}")
+    print("-" * 44)
+    for name, factory in CASES.items():
+        records = [factory() for _ in range(n)]
+        for label, formatter in formatters.items():
+            start = time.perf_counter()
+            for record in records:
+                formatter.format(record)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16} {label:<14} {elapsed / n * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Gera o atlas de imagens pré-escaladas em ``assets/atlas``.
+
+Redimensiona cada imagem usada pela interface para todas as escalas de
+``ATLAS_SCALES``, de modo que a aplicação não precise decodificar nem
+reamostrar as imagens ao abrir as telas. Rode de novo sempre que uma
+imagem de ``assets/`` mudar (imagens alteradas são ignoradas até lá).
+
+Uso:
+    python scripts/build_assets.py [--output DIR]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ozempic_seguro.views.components.image_atlas import (  # noqa: E402
+    ASSETS_DIR,
+    ATLAS_DIR,
+    ATLAS_SCALES,
+    ATLAS_SPRITES,
+    build_atlas,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=ASSETS_DIR, help="diretório das imagens")
+    parser.add_argument("--output", default=ATLAS_DIR, help="diretório do atlas")
+    args = parser.parse_args()
+
+    built = build_atlas(args.source, args.output)
+    missing = sorted({name for name, _ in ATLAS_SPRITES} - set(built))
+
+    scales = ", ".join(f"{scale:g}x" for scale in ATLAS_SCALES)
+    print(f"Escalas: {scales}")
+    for name, variants in built.items():
+        sizes = ", ".join(f"{w}x{h}" for w, h in variants)
+        print(f"  {name:<20} {sizes}")
+    for name in missing:
+        print(f"  {name:<20} (ausente em {args.source})")
+
+    if not built:
+        print("Nenhuma imagem encontrada; atlas não gerado")
+        return 1
+    size_kb = os.path.getsize(os.path.join(args.output, "atlas.bin")) / 1024
+    print(f"Atlas: {args.output} ({size_kb:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """
 Configurações centralizadas do sistema Ozempic Seguro
 """
+
 import os
 import logging
 
@@ -13,6 +14,9 @@ class SecurityConfig:
 
     # Configurações de hash de senha
     BCRYPT_ROUNDS = 12
+    BCRYPT_MIN_ROUNDS = 10
+    BCRYPT_MAX_ROUNDS = 16
+    BCRYPT_TARGET_MS = 250  # Orçamento de latência do login para calibração
 
     # Configurações de sessão
     SESSION_TIMEOUT_MINUTES = 10
@@ -20,6 +24,7 @@ class SecurityConfig:
     # Configurações de tentativas de login
     MAX_LOGIN_ATTEMPTS = 3
     LOCKOUT_DURATION_MINUTES = 5  # Reduzido de 10 para 5 minutos
+    LOGIN_ATTEMPTS_MAX_ENTRIES = 10000  # Usernames rastreados em memória
 
     # Configurações de validação
     MIN_PASSWORD_LENGTH = 4
@@ -55,9 +60,67 @@ class DatabaseConfig:
     ENABLE_FOREIGN_KEYS = True
     CACHE_SIZE = 2000
 
+    # Perfis de PRAGMA (a variável OZEMPIC_DB_PROFILE escolhe outro perfil)
+    PRAGMA_PROFILE = "durable"
+    PRAGMA_PROFILES = {
+        # fsync a cada commit: nenhum registro de auditoria perdido em queda de energia
+        "durable": {
+            "synchronous": "FULL",
+            "busy_timeout": 30000,
+            "temp_store": "DEFAULT",
+            "mmap_size": 0,
+            "cache_size": CACHE_SIZE,
+            "wal_autocheckpoint": 1000,
+        },
+        # WAL com synchronous NORMAL: íntegro após queda, pode perder os últimos commits
+        "balanced": {
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,
+            "temp_store": "MEMORY",
+            "mmap_size": 64 * 1024 * 1024,
+            "cache_size": -8000,  # ~8 MB
+            "wal_autocheckpoint": 1000,
+        },
+        # Listagens de auditoria grandes: mais cache e mmap, checkpoints espaçados
+        "fast-read": {
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,
+            "temp_store": "MEMORY",
+            "mmap_size": 256 * 1024 * 1024,
+            "cache_size": -32000,  # ~32 MB
+            "wal_autocheckpoint": 4000,
+        },
+    }
+
+    # Bancos novos nascem com auto_vacuum incremental (o existente exige VACUUM)
+    INCREMENTAL_AUTO_VACUUM = True
+
+    # Manutenção em segundo plano enquanto as telas iniciais alternam
+    MAINTENANCE_ENABLED = True
+    MAINTENANCE_BUDGET_MS = 250  # Por rodada; a operação é interrompida ao estourar
+    MAINTENANCE_CHECKPOINT_INTERVAL = 300  # segundos
+    MAINTENANCE_OPTIMIZE_INTERVAL = 6 * 3600
+    MAINTENANCE_VACUUM_INTERVAL = 3600
+    MAINTENANCE_WAL_TRUNCATE_BYTES = 4 * 1024 * 1024  # Acima disso, checkpoint TRUNCATE
+    MAINTENANCE_VACUUM_PAGES = 256  # Páginas liberadas por rodada
+    MAINTENANCE_HISTORY = 20  # Resultados guardados para o diagnóstico
+
+    # Auditoria em tabelas mensais (auditoria_AAAA_MM); a tabela única segue sendo lida
+    AUDIT_PARTITIONED = False
+
+    # Arquivamento da auditoria em segmentos mensais (somente leitura, anexáveis).
+    # Opcional: as linhas saem do banco; os segmentos vão junto no backup
+    AUDIT_ARCHIVE_ENABLED = False
+    AUDIT_ARCHIVE_AFTER_DAYS = 365  # Meses inteiros mais velhos que isso saem do banco
+    AUDIT_ARCHIVE_DIR = "auditoria_arquivo"  # Ao lado do banco; copiado em BACKUP_DIR
+    AUDIT_ARCHIVE_BATCH = 1000  # Linhas copiadas e apagadas por lote
+    AUDIT_ARCHIVE_INTERVAL_HOURS = 24
+
     # Configurações de backup
     AUTO_BACKUP = True
     BACKUP_INTERVAL_HOURS = 24
+    BACKUP_PAGES_PER_STEP = 256  # Páginas copiadas por passo da API de backup
+    BACKUP_STEP_SLEEP = 0.005  # segundos entre passos; libera o banco para a aplicação
 
 
 class UIConfig:
@@ -150,6 +213,29 @@ class LoggingConfig:
     LOG_FILE_MAX_SIZE = 10 * 1024 * 1024  # 10MB
     LOG_FILE_BACKUP_COUNT = 5
     LOG_ROTATION = True
+    LOG_ROTATE_DAILY = True  # Também rotaciona na virada do dia
+    LOG_RETENTION_DAYS = 90  # Segmentos comprimidos mais antigos são apagados
+
+    # Fila de escrita assíncrona
+    LOG_QUEUE_SIZE = 10000
+    LOG_QUEUE_BLOCK_TIMEOUT = 0.05  # Espera máxima (s) de WARNING+ com a fila cheia
+
+    # Buffer em memória para a tela de diagnóstico (últimos N por nível)
+    LOG_BUFFER_CAPACITY = 500
+    LOG_BUFFER_LEVEL = "INFO"
+
+    # Limite de taxa de mensagens repetitivas (por logger + template)
+    LOG_RATE_LIMIT_BURST = 50  # Padrão: registros iguais permitidos por janela
+    LOG_RATE_LIMIT_WINDOW = 10.0  # Segundos
+    LOG_RATE_LIMIT_MAX_KEYS = 1024
+    # (prefixo da mensagem, burst, janela em s[, prefixo do logger])
+    LOG_RATE_LIMITS = (
+        ("Method call:", 20, 10.0),
+        ("Method success:", 20, 10.0),
+        ("Returning mock service:", 10, 10.0),
+        ("Service registered:", 10, 10.0),
+        ("Login attempt for locked user", 5, 60.0),
+    )
 
     # Configurações de console
     CONSOLE_LOG_LEVEL = "ERROR"
@@ -1,10 +1,12 @@
 import customtkinter
 from ..views.pages_iniciais.tela_toque_view import TelaToqueFrame
 from ..views.pages_iniciais.tela_logo_view import TelaLogoFrame
-from ..views.iniciar_sessao_view import IniciarSessaoFrame
-from ..views.login_view import LoginFrame
 from ..session.session_manager import SessionManager
 from ..core.logger import logger
+from ..core.startup_profiler import get_profiler
+from ..repositories.audit_archive import get_audit_archive
+from ..repositories.maintenance import get_maintenance, interrupt_maintenance
+from ..services.backup_service import get_backup_service
 
 
 class NavigationController:
@@ -22,38 +24,6 @@ class NavigationController:
         # Overlay para transições suaves
         self._transition_overlay = customtkinter.CTkFrame(self.container, fg_color="#3B6A7D")
 
-    def preload_frames(self):
-        """Pré-carrega os frames iniciais de forma invisível"""
-        # Criar frames e renderizar fora da tela visível
-        self.frames["toque"] = TelaToqueFrame(
-            self.container, on_click_callback=self.show_iniciar_sessao
-        )
-        self._prerender_frame(self.frames["toque"])
-
-        self.frames["logo"] = TelaLogoFrame(
-            self.container, on_click_callback=self.show_iniciar_sessao
-        )
-        self._prerender_frame(self.frames["logo"])
-
-        self.frames["iniciar"] = IniciarSessaoFrame(
-            self.container,
-            show_login_callback=self.show_login,
-            voltar_callback=self.voltar_para_tela_inicial,
-        )
-        self._prerender_frame(self.frames["iniciar"])
-
-        self.frames["login"] = LoginFrame(
-            self.container, show_iniciar_callback=self.show_iniciar_sessao
-        )
-        self._prerender_frame(self.frames["login"])
-
-    def _prerender_frame(self, frame):
-        """Pré-renderiza um frame de forma invisível"""
-        # Posicionar fora da tela para renderizar sem mostrar
-        frame.place(x=-9999, y=-9999)
-        self.app.update_idletasks()
-        frame.place_forget()
-
     def show_frame(self, frame_name, animate=True):
         """Mostra um frame específico com transição suave"""
         if self._transitioning:
@@ -104,26 +74,38 @@ class NavigationController:
 
     def _create_frame(self, frame_name):
         """Cria um frame específico"""
-        if frame_name == "toque":
-            self.frames[frame_name] = TelaToqueFrame(
-                self.container, on_click_callback=self.show_iniciar_sessao
-            )
-        elif frame_name == "logo":
-            self.frames[frame_name] = TelaLogoFrame(
-                self.container, on_click_callback=self.show_iniciar_sessao
-            )
-        elif frame_name == "iniciar":
-            self.frames[frame_name] = IniciarSessaoFrame(
-                self.container,
-                show_login_callback=self.show_login,
-                voltar_callback=self.voltar_para_tela_inicial,
-            )
-        elif frame_name == "login":
-            self.frames[frame_name] = LoginFrame(
-                self.container, show_iniciar_callback=self.show_iniciar_sessao
-            )
-
-        self.app.update_idletasks()
+        with get_profiler().phase(f"frame.{frame_name}"):
+            if frame_name == "toque":
+                self.frames[frame_name] = TelaToqueFrame(
+                    self.container, on_click_callback=self.show_iniciar_sessao
+                )
+            elif frame_name == "logo":
+                self.frames[frame_name] = TelaLogoFrame(
+                    self.container, on_click_callback=self.show_iniciar_sessao
+                )
+            elif frame_name == "iniciar":
+                from ..views.iniciar_sessao_view import IniciarSessaoFrame
+
+                self.frames[frame_name] = IniciarSessaoFrame(
+                    self.container,
+                    show_login_callback=self.show_login,
+                    voltar_callback=self.voltar_para_tela_inicial,
+                )
+            elif frame_name == "login":
+                self._wait_startup()
+                from ..views.login_view import LoginFrame
+
+                self.frames[frame_name] = LoginFrame(
+                    self.container, show_iniciar_callback=self.show_iniciar_sessao
+                )
+
+            self.app.update_idletasks()
+
+    def _wait_startup(self):
+        """Telas que usam o banco esperam o fim do pipeline de inicialização"""
+        wait_startup = getattr(self.app, "wait_startup", None)
+        if callable(wait_startup):
+            wait_startup()
 
     def voltar_para_tela_inicial(self):
         if self.after_id:
@@ -140,9 +122,12 @@ class NavigationController:
         self.show_frame("logo")
 
     def show_iniciar_sessao(self):
+        self._notify_activity()
         if self.after_id:
             self.app.after_cancel(self.after_id)
         if "iniciar" not in self.frames or not self.frames["iniciar"].winfo_exists():
+            from ..views.iniciar_sessao_view import IniciarSessaoFrame
+
             self.frames["iniciar"] = IniciarSessaoFrame(
                 self.container,
                 show_login_callback=self.show_login,
@@ -151,6 +136,9 @@ class NavigationController:
         self.show_frame("iniciar")
 
     def show_login(self):
+        # Banco e callbacks de sessão precisam estar prontos
+        self._wait_startup()
+
         # Limpa a sessão atual
         session_manager = SessionManager.get_instance()
         session_manager.set_current_user(None)
@@ -160,6 +148,8 @@ class NavigationController:
             self.frames["login"].usuario_entry.delete(0, "end")
             self.frames["login"].senha_entry.delete(0, "end")
         else:
+            from ..views.login_view import LoginFrame
+
             self.frames["login"] = LoginFrame(
                 self.container, show_iniciar_callback=self.show_iniciar_sessao
             )
@@ -177,11 +167,32 @@ class NavigationController:
 
         self.tela_index = (self.tela_index + 1) % len(self.telas)
         self.telas[self.tela_index]()
+        self._notify_idle()
 
         # Agenda próxima alternância
         if self.is_running:
             self.after_id = self.app.after(3000, self.alternar_tela)
 
+    def _notify_idle(self):
+        """Telas iniciais alternando: oportunidade para manutenção e backup do banco"""
+        startup = getattr(self.app, "startup", None)
+        if startup is not None and not startup.finished:
+            return  # Banco ainda abrindo; não bloquear a thread do Tk
+        try:
+            get_maintenance().notify_idle()
+            get_audit_archive().maybe_archive()
+        except Exception as e:
+            logger.warning(f"Database maintenance unavailable: {e}")
+        try:
+            # Backup automático vencido: cópia em passos, sem travar as gavetas
+            get_backup_service().maybe_backup()
+        except Exception as e:
+            logger.warning(f"Database backup unavailable: {e}")
+
+    def _notify_activity(self):
+        """Usuário tocou na tela: manutenção em andamento é interrompida"""
+        interrupt_maintenance()
+
     def cleanup(self):
         """Limpa recursos quando a aplicação é encerrada"""
         try:
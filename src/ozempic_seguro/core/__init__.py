@@ -4,7 +4,7 @@ Módulo core - Componentes fundamentais do sistema.
 Fornece utilitários, validadores, cache, logging e exceções customizadas.
 """
 from .validators import Validators, ValidationResult
-from .cache import MemoryCache, cached
+from .cache import MemoryCache, ExpiringLRU, cached
 from .logger import logger
 from .exceptions import (
     # Base
@@ -49,6 +49,7 @@ __all__ = [
     "ValidationResult",
     # Cache
     "MemoryCache",
+    "ExpiringLRU",
     "cached",
     # Logger
     "logger",
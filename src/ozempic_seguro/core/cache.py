@@ -2,11 +2,13 @@
 Sistema de cache em memória para otimização de performance.
 Implementa cache LRU (Least Recently Used) com TTL (Time To Live).
 """
-from typing import Any, Optional, Dict, Callable
+from typing import Any, Optional, Dict, Callable, Iterator
+from collections import OrderedDict
 from functools import wraps
 from datetime import datetime
 import threading
 import hashlib
+import time
 
 
 class CacheEntry:
@@ -162,6 +164,113 @@ class MemoryCache:
             return len(expired_keys)
 
 
+class ExpiringLRU:
+    """
+    Mapa limitado com expiração por prazo monotônico.
+
+    Todas as operações são O(1): com TTL único, a ordem do OrderedDict é a
+    ordem de expiração (cada escrita renova o prazo e move a chave para o
+    fim), e ao atingir ``max_size`` a entrada mais antiga é descartada.
+    Não é thread-safe; o chamador deve serializar o acesso.
+
+    ``pinned`` protege valores do descarte por tamanho. É avaliado na escrita:
+    valores fixados ficam numa segunda fila, fora da ordem de descarte, e só
+    saem por prazo ou ``delete``. Se todas as entradas estiverem fixadas, o
+    mapa cresce além de ``max_size`` até que vençam.
+    """
+
+    __slots__ = ("_data", "_pinned_data", "_max_size", "_ttl", "_clock", "_pinned", "evictions")
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        pinned: Optional[Callable[[Any], bool]] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size deve ser > 0")
+        self._data: "OrderedDict[Any, list]" = OrderedDict()
+        self._pinned_data: "OrderedDict[Any, list]" = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._pinned = pinned
+        self.evictions = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retorna o valor se a chave existir e não estiver vencida"""
+        queue = self._data if key in self._data else self._pinned_data
+        item = queue.get(key)
+        if item is None:
+            return default
+        if self._clock() >= item[1]:
+            del queue[key]
+            return default
+        return item[0]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Grava o valor renovando o prazo da chave"""
+        deadline = self._clock() + self._ttl
+        pinned = self._pinned is not None and self._pinned(value)
+        queue, other = (
+            (self._pinned_data, self._data) if pinned else (self._data, self._pinned_data)
+        )
+        if key in queue:
+            queue.move_to_end(key)
+        elif other.pop(key, None) is None and len(self) >= self._max_size and self._data:
+            # Só entradas não fixadas saem por tamanho
+            self._data.popitem(last=False)
+            self.evictions += 1
+        queue[key] = [value, deadline]
+
+    def delete(self, key: Any) -> bool:
+        """Remove a chave; retorna False se não existia"""
+        if self._data.pop(key, None) is not None:
+            return True
+        return self._pinned_data.pop(key, None) is not None
+
+    def purge_expired(self) -> int:
+        """Remove entradas vencidas do início das filas"""
+        now = self._clock()
+        removed = 0
+        for queue in (self._data, self._pinned_data):
+            while queue:
+                key, item = next(iter(queue.items()))
+                if item[1] > now:
+                    break
+                del queue[key]
+                removed += 1
+        return removed
+
+    def next_expiry(self) -> Optional[float]:
+        """Segundos até a próxima expiração (None se vazio)"""
+        heads = [
+            next(iter(queue.values()))[1] for queue in (self._data, self._pinned_data) if queue
+        ]
+        if not heads:
+            return None
+        return max(0.0, min(heads) - self._clock())
+
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        self._data.clear()
+        self._pinned_data.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._pinned_data)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._data
+        yield from self._pinned_data
+
+
+_MISSING = object()
+
+
 # Cache global compartilhado
 _global_cache = MemoryCache()
 
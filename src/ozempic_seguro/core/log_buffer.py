@@ -0,0 +1,138 @@
+"""
+Buffer circular em memória com os registros de log mais recentes.
+
+Mantém os últimos N registros de cada nível em arrays pré-alocados de
+registros compactos, para que a tela de diagnóstico mostre erros recentes
+sem ler os arquivos de log do disco.
+"""
+import bisect
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from ..config import LoggingConfig
+
+_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+
+
+class LogEntry(NamedTuple):
+    """Registro compacto guardado no buffer"""
+
+    created: float
+    levelno: int
+    name: str
+    message: str
+
+    @property
+    def levelname(self) -> str:
+        return logging.getLevelName(self.levelno)
+
+
+def _bucket(levelno: int) -> int:
+    """Nível padrão (DEBUG..CRITICAL) em que o registro é guardado"""
+    index = bisect.bisect_right(_LEVELS, levelno) - 1
+    return _LEVELS[max(index, 0)]
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Handler que guarda os últimos ``capacity`` registros de cada nível.
+
+    Cada nível tem seu próprio array circular, de modo que uma rajada de
+    INFO não expulsa os erros. A escrita é O(1) e roda na thread de escrita
+    de logs; consultas copiam os registros sob o lock do handler.
+    """
+
+    def __init__(
+        self,
+        capacity: int = LoggingConfig.LOG_BUFFER_CAPACITY,
+        level: int = logging.getLevelName(LoggingConfig.LOG_BUFFER_LEVEL),
+    ):
+        super().__init__(level)
+        if capacity <= 0:
+            raise ValueError("capacity deve ser > 0")
+        self.capacity = capacity
+        self._slots: Dict[int, List[Optional[LogEntry]]] = {
+            lvl: [None] * capacity for lvl in _LEVELS
+        }
+        self._next: Dict[int, int] = dict.fromkeys(_LEVELS, 0)
+        self._total: Dict[int, int] = dict.fromkeys(_LEVELS, 0)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = record.getMessage()
+            if record.exc_info and record.exc_info[0] is not None:
+                message = f"{message} [{record.exc_info[0].__name__}: {record.exc_info[1]}]"
+            elif getattr(record, "exc_type_name", None):
+                # Registro preparado pela fila de logging (exc_info já convertido em texto)
+                message = f"{message} [{record.exc_type_name}: {record.exc_message}]"
+            entry = LogEntry(record.created, record.levelno, record.name, message)
+
+            bucket = _bucket(record.levelno)
+            index = self._next[bucket]
+            self._slots[bucket][index] = entry
+            self._next[bucket] = (index + 1) % self.capacity
+            self._total[bucket] += 1
+        except Exception:
+            self.handleError(record)
+
+    def query(
+        self,
+        min_level: int = logging.NOTSET,
+        logger: str = "",
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[LogEntry]:
+        """
+        Registros guardados, do mais recente para o mais antigo.
+
+        Args:
+            min_level: Nível mínimo (ex.: logging.WARNING)
+            logger: Prefixo do nome do logger ("" = todos)
+            since: Apenas registros criados a partir deste timestamp (epoch)
+            limit: Número máximo de registros
+        """
+        with self.lock:
+            entries = [
+                entry
+                for lvl in _LEVELS
+                if lvl >= _bucket(min_level)
+                for entry in self._slots[lvl]
+                if entry is not None
+            ]
+
+        result = [
+            entry
+            for entry in entries
+            if entry.levelno >= min_level
+            and entry.name.startswith(logger)
+            and (since is None or entry.created >= since)
+        ]
+        result.sort(key=lambda entry: entry.created, reverse=True)
+        return result if limit is None else result[:limit]
+
+    def counts(self) -> Dict[str, int]:
+        """Total de registros recebidos por nível desde o início/limpeza"""
+        with self.lock:
+            return {logging.getLevelName(lvl): self._total[lvl] for lvl in _LEVELS}
+
+    def clear(self) -> None:
+        """Descarta todos os registros guardados"""
+        with self.lock:
+            for lvl in _LEVELS:
+                self._slots[lvl] = [None] * self.capacity
+                self._next[lvl] = 0
+                self._total[lvl] = 0
+
+
+_ring_buffer: Optional[RingBufferHandler] = None
+_ring_buffer_lock = threading.Lock()
+
+
+def get_ring_buffer() -> RingBufferHandler:
+    """Retorna o buffer compartilhado da aplicação"""
+    global _ring_buffer
+    with _ring_buffer_lock:
+        if _ring_buffer is None:
+            _ring_buffer = RingBufferHandler()
+        return _ring_buffer
@@ -0,0 +1,233 @@
+"""
+Logging não bloqueante: handlers reais rodam numa thread de escrita.
+
+O chamador só enfileira o registro numa fila limitada; a thread
+``log-writer`` formata e grava em arquivo/console. Com a fila cheia,
+registros abaixo de WARNING são descartados (e contados) e WARNING ou
+acima esperam até ``LOG_QUEUE_BLOCK_TIMEOUT`` antes de serem descartados.
+"""
+
+import atexit
+import contextlib
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..config import LoggingConfig
+
+_STOP = object()
+_EXC_FORMATTER = logging.Formatter()
+
+
+class LogDispatcher:
+    """
+    Fila limitada e thread única que entrega registros aos handlers.
+
+    Uma instância atende todos os loggers; cada item leva a lista de
+    handlers de destino do logger que o enfileirou.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = LoggingConfig.LOG_QUEUE_SIZE,
+        block_timeout: float = LoggingConfig.LOG_QUEUE_BLOCK_TIMEOUT,
+    ):
+        # SimpleQueue (C) é bem mais barata que Queue; o limite é checado por qsize
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._maxsize = maxsize
+        self._block_timeout = block_timeout
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._dropped: Dict[str, int] = {}
+        self._drop_lock = threading.Lock()
+        self._handlers: List[logging.Handler] = []
+
+    def enqueue(self, handlers: Tuple[logging.Handler, ...], record: logging.LogRecord) -> bool:
+        """Enfileira o registro; retorna False se foi descartado"""
+        if self._thread is None:
+            self._ensure_started()
+        if self._queue.qsize() < self._maxsize:
+            self._queue.put((handlers, record))
+            return True
+
+        if record.levelno >= logging.WARNING:
+            # Contrapressão: espera a thread de escrita abrir espaço
+            deadline = time.monotonic() + self._block_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.001)
+                if self._queue.qsize() < self._maxsize:
+                    self._queue.put((handlers, record))
+                    return True
+
+        with self._drop_lock:
+            self._dropped[record.levelname] = self._dropped.get(record.levelname, 0) + 1
+        return False
+
+    def register(self, handlers: Sequence[logging.Handler]) -> None:
+        """Registra handlers para flush/close no encerramento"""
+        self._handlers.extend(h for h in handlers if h not in self._handlers)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Espera a fila esvaziar e descarrega os handlers.
+
+        Returns:
+            bool: False se o prazo venceu antes de esvaziar
+        """
+        done = threading.Event()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(((), done))
+            drained = done.wait(timeout)
+        else:
+            drained = self._queue.empty()
+
+        for handler in list(self._handlers):
+            with contextlib.suppress(Exception):
+                handler.flush()
+        return drained
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Esvazia a fila, encerra a thread e fecha os handlers"""
+        self.flush(timeout)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        self._thread = None
+
+        for handler in list(self._handlers):
+            with contextlib.suppress(Exception):
+                handler.close()
+
+    def stats(self) -> Dict[str, object]:
+        """Tamanho atual da fila e descartes por nível"""
+        with self._drop_lock:
+            dropped = dict(self._dropped)
+        return {
+            "queued": self._queue.qsize(),
+            "maxsize": self._maxsize,
+            "dropped": dropped,
+            "dropped_total": sum(dropped.values()),
+        }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            item = get()
+            if item is _STOP:
+                return
+            handlers, record = item
+            if isinstance(record, threading.Event):
+                record.set()  # Marcador de flush
+                continue
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+
+
+class QueueingHandler(logging.Handler):
+    """
+    Handler do lado do chamador: aplica filtros e enfileira.
+
+    A mensagem é resolvida (``msg % args``) antes de enfileirar para que
+    argumentos mutáveis não mudem até a escrita; a formatação completa e a
+    E/S ficam na thread de escrita.
+
+    Como em ``logging.handlers.QueueHandler.prepare``, a exceção vira texto
+    (``exc_text``) antes de enfileirar e ``exc_info`` sai do registro: a fila
+    não mantém frames vivos e o traceback reflete o momento do log. Tipo e
+    mensagem da exceção seguem em ``exc_type_name``/``exc_message``.
+    """
+
+    def __init__(self, dispatcher: LogDispatcher, handlers: Sequence[logging.Handler]):
+        super().__init__(level=min((h.level for h in handlers), default=logging.NOTSET))
+        self.dispatcher = dispatcher
+        self.targets: Tuple[logging.Handler, ...] = tuple(handlers)
+        dispatcher.register(handlers)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Sem o lock do Handler: enfileirar já é thread-safe
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.prepare(record)
+            self.dispatcher.enqueue(self.targets, record)
+        except Exception:
+            self.handleError(record)
+
+
+    @staticmethod
+    def prepare(record: logging.LogRecord) -> None:
+        """Deixa o registro sem referências a objetos do chamador"""
+        if record.args:
+            record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            exc_type, exc_value = record.exc_info[0], record.exc_info[1]
+            if exc_type is not None:
+                record.exc_type_name = exc_type.__name__
+                record.exc_message = str(exc_value)
+            if not record.exc_text:
+                record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+
+
+_dispatcher: Optional[LogDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> LogDispatcher:
+    """Retorna o dispatcher compartilhado da aplicação"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = LogDispatcher()
+            atexit.register(_dispatcher.stop)
+        return _dispatcher
+
+
+def queue_handlers(
+    handlers: Sequence[logging.Handler], filters: Sequence[logging.Filter] = ()
+) -> QueueingHandler:
+    """
+    Envolve handlers síncronos num QueueingHandler do dispatcher compartilhado.
+
+    Args:
+        handlers: Handlers reais (arquivo, console)
+        filters: Filtros aplicados na thread do chamador, antes de enfileirar
+            (os que têm ``bind(handler)`` recebem o handler criado)
+    """
+    handler = QueueingHandler(get_dispatcher(), handlers)
+    for log_filter in filters:
+        handler.addFilter(log_filter)
+        # Filtros que geram registros próprios (resumos) os entregam aqui
+        bind = getattr(log_filter, "bind", None)
+        if callable(bind):
+            bind(handler)
+    return handler
+
+
+def flush_logging(timeout: float = 5.0) -> bool:
+    """Grava tudo que está na fila (chamado no encerramento da aplicação)"""
+    if _dispatcher is None:
+        return True
+    return _dispatcher.flush(timeout)
@@ -0,0 +1,221 @@
+"""
+Rotação de arquivos de log por tamanho e por dia, com compressão gzip.
+
+O segmento rotacionado é apenas renomeado na thread que grava o log; a
+compressão e a limpeza por retenção rodam numa thread de manutenção, de
+modo que o uso de disco fica limitado a cerca de
+``LOG_FILE_MAX_SIZE * (LOG_FILE_BACKUP_COUNT + 1)`` por arquivo.
+"""
+import gzip
+import logging
+import logging.handlers
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import List, Optional
+
+from ..config import LoggingConfig
+
+_maintenance_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _submit(func, *args) -> None:
+    """Agenda manutenção de logs na thread dedicada"""
+    global _maintenance_executor
+    with _executor_lock:
+        if _maintenance_executor is None:
+            _maintenance_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="log-maintenance"
+            )
+        _maintenance_executor.submit(func, *args)
+
+
+def wait_for_maintenance() -> None:
+    """Espera compressões e limpezas pendentes (testes e encerramento)"""
+    global _maintenance_executor
+    with _executor_lock:
+        executor, _maintenance_executor = _maintenance_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def compress_segment(path: str) -> Optional[str]:
+    """
+    Comprime um segmento rotacionado para ``<path>.gz`` e remove o original.
+
+    Returns:
+        Caminho do arquivo comprimido (None se o segmento não existe)
+    """
+    if not os.path.exists(path):
+        return None
+
+    target = path + ".gz"
+    temp = target + ".tmp"
+    with open(path, "rb") as src, gzip.open(temp, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    # Preserva a data do segmento para a retenção por idade
+    stat = os.stat(path)
+    os.utime(temp, (stat.st_atime, stat.st_mtime))
+    os.replace(temp, target)
+    os.remove(path)
+    return target
+
+
+def list_segments(base_filename: str) -> List[str]:
+    """Segmentos rotacionados de um log, do mais novo para o mais antigo"""
+    directory, name = os.path.split(os.path.abspath(base_filename))
+    if not os.path.isdir(directory):
+        return []
+
+    prefix = name + "."
+    segments = [
+        os.path.join(directory, entry)
+        for entry in os.listdir(directory)
+        if entry.startswith(prefix) and not entry.endswith(".tmp")
+    ]
+    return sorted(segments, key=os.path.getmtime, reverse=True)
+
+
+def list_legacy_files(base_filename: str) -> List[str]:
+    """Arquivos do antigo esquema diário (``app_AAAAMMDD.log``) ao lado do log"""
+    directory, name = os.path.split(os.path.abspath(base_filename))
+    if not os.path.isdir(directory):
+        return []
+
+    stem, ext = os.path.splitext(name)
+    prefix = stem + "_"
+    return sorted(
+        os.path.join(directory, entry)
+        for entry in os.listdir(directory)
+        if entry.startswith(prefix)
+        and entry.endswith(ext)
+        and len(entry) == len(prefix) + 8 + len(ext)
+        and entry[len(prefix) : len(prefix) + 8].isdigit()
+    )
+
+
+def sweep_segments(
+    base_filename: str,
+    backup_count: int = LoggingConfig.LOG_FILE_BACKUP_COUNT,
+    retention_days: int = LoggingConfig.LOG_RETENTION_DAYS,
+) -> int:
+    """
+    Remove segmentos além de ``backup_count`` ou mais velhos que a retenção.
+
+    Arquivos do antigo esquema diário expiram apenas pela retenção.
+
+    Returns:
+        Número de segmentos removidos
+    """
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for index, segment in enumerate(list_segments(base_filename)):
+        try:
+            if index >= backup_count or os.path.getmtime(segment) < cutoff:
+                os.remove(segment)
+                removed += 1
+        except OSError:
+            pass
+    for legacy in list_legacy_files(base_filename):
+        try:
+            if os.path.getmtime(legacy) < cutoff:
+                os.remove(legacy)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _compress_and_sweep(
+    segment: Optional[str], base_filename: str, backup_count: int, retention_days: int
+) -> None:
+    try:
+        if segment is not None:
+            compress_segment(segment)
+        else:
+            # Início: comprime segmentos que ficaram sem compressão (queda)
+            for pending in list_segments(base_filename):
+                if not pending.endswith(".gz"):
+                    compress_segment(pending)
+        sweep_segments(base_filename, backup_count, retention_days)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Erro na manutenção de logs: {e}")
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Handler que rotaciona por tamanho e na virada do dia.
+
+    O segmento vira ``<arquivo>.<AAAAMMDD-HHMMSS>`` e é comprimido em
+    background; segmentos além de ``backup_count`` ou da retenção são apagados.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = LoggingConfig.LOG_FILE_MAX_SIZE,
+        backup_count: int = LoggingConfig.LOG_FILE_BACKUP_COUNT,
+        retention_days: int = LoggingConfig.LOG_RETENTION_DAYS,
+        rotate_daily: bool = LoggingConfig.LOG_ROTATE_DAILY,
+        encoding: str = "utf-8",
+    ):
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True
+        )
+        self.retention_days = retention_days
+        self.rotate_daily = rotate_daily
+        self._day = self._file_day()
+        _submit(_compress_and_sweep, None, self.baseFilename, backup_count, retention_days)
+
+    def _file_day(self) -> date:
+        try:
+            return date.fromtimestamp(os.path.getmtime(self.baseFilename))
+        except OSError:
+            return date.today()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rotate_daily and date.today() != self._day:
+            if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+                return True
+            self._day = date.today()
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        segment = None
+        if os.path.exists(self.baseFilename):
+            segment = self._segment_name()
+            os.replace(self.baseFilename, segment)
+
+        self._day = date.today()
+        if segment is not None:
+            _submit(
+                _compress_and_sweep,
+                segment,
+                self.baseFilename,
+                self.backupCount,
+                self.retention_days,
+            )
+
+    def _segment_name(self) -> str:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        candidate = f"{self.baseFilename}.{stamp}"
+        counter = 1
+        while os.path.exists(candidate) or os.path.exists(candidate + ".gz"):
+            candidate = f"{self.baseFilename}.{stamp}-{counter}"
+            counter += 1
+        return candidate
+
+
+def build_file_handler(filename: str) -> logging.Handler:
+    """Cria o handler de arquivo conforme ``LoggingConfig.LOG_ROTATION``"""
+    if LoggingConfig.LOG_ROTATION:
+        return CompressingRotatingFileHandler(filename)
+    return logging.FileHandler(filename, encoding="utf-8")
@@ -0,0 +1,201 @@
+"""
+Limite de taxa para logs repetitivos.
+
+Registros do mesmo logger e do mesmo template passam até ``burst`` vezes
+por janela; os excedentes são descartados e, ao fim da janela, viram uma
+única linha "N mensagens semelhantes suprimidas". O volume de log e a E/S
+ficam limitados durante incidentes sem perder a contagem dos eventos.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+import weakref
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Set, Tuple
+
+from ..config import LoggingConfig
+from .cache import ExpiringLRU
+
+if TYPE_CHECKING:  # scheduler importa o logger, que usa este módulo
+    from .scheduler import ScheduledTask, Scheduler
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Regra de limite por logger e template de mensagem.
+
+    Attributes:
+        message_prefix: Início da mensagem (template antes da formatação)
+        burst: Registros permitidos por janela
+        window: Duração da janela em segundos
+        logger: Prefixo do nome do logger ("" = qualquer logger)
+    """
+
+    message_prefix: str
+    burst: int
+    window: float
+    logger: str = ""
+
+    def matches(self, name: str, template: str) -> bool:
+        return template.startswith(self.message_prefix) and name.startswith(self.logger)
+
+
+def rules_from_config(
+    limits: Sequence[tuple] = LoggingConfig.LOG_RATE_LIMITS,
+) -> Tuple[RateLimitRule, ...]:
+    """Converte ``LoggingConfig.LOG_RATE_LIMITS`` (prefixo, burst, janela[, logger])"""
+    return tuple(RateLimitRule(*entry) for entry in limits)
+
+
+_filters: "weakref.WeakSet[RateLimitFilter]" = weakref.WeakSet()
+
+
+class _Window:
+    """Contagem de uma chave (logger, template) na janela corrente"""
+
+    __slots__ = ("start", "count", "suppressed", "levelno", "name", "template", "window", "task")
+
+    def __init__(self, start: float, name: str, template: str, window: float):
+        self.start = start
+        self.count = 0
+        self.suppressed = 0
+        self.levelno = logging.NOTSET
+        self.name = name
+        self.template = template
+        self.window = window
+        self.task: Optional["ScheduledTask"] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Filtro que amostra registros repetitivos.
+
+    Registros que casam com uma regra usam o limite dela (e são agrupados
+    pelo prefixo da regra, o que cobre mensagens montadas com f-string).
+    Os demais usam o limite padrão por template exato; ERROR ou acima sem
+    regra explícita nunca são descartados. As linhas de resumo são entregues
+    ao handler ligado por ``bind``.
+
+    Uso:
+        rate_limit = RateLimitFilter()
+        handler = queue_handlers([file_handler], filters=[rate_limit])
+        rate_limit.bind(handler)
+    """
+
+    SUMMARY_ATTR = "suppressed_count"
+
+    def __init__(
+        self,
+        rules: Optional[Sequence[RateLimitRule]] = None,
+        default_burst: Optional[int] = LoggingConfig.LOG_RATE_LIMIT_BURST,
+        default_window: float = LoggingConfig.LOG_RATE_LIMIT_WINDOW,
+        max_keys: int = LoggingConfig.LOG_RATE_LIMIT_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+        scheduler: Optional["Scheduler"] = None,
+    ):
+        super().__init__()
+        self.rules = tuple(rules_from_config() if rules is None else rules)
+        self.default_burst = default_burst
+        self.default_window = default_window
+        self._clock = clock
+        self._scheduler = scheduler
+        self._emit: Optional[Callable[[logging.LogRecord], object]] = None
+        self._lock = threading.Lock()
+        longest = max([default_window] + [rule.window for rule in self.rules])
+        # Chave sobrevive à janela para que o próximo registro emita o resumo
+        self._windows = ExpiringLRU(max_keys, 2 * longest, clock=clock)
+        self._pending: Set[_Window] = set()
+        self.suppressed_total = 0
+        _filters.add(self)
+
+    def bind(self, handler: logging.Handler) -> None:
+        """Define o handler que recebe as linhas de resumo"""
+        self._emit = handler.handle
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.SUMMARY_ATTR in record.__dict__:
+            return True
+
+        template = record.msg if isinstance(record.msg, str) else str(record.msg)
+        name = record.name
+        for rule in self.rules:
+            if rule.matches(name, template):
+                key = (name, rule.message_prefix)
+                burst, window = rule.burst, rule.window
+                break
+        else:
+            if self.default_burst is None or record.levelno >= logging.ERROR:
+                return True
+            key = (name, template)
+            burst, window = self.default_burst, self.default_window
+
+        now = self._clock()
+        expired = None
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state.start >= state.window:
+                expired = state
+                state = _Window(now, name, key[1], window)
+                self._windows.set(key, state)
+
+            state.count += 1
+            allowed = state.count <= burst
+            if not allowed:
+                state.suppressed += 1
+                self.suppressed_total += 1
+                if record.levelno > state.levelno:
+                    state.levelno = record.levelno
+                if state.task is None:
+                    self._pending.add(state)
+                    state.task = self._get_scheduler().call_later(
+                        state.start + window - now, lambda: self._flush_window(state)
+                    )
+
+        if expired is not None:
+            self._flush_window(expired)
+        return allowed
+
+    def flush(self) -> int:
+        """Emite os resumos pendentes (encerramento); retorna quantos"""
+        with self._lock:
+            pending = list(self._pending)
+        return sum(1 for state in pending if self._flush_window(state))
+
+    def _get_scheduler(self) -> "Scheduler":
+        if self._scheduler is None:
+            from .scheduler import get_scheduler
+
+            self._scheduler = get_scheduler()
+        return self._scheduler
+
+    def _flush_window(self, state: _Window) -> bool:
+        with self._lock:
+            suppressed, state.suppressed = state.suppressed, 0
+            self._pending.discard(state)
+            if state.task is not None:
+                state.task.cancel()
+                state.task = None
+        if not suppressed or self._emit is None:
+            return False
+
+        summary = logging.makeLogRecord(
+            {
+                "name": state.name,
+                "levelno": state.levelno,
+                "levelname": logging.getLevelName(state.levelno),
+                "msg": "%d mensagens semelhantes suprimidas em %.0fs: %s",
+                "args": (suppressed, state.window, state.template),
+                self.SUMMARY_ATTR: suppressed,
+            }
+        )
+        try:
+            self._emit(summary)
+        except Exception:
+            return False
+        return True
+
+
+def flush_rate_limits() -> int:
+    """Emite os resumos pendentes de todos os filtros (encerramento)"""
+    return sum(log_filter.flush() for log_filter in list(_filters))
@@ -1,13 +1,18 @@
 """
 Sistema de logging estruturado para toda a aplicação
 """
+
 import logging
 import os
 import sys
-from datetime import datetime
 from typing import Optional, Dict, Any
 from functools import wraps
 
+from .log_buffer import get_ring_buffer
+from .log_queue import queue_handlers
+from .log_sampling import RateLimitFilter
+from .log_rotation import build_file_handler
+
 
 class AppLogger:
     """Sistema de logging centralizado e estruturado"""
@@ -35,9 +40,9 @@ class AppLogger:
 
         # Evitar duplicação de handlers
         if not self._logger.handlers:
-            # Handler para arquivo
-            log_file = os.path.join(log_dir, f'app_{datetime.now().strftime("%Y%m%d")}.log')
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            # Handler para arquivo (rotação diária/por tamanho conforme LoggingConfig)
+            log_file = os.path.join(log_dir, "app.log")
+            file_handler = build_file_handler(log_file)
             file_handler.setLevel(logging.INFO)
 
             # Handler para console (apenas erros críticos)
@@ -53,8 +58,9 @@ class AppLogger:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            self._logger.addHandler(file_handler)
-            self._logger.addHandler(console_handler)
+            # E/S na thread de escrita; o chamador só amostra e enfileira
+            handlers = [file_handler, console_handler, get_ring_buffer()]
+            self._logger.addHandler(queue_handlers(handlers, filters=[RateLimitFilter()]))
 
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Log de debug"""
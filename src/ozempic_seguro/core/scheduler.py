@@ -0,0 +1,185 @@
+"""
+Agendador único de tarefas com prazo (expiração de sessão, bloqueios).
+
+Uma thread daemon atende um heap de prazos. Reagendar uma tarefa para mais
+tarde é O(1): apenas o prazo da tarefa muda e a entrada antiga do heap é
+reaproveitada quando chega sua vez (remoção preguiçosa). Nenhuma thread é
+criada por atividade do usuário.
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from .logger import logger
+
+
+class ScheduledTask:
+    """
+    Handle de uma tarefa agendada.
+
+    Uso:
+        task = get_scheduler().call_later(600, expirar)
+        task.reschedule(600)  # Adia o prazo (O(1))
+        task.cancel()
+    """
+
+    __slots__ = ("_scheduler", "_callback", "deadline", "_entry_deadline", "_entry_seq", "_state")
+
+    _PENDING, _FIRED, _CANCELLED = 0, 1, 2
+
+    def __init__(self, scheduler: "Scheduler", callback: Callable[[], None], deadline: float):
+        self._scheduler = scheduler
+        self._callback = callback
+        self.deadline = deadline
+        self._entry_deadline = deadline
+        self._entry_seq = -1
+        self._state = self._PENDING
+
+    @property
+    def active(self) -> bool:
+        """True enquanto a tarefa não foi executada nem cancelada"""
+        return self._state == self._PENDING
+
+    def remaining(self) -> float:
+        """Segundos até o prazo (0 se já passou ou inativa)"""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.deadline - self._scheduler.clock())
+
+    def reschedule(self, delay: float) -> bool:
+        """
+        Move o prazo para ``delay`` segundos a partir de agora.
+
+        Returns:
+            bool: False se a tarefa já foi executada ou cancelada
+        """
+        return self._scheduler._reschedule(self, delay)
+
+    def cancel(self) -> None:
+        """Cancela a tarefa (a entrada no heap é descartada quando surgir)"""
+        self._scheduler._cancel(self)
+
+
+class Scheduler:
+    """
+    Agendador baseado em heap atendido por uma única thread daemon.
+
+    A thread é criada na primeira tarefa. Callbacks rodam na thread do
+    agendador e devem ser curtos; exceções são logadas e ignoradas.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, name: str = "scheduler"):
+        self.clock = clock
+        self._name = name
+        self._heap: List[Tuple[float, int, ScheduledTask]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = True
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> ScheduledTask:
+        """Agenda ``callback`` para daqui a ``delay`` segundos"""
+        with self._cond:
+            task = ScheduledTask(self, callback, self.clock() + max(0.0, delay))
+            self._push(task)
+            self._ensure_thread()
+            self._cond.notify()
+        return task
+
+    def pending_count(self) -> int:
+        """Número de tarefas ativas"""
+        with self._cond:
+            return len({id(task) for _, _, task in self._heap if task.active})
+
+    def shutdown(self) -> None:
+        """Para a thread e cancela as tarefas pendentes"""
+        with self._cond:
+            self._running = False
+            for _, _, task in self._heap:
+                task._state = ScheduledTask._CANCELLED
+            self._heap.clear()
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _push(self, task: ScheduledTask) -> None:
+        seq = next(self._seq)
+        task._entry_deadline = task.deadline
+        task._entry_seq = seq
+        heapq.heappush(self._heap, (task.deadline, seq, task))
+
+    def _reschedule(self, task: ScheduledTask, delay: float) -> bool:
+        with self._cond:
+            if not task.active:
+                return False
+            task.deadline = self.clock() + max(0.0, delay)
+            # Adiar não mexe no heap; antecipar exige nova entrada
+            if task.deadline < task._entry_deadline:
+                self._push(task)
+                self._cond.notify()
+            return True
+
+    def _cancel(self, task: ScheduledTask) -> None:
+        with self._cond:
+            if task.active:
+                task._state = ScheduledTask._CANCELLED
+
+    def _ensure_thread(self) -> None:
+        if not self._running:
+            self._running = True
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _next_due(self) -> Optional[ScheduledTask]:
+        """Espera e retorna a próxima tarefa vencida (None ao encerrar)"""
+        with self._cond:
+            while self._running:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                entry_deadline, seq, task = self._heap[0]
+                if not task.active or seq != task._entry_seq:
+                    heapq.heappop(self._heap)  # Entrada obsoleta
+                    continue
+                if task.deadline > entry_deadline:
+                    heapq.heappop(self._heap)  # Prazo adiado: reinsere
+                    self._push(task)
+                    continue
+
+                wait = task.deadline - self.clock()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+
+                heapq.heappop(self._heap)
+                task._state = ScheduledTask._FIRED
+                return task
+            return None
+
+    def _run(self) -> None:
+        while True:
+            task = self._next_due()
+            if task is None:
+                return
+            try:
+                task._callback()
+            except Exception as e:
+                logger.error(f"Erro em tarefa agendada: {e}")
+
+
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Retorna o agendador compartilhado da aplicação"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
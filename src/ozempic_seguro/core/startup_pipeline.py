@@ -0,0 +1,201 @@
+"""
+Pipeline de inicialização com dependências entre etapas.
+
+Etapas independentes de E/S (abrir/migrar o banco, decodificar imagens)
+rodam em paralelo em threads de trabalho enquanto a thread do Tk já mostra
+a tela inicial. Etapas marcadas com ``ui=True`` rodam na thread que chama
+``poll()``/``wait()`` (a thread do Tk), sempre depois das dependências.
+
+Uso:
+    pipeline = StartupPipeline()
+    pipeline.add("db", abrir_banco)
+    pipeline.add("audit", configurar_auditoria, depends=("db",))
+    pipeline.start()
+    # Na thread do Tk, a cada ~20 ms: pipeline.poll()
+"""
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .logger import logger
+from .startup_profiler import StartupProfiler, get_profiler
+
+
+class StartupStep:
+    """Etapa do pipeline e seu estado"""
+
+    __slots__ = ("name", "func", "depends", "ui", "state", "result", "error")
+
+    PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+    def __init__(self, name: str, func: Callable[[], Any], depends: Sequence[str], ui: bool):
+        self.name = name
+        self.func = func
+        self.depends = tuple(depends)
+        self.ui = ui
+        self.state = self.PENDING
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class StartupPipeline:
+    """
+    Executa etapas de inicialização respeitando dependências.
+
+    Falha em uma etapa é logada e as etapas que dependem dela não rodam
+    (ficam com estado ``failed``); as demais continuam.
+    """
+
+    def __init__(self, max_workers: int = 4, profiler: Optional[StartupProfiler] = None):
+        self._max_workers = max_workers
+        self._profiler = profiler or get_profiler()
+        self._steps: Dict[str, StartupStep] = {}
+        self._completed: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._started_ns: Optional[int] = None
+        self._finished_ns: Optional[int] = None
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends: Sequence[str] = (),
+        ui: bool = False,
+    ) -> None:
+        """Registra uma etapa (antes de ``start``)"""
+        if name in self._steps:
+            raise ValueError(f"Etapa duplicada: {name}")
+        missing = [dep for dep in depends if dep not in self._steps]
+        if missing:
+            raise ValueError(f"Dependências desconhecidas de {name}: {missing}")
+        self._steps[name] = StartupStep(name, func, depends, ui)
+
+    def start(self) -> None:
+        """Dispara as etapas sem dependências pendentes"""
+        self._started_ns = time.perf_counter_ns()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="startup"
+        )
+        self._dispatch()
+
+    @property
+    def finished(self) -> bool:
+        """True quando nenhuma etapa está pendente ou em execução"""
+        return all(s.state in (StartupStep.DONE, StartupStep.FAILED) for s in self._steps.values())
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        """Duração do start até a última etapa (None se não terminou)"""
+        if self._started_ns is None or self._finished_ns is None:
+            return None
+        return (self._finished_ns - self._started_ns) / 1e6
+
+    def state(self, name: str) -> str:
+        return self._steps[name].state
+
+    def result(self, name: str) -> Any:
+        return self._steps[name].result
+
+    def failures(self) -> Dict[str, BaseException]:
+        """Etapas que falharam (ou foram puladas por dependência) e o erro"""
+        return {
+            s.name: s.error
+            for s in self._steps.values()
+            if s.state == StartupStep.FAILED and s.error is not None
+        }
+
+    def poll(self) -> int:
+        """
+        Processa etapas concluídas e dispara as que ficaram prontas.
+
+        Deve ser chamado na thread do Tk. Returns: etapas restantes.
+        """
+        while True:
+            try:
+                name, result, error = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            self._complete(self._steps[name], result, error)
+        self._dispatch()
+        return self._remaining()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bloqueia até o fim do pipeline (roda etapas de UI na thread atual).
+
+        Returns:
+            bool: False se o prazo venceu antes de terminar
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                item = self._completed.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            self._completed.put(item)
+        return True
+
+    def shutdown(self) -> None:
+        """Libera as threads de trabalho (sem esperar etapas em execução)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _remaining(self) -> int:
+        remaining = sum(
+            1 for s in self._steps.values() if s.state in (StartupStep.PENDING, StartupStep.RUNNING)
+        )
+        if remaining == 0 and self._finished_ns is None:
+            self._finished_ns = time.perf_counter_ns()
+            self.shutdown()
+        return remaining
+
+    def _dispatch(self) -> None:
+        """Dispara etapas prontas; etapas de UI rodam aqui mesmo"""
+        progressed = True
+        while progressed:
+            progressed = False
+            for step in self._steps.values():
+                if step.state != StartupStep.PENDING:
+                    continue
+                deps = [self._steps[dep] for dep in step.depends]
+                failed = [dep.name for dep in deps if dep.state == StartupStep.FAILED]
+                if failed:
+                    step.state = StartupStep.FAILED
+                    step.error = RuntimeError(f"Dependência falhou: {', '.join(failed)}")
+                    progressed = True
+                    continue
+                if any(dep.state != StartupStep.DONE for dep in deps):
+                    continue
+
+                step.state = StartupStep.RUNNING
+                if step.ui or self._executor is None:
+                    result, error = self._run(step)
+                    self._complete(step, result, error)
+                    progressed = True
+                else:
+                    self._executor.submit(self._run_in_worker, step)
+
+    def _run(self, step: StartupStep) -> tuple:
+        with self._profiler.phase(f"startup.{step.name}"):
+            try:
+                return step.func(), None
+            except Exception as e:
+                return None, e
+
+    def _run_in_worker(self, step: StartupStep) -> None:
+        result, error = self._run(step)
+        self._completed.put((step.name, result, error))
+
+    def _complete(self, step: StartupStep, result: Any, error: Optional[BaseException]) -> None:
+        if error is not None:
+            step.state = StartupStep.FAILED
+            step.error = error
+            logger.error(f"Startup step '{step.name}' failed: {error}")
+        else:
+            step.state = StartupStep.DONE
+            step.result = result
@@ -0,0 +1,171 @@
+"""
+Linha do tempo da inicialização (imports, banco, imagens, cada frame).
+
+Desligado por padrão. Ativado pela variável ``OZEMPIC_PROFILE_STARTUP``
+(``1`` ou caminho do arquivo) ou pela opção ``--profile-startup[=caminho]``.
+Ao final grava um trace JSON no formato Trace Event, que abre em
+``chrome://tracing`` ou no Perfetto.
+
+Uso:
+    profiler = get_profiler()
+    with profiler.phase("db.migrations"):
+        executar_migrations()
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+ENV_VAR = "OZEMPIC_PROFILE_STARTUP"
+CLI_FLAG = "--profile-startup"
+
+_NULL_PHASE = nullcontext()
+
+
+class StartupProfiler:
+    """
+    Coleta fases da inicialização como eventos "complete" do Trace Event.
+
+    Desligado, ``phase`` devolve um contexto nulo compartilhado e nada é
+    registrado.
+    """
+
+    def __init__(self, enabled: bool = False, output_path: Optional[str] = None):
+        self.enabled = enabled
+        self.output_path = output_path
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def phase(self, name: str, **args: Any):
+        """Contexto que mede a duração de uma fase"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._measure(name, args)
+
+    @contextmanager
+    def _measure(self, name: str, args: Dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.perf_counter_ns(), **args)
+
+    def add_span(self, name: str, start_ns: int, end_ns: int, **args: Any) -> None:
+        """Registra uma fase já medida (ex.: imports antes do profiler existir)"""
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def mark(self, name: str, **args: Any) -> None:
+        """Registra um instante (ex.: primeiro frame visível)"""
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": "mark",
+            "ph": "i",
+            "s": "g",
+            "ts": time.perf_counter_ns() / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Cópia dos eventos registrados"""
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> List[Tuple[str, float]]:
+        """
+        Fases em ordem cronológica: (nome, ms).
+
+        Para fases é a duração; para instantes, o tempo desde o início da
+        primeira fase.
+        """
+        events = sorted(self.events(), key=lambda e: e["ts"])
+        if not events:
+            return []
+        origin = events[0]["ts"]
+        return [
+            (e["name"], (e["dur"] if e["ph"] == "X" else e["ts"] - origin) / 1000) for e in events
+        ]
+
+    def write(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Grava o trace JSON.
+
+        Returns:
+            Caminho gravado (None se desligado)
+        """
+        if not self.enabled:
+            return None
+        path = path or self.output_path or _default_output_path()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        trace = {
+            "traceEvents": self.events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"app": "ozempic_seguro", "python": sys.version.split()[0]},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        return path
+
+
+def _default_output_path() -> str:
+    """logs/startup-trace-AAAAMMDD-HHMMSS.json na raiz do projeto"""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return os.path.join(root, "logs", f"startup-trace-{stamp}.json")
+
+
+def _resolve_settings(argv: Sequence[str], environ: Dict[str, str]) -> Tuple[bool, Optional[str]]:
+    """Lê a opção de linha de comando ou a variável de ambiente"""
+    for arg in argv:
+        if arg == CLI_FLAG:
+            return True, None
+        if arg.startswith(CLI_FLAG + "="):
+            return True, arg.split("=", 1)[1] or None
+
+    value = environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return False, None
+    if value.lower() in ("1", "true", "yes"):
+        return True, None
+    return True, value
+
+
+_profiler: Optional[StartupProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> StartupProfiler:
+    """Retorna o profiler da inicialização (configurado no primeiro uso)"""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            enabled, path = _resolve_settings(sys.argv[1:], dict(os.environ))
+            _profiler = StartupProfiler(enabled, path)
+        return _profiler
@@ -2,23 +2,105 @@
 Sistema de logging estruturado para melhor observabilidade.
 Usa formato JSON para facilitar análise e monitoramento.
 """
+
 import json
 import logging
+import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional
 import traceback
-from functools import wraps
+from functools import lru_cache, wraps
+
+from .log_buffer import get_ring_buffer
+from .log_queue import queue_handlers
+from .log_rotation import build_file_handler
+from .log_sampling import RateLimitFilter
+
+
+try:  # Serialização rápida opcional
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+# Atributos do LogRecord que não vão para "extra"
+_RESERVED_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "taskName",
+        "exc_info",
+        "exc_text",
+        "exc_type_name",
+        "exc_message",
+        "stack_info",
+        # Promovidos para o nível superior do JSON
+        "user_id",
+        "action",
+        "ip_address",
+    }
+)
+_STANDARD_ATTR_COUNT = len(vars(logging.makeLogRecord({})))
+
+
+def _dumps_stdlib(data: Dict) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _dumps_orjson(data: Dict) -> str:
+    try:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except (TypeError, orjson.JSONEncodeError):
+        return _dumps_stdlib(data)  # Ex.: inteiros acima de 64 bits
 
 
 class StructuredFormatter(logging.Formatter):
-    """Formatter que produz logs em formato JSON estruturado"""
+    """
+    Formatter que produz logs em formato JSON estruturado.
+
+    O timestamp vem de ``record.created`` (hora do evento, não da escrita),
+    com a parte até os segundos em cache. Usa orjson quando instalado.
+    """
+
+    def __init__(self, *args, use_orjson: Optional[bool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if use_orjson is None:
+            use_orjson = orjson is not None
+        self._dumps = _dumps_orjson if use_orjson and orjson is not None else _dumps_stdlib
+        self._ts_cache = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO 8601 em UTC; prefixo até os segundos reaproveitado"""
+        second = int(created)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._ts_cache = (second, prefix)
+        micros = int((created - second) * 1_000_000)
+        return f"{prefix}.{micros:06d}+00:00"
 
     def format(self, record: logging.LogRecord) -> str:
         """Formata log record como JSON"""
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -27,14 +109,16 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
+        attrs = record.__dict__
+
         # Adiciona contexto extra se disponível
-        if hasattr(record, "user_id"):
+        if "user_id" in attrs:
             log_data["user_id"] = record.user_id
 
-        if hasattr(record, "action"):
+        if "action" in attrs:
             log_data["action"] = record.action
 
-        if hasattr(record, "ip_address"):
+        if "ip_address" in attrs:
             log_data["ip_address"] = record.ip_address
 
         # Adiciona stack trace se for erro
@@ -44,41 +128,21 @@ class StructuredFormatter(logging.Formatter):
                 "message": str(record.exc_info[1]),
                 "traceback": traceback.format_exception(*record.exc_info),
             }
+        elif record.exc_text:
+            # Exceção já formatada antes da fila de logging (QueueingHandler)
+            log_data["exception"] = {
+                "type": attrs.get("exc_type_name"),
+                "message": attrs.get("exc_message"),
+                "traceback": record.exc_text.splitlines(keepends=True),
+            }
 
-        # Adiciona campos extras genéricos
-        extra_fields = {
-            k: v
-            for k, v in record.__dict__.items()
-            if k
-            not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]
-        }
-
-        if extra_fields:
-            log_data["extra"] = extra_fields
+        # Adiciona campos extras genéricos (só existem além dos atributos padrão)
+        if len(attrs) > _STANDARD_ATTR_COUNT:
+            extra_fields = {k: v for k, v in attrs.items() if k not in _RESERVED_ATTRS}
+            if extra_fields:
+                log_data["extra"] = extra_fields
 
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return self._dumps(log_data)
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -96,38 +160,78 @@ class SensitiveDataFilter(logging.Filter):
         "cpf",
     ]
 
+    # Compilados uma vez: mascaram todos os campos numa só passada. A versão
+    # sem IGNORECASE roda sobre o texto minúsculo (bem mais rápida no re)
+    _MASK_PATTERN = (
+        rf"({'|'.join(map(re.escape, SENSITIVE_FIELDS))})\s*[:=]\s*"
+        rf"(?:\"[^\"]+\"|'[^']+'|[^\s,;]+)"
+    )
+    _MASK = re.compile(_MASK_PATTERN)
+    _MASK_ANYCASE = re.compile(_MASK_PATTERN, re.IGNORECASE)
+
+    # Atributos padrão do LogRecord nunca são sensíveis; extras ficam em cache
+    _STANDARD_ATTRS = frozenset(vars(logging.makeLogRecord({})))
+    _attr_cache: Dict[str, bool] = {}
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filtra dados sensíveis do log record"""
-        # Mascara mensagem se contém dados sensíveis
-        message_lower = record.getMessage().lower()
+        if isinstance(record.msg, str):
+            # Mensagem já resolvida: valores sensíveis podem vir nos argumentos
+            text = record.getMessage() if record.args else record.msg
+            if self._has_sensitive(text):
+                record.msg = self._mask_all(text)
+                record.args = None
+
+        # Mascara campos extras (só existem se o record tem atributos além dos padrão)
+        attrs = record.__dict__
+        if len(attrs) > len(self._STANDARD_ATTRS):
+            cache = self._attr_cache
+            for attr_name in attrs.keys() - self._STANDARD_ATTRS:
+                sensitive = cache.get(attr_name)
+                if sensitive is None:
+                    sensitive = self._has_sensitive(attr_name)
+                    cache[attr_name] = sensitive
+                if sensitive:
+                    setattr(record, attr_name, "***REDACTED***")
 
-        for field in self.SENSITIVE_FIELDS:
-            if field in message_lower:
-                # Substitui valores sensíveis por asteriscos
-                record.msg = self._mask_sensitive_data(record.msg, field)
+        return True
 
-        # Mascara campos extras
-        for attr_name in dir(record):
-            if any(field in attr_name.lower() for field in self.SENSITIVE_FIELDS):
-                setattr(record, attr_name, "***REDACTED***")
+    @classmethod
+    def _has_sensitive(cls, text: str) -> bool:
+        """Pré-varredura: algum campo sensível aparece no texto?"""
+        lowered = text.lower()
+        return any(field in lowered for field in cls.SENSITIVE_FIELDS)
 
-        return True
+    @classmethod
+    def _mask_all(cls, text: str) -> str:
+        """Mascara todos os campos sensíveis de uma vez"""
+        if not text.isascii():
+            # lower() pode mudar o tamanho de texto não ASCII
+            return cls._MASK_ANYCASE.sub(lambda m: f"{m.group(1).lower()}=***REDACTED***", text)
+
+        # Em ASCII as posições do texto minúsculo valem para o original
+        parts = []
+        pos = 0
+        for match in cls._MASK.finditer(text.lower()):
+            parts.append(text[pos : match.start()])
+            parts.append(f"{match.group(1)}=***REDACTED***")
+            pos = match.end()
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)
 
     def _mask_sensitive_data(self, text: str, field: str) -> str:
         """Mascara dados sensíveis em texto"""
-        import re
-
-        # Padrões para encontrar valores após o campo
-        patterns = [
-            rf'{field}\s*[:=]\s*"([^"]+)"',  # field: "value" ou field="value"
-            rf"{field}\s*[:=]\s*\'([^\']+)\'",  # field: 'value' ou field='value'
-            rf"{field}\s*[:=]\s*([^\s,;]+)",  # field: value ou field=value
-        ]
+        return _field_pattern(field).sub(f"{field}=***REDACTED***", text)
 
-        for pattern in patterns:
-            text = re.sub(pattern, f"{field}=***REDACTED***", text, flags=re.IGNORECASE)
 
-        return text
+@lru_cache(maxsize=None)
+def _field_pattern(field: str) -> "re.Pattern[str]":
+    """Padrão compilado de um campo (valor entre aspas ou até separador)"""
+    return re.compile(
+        rf"{re.escape(field)}\s*[:=]\s*(?:\"[^\"]+\"|'[^']+'|[^\s,;]+)", re.IGNORECASE
+    )
 
 
 class StructuredLogger:
@@ -163,18 +267,24 @@ class StructuredLogger:
         # Console handler com formato estruturado
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(StructuredFormatter())
-        console_handler.addFilter(SensitiveDataFilter())
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # File handler se especificado
         if log_file:
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler = build_file_handler(log_file)
             file_handler.setFormatter(StructuredFormatter())
-            file_handler.addFilter(SensitiveDataFilter())
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        # Registros recentes em memória para a tela de diagnóstico
+        handlers.append(get_ring_buffer())
+
+        # Amostragem e mascaramento antes de enfileirar; JSON e E/S na thread de escrita
+        logger.addHandler(
+            queue_handlers(handlers, filters=[RateLimitFilter(), SensitiveDataFilter()])
+        )
 
         cls._loggers[name] = logger
         return logger
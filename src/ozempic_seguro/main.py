@@ -3,15 +3,37 @@ Módulo principal da aplicação Ozempic Seguro.
 
 Inicializa a interface gráfica e configura os componentes do sistema.
 """
-import customtkinter
-from .controllers.navigation_controller import NavigationController
-from .core.logger import logger
+import time
+
+_IMPORTS_START_NS = time.perf_counter_ns()  # Início da fase de imports (profiler)
+
+import customtkinter  # noqa: E402
+from .controllers.navigation_controller import NavigationController  # noqa: E402
+from .core.logger import logger  # noqa: E402
+from .core.startup_pipeline import StartupPipeline  # noqa: E402
+from .core.startup_profiler import get_profiler  # noqa: E402
+
+get_profiler().add_span("imports", _IMPORTS_START_NS, time.perf_counter_ns())
+
+
+def _open_database() -> None:
+    """Abre o banco, aplica migrations e o bootstrap (usuários padrão)"""
+    from .repositories.connection import DatabaseConnection
+
+    DatabaseConnection.get_instance()
 
 
 def _preload_images() -> None:
-    """Pré-carrega imagens para acelerar a renderização das telas"""
+    """Pré-carrega (decodifica) imagens para acelerar a renderização das telas"""
     from .views.components.common import ImageCache
     from .views.components.gavetas import _GavetaImageCache
+    from .views.components.image_atlas import get_atlas
+    from .views.pages_iniciais.tela_logo_view import _get_logo_image
+
+    # Confere o atlas contra as imagens de origem antes de a interface usá-lo
+    atlas = get_atlas()
+    if atlas is not None:
+        atlas.verify_sources()
 
     # Pré-carregar imagens do header
     ImageCache.get_logo()
@@ -21,13 +43,30 @@ def _preload_images() -> None:
     _GavetaImageCache.get_gaveta_aberta()
     _GavetaImageCache.get_gaveta_fechada()
 
+    # Tela de logo é criada só na primeira alternância
+    _get_logo_image()
+
+
+def _calibrate_bcrypt() -> None:
+    """
+    Calibra o custo do bcrypt em background para não atrasar a abertura.
+
+    Chamada só no fim do pipeline de inicialização: medida junto com os
+    workers de banco e de imagens, a calibração sairia inflada e escolheria
+    rounds baixos demais para os hashes gravados depois.
+    """
+    import threading
+    from .repositories.security import configure_bcrypt_rounds
+
+    threading.Thread(target=configure_bcrypt_rounds, name="bcrypt-calibration", daemon=True).start()
+
 
 def _setup_audit_callback() -> None:
     """Configura callback de auditoria para SessionManager (evita import circular)"""
     from .session.session_manager import SessionManager
-    from .services.audit_service import AuditService
+    from .services.service_factory import ServiceFactory
 
-    audit_service = AuditService()
+    audit_service = ServiceFactory.get_audit_service()
 
     def audit_callback(user_id: int, acao: str, tabela: str, dados: dict) -> None:
         audit_service.create_log(
@@ -37,19 +76,36 @@ def _setup_audit_callback() -> None:
     SessionManager.set_audit_callback(audit_callback)
 
 
+def _setup_state_journal() -> None:
+    """Restaura bloqueios persistidos e passa a gravá-los a cada mudança"""
+    from .session.session_manager import SessionManager
+    from .services.service_factory import ServiceFactory
+
+    SessionManager.get_instance().attach_state_journal(
+        ServiceFactory.get_state_journal_repository()
+    )
+
+
 class MainApp(customtkinter.CTk):
+    STARTUP_POLL_MS = 20
+
     def __init__(self):
-        super().__init__()
+        profiler = get_profiler()
+        with profiler.phase("tk.init"):
+            super().__init__()
         from .config import UIConfig, AppConfig
 
-        # Esconder janela durante inicialização
+        # Esconder janela até a tela de toque estar montada
         self.withdraw()
 
-        # Pré-carregar imagens para acelerar renderização
-        _preload_images()
-
-        # Configura callback de auditoria primeiro
-        _setup_audit_callback()
+        # Etapas de E/S em paralelo enquanto a tela de toque aparece
+        self.startup = StartupPipeline(profiler=profiler)
+        self.startup.add("db", _open_database)
+        self.startup.add("images", _preload_images)
+        # Callbacks do SessionManager ficam na thread do Tk, após o banco
+        self.startup.add("audit", _setup_audit_callback, depends=("db",), ui=True)
+        self.startup.add("state_journal", _setup_state_journal, depends=("db",), ui=True)
+        self.startup.start()
 
         self.title(AppConfig.APP_NAME)
         self.geometry(f"{UIConfig.WINDOW_WIDTH}x{UIConfig.WINDOW_HEIGHT}")
@@ -61,23 +117,65 @@ class MainApp(customtkinter.CTk):
         self.container = customtkinter.CTkFrame(self)
         self.container.pack(fill="both", expand=True)
 
-        # Controlador de navegação - inicialização direta
-        self.nav_controller = NavigationController(self)
-        self.nav_controller.preload_frames()
-        self.nav_controller.show_tela_toque()
-
-        # Forçar renderização completa antes de mostrar
-        self.update_idletasks()
-        self.update()
+        # Só a tela de toque é montada agora; as demais na primeira navegação
+        with profiler.phase("frames.first"):
+            self.nav_controller = NavigationController(self)
+            self.nav_controller.show_tela_toque()
+            self.update_idletasks()
 
-        # Mostrar janela após tudo estar pronto
         self.deiconify()
+        profiler.mark("window.deiconify")
+        if profiler.enabled:
+            self.after_idle(lambda: profiler.mark("first_frame"))
 
+        self.after(self.STARTUP_POLL_MS, self._poll_startup)
         self.nav_controller.start_alternancia()
 
         # Configurar encerramento adequado da aplicação
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _poll_startup(self):
+        """Avança o pipeline de inicialização na thread do Tk"""
+        if self.startup.poll():
+            self.after(self.STARTUP_POLL_MS, self._poll_startup)
+        else:
+            self._on_startup_complete()
+
+    def wait_startup(self, timeout: float = 30.0) -> bool:
+        """Bloqueia até o fim da inicialização (antes de telas que usam o banco)"""
+        if self.startup.finished:
+            return True
+        return self.startup.wait(timeout)
+
+    def _on_startup_complete(self):
+        """Registra o tempo até a aplicação ficar interativa"""
+        profiler = get_profiler()
+        profiler.mark("interactive")
+        tti_ms = (time.perf_counter_ns() - _IMPORTS_START_NS) / 1e6
+        failures = self.startup.failures()
+        if failures:
+            logger.error(f"Startup finished with failures: {', '.join(failures)}")
+        logger.info(
+            f"Startup interactive in {tti_ms:.0f} ms "
+            f"(pipeline {self.startup.elapsed_ms or 0:.0f} ms)"
+        )
+        if profiler.enabled:
+            self._finish_startup_profile()
+
+        # Ajusta custo do bcrypt ao hardware, já sem disputar CPU com o pipeline
+        _calibrate_bcrypt()
+
+    def _finish_startup_profile(self):
+        """Grava o trace da inicialização"""
+        profiler = get_profiler()
+        try:
+            path = profiler.write()
+        except OSError as e:
+            logger.error(f"Erro ao gravar trace de inicialização: {e}")
+            return
+        fases = ", ".join(f"{nome}={ms:.1f}ms" for nome, ms in profiler.summary())
+        logger.info(f"Startup trace written to {path}: {fases}")
+
     def on_closing(self):
         """Encerra a aplicação de forma adequada, limpando todos os recursos"""
         try:
@@ -91,6 +189,26 @@ class MainApp(customtkinter.CTk):
             session = SessionManager.get_instance()
             session.cleanup()
 
+            # Interromper manutenção e arquivamento do banco em andamento
+            from .repositories.audit_archive import shutdown_audit_archive
+            from .repositories.maintenance import shutdown_maintenance
+
+            shutdown_maintenance()
+            shutdown_audit_archive()
+
+            # Backup em andamento é interrompido; o parcial é descartado
+            from .services.service_factory import ServiceFactory
+
+            if ServiceFactory.get_service_status().get("backup_service"):
+                ServiceFactory.get_backup_service().shutdown()
+
+            # Gravar logs ainda na fila antes de sair
+            from .core.log_queue import flush_logging
+            from .core.log_sampling import flush_rate_limits
+
+            flush_rate_limits()
+            flush_logging()
+
             # Destruir janela principal
             self.destroy()
 
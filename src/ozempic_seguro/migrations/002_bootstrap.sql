@@ -0,0 +1,6 @@
+-- Migração 002: Controle de etapas de bootstrap executadas uma única vez
+
+CREATE TABLE IF NOT EXISTS bootstrap (
+    step TEXT PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
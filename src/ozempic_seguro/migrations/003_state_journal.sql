@@ -0,0 +1,7 @@
+-- Migração 003: Diário de estado de bloqueios (sobrevive a reinícios)
+
+CREATE TABLE IF NOT EXISTS state_journal (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -7,6 +7,7 @@ from .connection import DatabaseConnection
 from .user_repository import UserRepository
 from .audit_repository import AuditRepository
 from .gaveta_repository import GavetaRepository
+from .state_journal_repository import StateJournalRepository
 from .security import hash_password, verify_password
 
 __all__ = [
@@ -16,6 +17,7 @@ __all__ = [
     "UserRepository",
     "AuditRepository",
     "GavetaRepository",
+    "StateJournalRepository",
     # Segurança
     "hash_password",
     "verify_password",
@@ -0,0 +1,421 @@
+"""
+Arquivamento da auditoria em segmentos mensais.
+
+Linhas de ``auditoria`` mais velhas que ``AUDIT_ARCHIVE_AFTER_DAYS`` saem do
+banco principal, um mês inteiro por vez, para ``auditoria-AAAA-MM.db`` em
+``AUDIT_ARCHIVE_DIR`` (ao lado do banco). Cada segmento é um banco SQLite
+compactado: ``dados_anteriores``/``dados_novos`` ficam em zlib e o arquivo
+passa por VACUUM antes de virar somente leitura.
+
+Os segmentos continuam consultáveis: ``AuditRepository`` abre uma conexão
+somente leitura e de vida curta ao banco e anexa nela (``mode=ro&immutable=1``)
+só os meses que o período pedido alcança, de modo que consultas do dia a dia
+e o backup não carregam o histórico antigo. A conexão compartilhada de
+``DatabaseConnection`` nunca recebe ``ATTACH``.
+
+O job roda numa thread dedicada, com conexão própria, e apaga as linhas já
+gravadas no segmento em lotes curtos, sem segurar o banco para as gavetas;
+meses em partição (``audit_partitions``) saem com um único DROP TABLE.
+
+Uso:
+    get_audit_archive().maybe_archive()  # telas iniciais ociosas
+"""
+import os
+import re
+import shutil
+import sqlite3
+import stat
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.request import pathname2url
+
+from .audit_partitions import drop_partition, layout_changed, partition_months, partition_table
+from .connection import DatabaseConnection
+from ..config import Config
+from ..core.logger import logger
+
+SEGMENT_PREFIX = "auditoria-"
+SEGMENT_SUFFIX = ".db"
+_PARTIAL_SUFFIX = ".part"
+_MONTH = re.compile(r"^\d{4}-\d{2}$")
+
+AUDIT_COLUMNS = (
+    "id",
+    "usuario_id",
+    "acao",
+    "tabela_afetada",
+    "id_afetado",
+    "dados_anteriores",
+    "dados_novos",
+    "data_hora",
+    "endereco_ip",
+)
+_PAYLOAD_INDEXES = (AUDIT_COLUMNS.index("dados_anteriores"), AUDIT_COLUMNS.index("dados_novos"))
+
+_SEGMENT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS auditoria (
+    id INTEGER PRIMARY KEY,
+    usuario_id INTEGER,
+    acao TEXT NOT NULL,
+    tabela_afetada TEXT NOT NULL,
+    id_afetado INTEGER,
+    dados_anteriores BLOB,
+    dados_novos BLOB,
+    data_hora TIMESTAMP,
+    endereco_ip TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_auditoria_data_hora ON auditoria (data_hora);
+"""
+
+
+def archive_dir_for(db_path: str) -> str:
+    """Diretório dos segmentos do banco ``db_path``"""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(db_path)), Config.Database.AUDIT_ARCHIVE_DIR
+    )
+
+
+def next_month(month: str) -> str:
+    """'2024-12' -> '2025-01'"""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+def segment_months(archive_dir: str) -> List[str]:
+    """Meses arquivados (AAAA-MM), em ordem"""
+    try:
+        names = os.listdir(archive_dir)
+    except OSError:
+        return []
+    months = []
+    for filename in names:
+        if filename.startswith(SEGMENT_PREFIX) and filename.endswith(SEGMENT_SUFFIX):
+            month = filename[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+            if _MONTH.match(month):
+                months.append(month)
+    return sorted(months)
+
+
+def months_in_range(
+    months: Sequence[str], data_inicio: Optional[str], data_fim: Optional[str]
+) -> List[str]:
+    """
+    Meses que o período (YYYY-MM-DD, extremos opcionais) alcança.
+
+    Extremo vazio ("" dos campos de data limpos) vale como ausente, igual a
+    ``_filter_clause`` do repositório.
+    """
+    return [
+        month
+        for month in months
+        if (not data_inicio or month >= data_inicio[:7])
+        and (not data_fim or month <= data_fim[:7])
+    ]
+
+
+def segment_path(archive_dir: str, month: str) -> str:
+    """Arquivo do segmento do mês"""
+    return os.path.join(archive_dir, f"{SEGMENT_PREFIX}{month}{SEGMENT_SUFFIX}")
+
+
+def segment_uri(path: str) -> str:
+    """URI somente leitura para ATTACH (o segmento nunca muda depois de gravado)"""
+    return f"file:{pathname2url(os.path.abspath(path))}?mode=ro&immutable=1"
+
+
+@contextmanager
+def attached_segment(db_path: str, path: str, schema: str) -> Iterator[sqlite3.Connection]:
+    """
+    Conexão somente leitura ao banco com o segmento anexado como ``schema``.
+
+    A conexão é própria e fechada ao fim do bloco: o ATTACH não altera a
+    conexão compartilhada, então a thread do Tk e os workers do
+    BackgroundLoader não disputam o alias nem herdam um DETACH que falhou.
+    ``schema`` deve ser um identificador fixo.
+    """
+    conn = sqlite3.connect(
+        f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro",
+        uri=True,
+        timeout=Config.Database.DB_TIMEOUT,
+    )
+    try:
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (segment_uri(path),))
+        yield conn
+    finally:
+        conn.close()
+
+
+def compress_payload(value: Optional[str]) -> Union[bytes, str, None]:
+    """JSON em zlib quando compensa; textos curtos ficam como estão"""
+    if not value:
+        return value
+    packed = zlib.compress(value.encode("utf-8"), 9)
+    return packed if len(packed) < len(value) else value
+
+
+def decompress_payload(value: Union[bytes, str, None]) -> Optional[str]:
+    """Inverso de ``compress_payload``"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+class AuditArchive:
+    """
+    Move meses antigos da auditoria para segmentos compactados.
+
+    Um mês só é arquivado inteiro e depois de fechado; as linhas só saem do
+    banco principal depois que o segmento foi gravado e conferido. Se o job
+    cair no meio, a próxima rodada refaz o mês sem duplicar linhas.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        archive_dir: Optional[str] = None,
+        enabled: bool = Config.Database.AUDIT_ARCHIVE_ENABLED,
+        after_days: int = Config.Database.AUDIT_ARCHIVE_AFTER_DAYS,
+        batch_size: int = Config.Database.AUDIT_ARCHIVE_BATCH,
+        interval_hours: float = Config.Database.AUDIT_ARCHIVE_INTERVAL_HOURS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.db_path = db_path
+        self.archive_dir = archive_dir or archive_dir_for(db_path)
+        self.enabled = enabled
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self.interval_hours = interval_hours
+        self._clock = clock
+        self._last_run: Optional[float] = None
+        self._abort = threading.Event()
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def cutoff_month(self, now: Optional[datetime] = None) -> str:
+        """Primeiro mês que fica no banco principal (AAAA-MM)"""
+        # data_hora é gravado por CURRENT_TIMESTAMP, em UTC
+        now = now or datetime.now(timezone.utc)
+        return (now - timedelta(days=self.after_days)).strftime("%Y-%m")
+
+    def archivable_months(
+        self, conn: sqlite3.Connection, now: Optional[datetime] = None
+    ) -> List[str]:
+        """Meses com linhas no banco principal (tabela única ou partição) anteriores ao corte"""
+        cutoff = self.cutoff_month(now)
+        rows = conn.execute(
+            "SELECT DISTINCT substr(data_hora, 1, 7) FROM auditoria WHERE data_hora < ?",
+            (cutoff,),
+        ).fetchall()
+        months = {row[0] for row in rows if row[0] and _MONTH.match(row[0])}
+        months.update(month for month in partition_months(conn) if month < cutoff)
+        return sorted(months)
+
+    def archive(self, now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """
+        Arquiva todos os meses vencidos na thread atual.
+
+        Returns:
+            (mês, linhas arquivadas) de cada mês processado
+        """
+        os.makedirs(self.archive_dir, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=Config.Database.DB_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        results = []
+        try:
+            for month in self.archivable_months(conn, now):
+                if self._abort.is_set():
+                    break
+                rows = self.archive_month(conn, month)
+                results.append((month, rows))
+                logger.info(f"Audit month {month} archived: {rows} rows")
+        finally:
+            conn.close()
+        return results
+
+    def archive_month(self, conn: sqlite3.Connection, month: str) -> int:
+        """Grava o mês no segmento e apaga as linhas do banco principal"""
+        path = segment_path(self.archive_dir, month)
+        partial = path + _PARTIAL_SUFFIX
+        _remove(partial)
+        if os.path.exists(path):
+            # Linhas que chegaram depois (relógio ajustado): regrava o segmento completo
+            shutil.copyfile(path, partial)
+            os.chmod(partial, stat.S_IREAD | stat.S_IWRITE)
+
+        partitioned = month in partition_months(conn)
+        ids: List[int] = []
+        legacy_ids: List[int] = []
+        try:
+            self._write_segment(conn, partial, month, partitioned, ids, legacy_ids)
+            if not ids:
+                return 0
+            os.chmod(partial, stat.S_IREAD)
+            if os.path.exists(path):
+                os.chmod(path, stat.S_IREAD | stat.S_IWRITE)  # Windows não substitui read-only
+            os.replace(partial, path)
+            layout_changed()
+        finally:
+            _remove(partial)
+
+        # Segmento gravado e conferido: só agora as linhas saem do banco principal
+        for start in range(0, len(legacy_ids), self.batch_size):
+            batch = legacy_ids[start : start + self.batch_size]
+            conn.execute(f"DELETE FROM auditoria WHERE id IN ({','.join('?' * len(batch))})", batch)
+        if partitioned:
+            # Partição inteira sai num DROP TABLE, sem DELETE linha a linha
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                drop_partition(conn, month)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                layout_changed()  # Depois do COMMIT: leitores não guardam a partição removida
+        return len(ids)
+
+    def maybe_archive(self) -> bool:
+        """
+        Agenda o arquivamento em segundo plano se o intervalo passou.
+
+        Returns:
+            bool: True se uma rodada foi agendada
+        """
+        with self._lock:
+            if not self.enabled or self._closed:
+                return False
+            if self._future is not None and not self._future.done():
+                return False
+            now = self._clock()
+            if self._last_run is not None and now - self._last_run < self.interval_hours * 3600:
+                return False
+            self._last_run = now
+            self._abort.clear()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="audit-archive"
+                )
+            self._future = self._executor.submit(self._archive_logged)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> List[Tuple[str, int]]:
+        """Espera a rodada agendada (testes); retorna seus resultados"""
+        future = self._future
+        return future.result(timeout) if future is not None else []
+
+    def shutdown(self) -> None:
+        """Para depois do mês em andamento (fechamento da aplicação)"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        self._abort.set()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _archive_logged(self) -> List[Tuple[str, int]]:
+        try:
+            return self.archive()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Audit archival failed: {e}")
+            return []
+
+    def _write_segment(
+        self,
+        conn: sqlite3.Connection,
+        partial: str,
+        month: str,
+        partitioned: bool,
+        ids: List[int],
+        legacy_ids: List[int],
+    ) -> None:
+        columns = ", ".join(AUDIT_COLUMNS)
+        sources = [
+            (
+                f"SELECT {columns} FROM auditoria WHERE data_hora >= ? AND data_hora < ?",
+                (month, next_month(month)),
+                legacy_ids,
+            )
+        ]
+        if partitioned:
+            sources.append((f"SELECT {columns} FROM {partition_table(month)}", (), None))
+        insert = (
+            f"INSERT OR IGNORE INTO auditoria ({columns}) "
+            f"VALUES ({', '.join('?' * len(AUDIT_COLUMNS))})"
+        )
+
+        seg = sqlite3.connect(partial)
+        try:
+            seg.executescript(_SEGMENT_SCHEMA)
+            for query, params, source_ids in sources:
+                cursor = conn.execute(query + " ORDER BY id", params)
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    seg.executemany(insert, [_compress_row(row) for row in rows])
+                    ids.extend(row[0] for row in rows)
+                    if source_ids is not None:
+                        source_ids.extend(row[0] for row in rows)
+            seg.commit()
+            self._verify(seg, ids)
+            seg.execute("VACUUM")
+        finally:
+            seg.close()
+
+    def _verify(self, seg: sqlite3.Connection, ids: List[int]) -> None:
+        (status,) = seg.execute("PRAGMA integrity_check").fetchone()
+        if status != "ok":
+            raise sqlite3.DatabaseError(f"integrity_check: {status}")
+        for start in range(0, len(ids), self.batch_size):
+            batch = ids[start : start + self.batch_size]
+            (found,) = seg.execute(
+                f"SELECT COUNT(*) FROM auditoria WHERE id IN ({','.join('?' * len(batch))})",
+                batch,
+            ).fetchone()
+            if found != len(batch):
+                raise sqlite3.DatabaseError(f"segmento com {len(batch) - found} linhas faltando")
+
+
+def _compress_row(row: Sequence) -> List:
+    values = list(row)
+    for index in _PAYLOAD_INDEXES:
+        values[index] = compress_payload(values[index])
+    return values
+
+
+def _remove(path: str) -> None:
+    with suppress(OSError):
+        os.remove(path)
+
+
+_archive: Optional[AuditArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_audit_archive() -> AuditArchive:
+    """Arquivamento da auditoria do banco da aplicação"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = AuditArchive(DatabaseConnection.get_instance().db_path)
+        return _archive
+
+
+def shutdown_audit_archive() -> None:
+    """Encerra o arquivamento (fechamento da aplicação)"""
+    global _archive
+    with _archive_lock:
+        archive, _archive = _archive, None
+    if archive is not None:
+        archive.shutdown()
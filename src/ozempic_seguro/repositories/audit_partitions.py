@@ -0,0 +1,146 @@
+"""
+Particionamento mensal da auditoria.
+
+Com ``DatabaseConfig.AUDIT_PARTITIONED`` ligado, cada registro novo vai para
+a tabela do seu mês, ``auditoria_AAAA_MM`` (mesmo esquema de ``auditoria``,
+com índice em ``data_hora``). ``AuditRepository`` consulta só as partições
+que o período pedido alcança, além da ``auditoria`` original, que continua
+valendo para registros anteriores ao particionamento.
+
+Os ids seguem únicos entre partições: a sequência de cada partição começa
+em ``AAAAMM * PARTITION_ID_BASE``, de modo que o id já indica o mês (e
+``find_by_id`` vai direto à partição). Apagar ou arquivar um mês é um
+``DROP TABLE``, sem DELETE linha a linha.
+"""
+import re
+import threading
+from typing import Any, List, Optional
+
+from ..core.logger import logger
+
+PARTITION_PREFIX = "auditoria_"
+PARTITION_ID_BASE = 10**9  # Ids por mês; o prefixo AAAAMM identifica a partição
+_TABLE = re.compile(r"^auditoria_(\d{4})_(\d{2})$")
+_MONTH = re.compile(r"^\d{4}-\d{2}$")
+
+# Versão do layout da auditoria (partições e segmentos arquivados): quem muda
+# o layout chama ``layout_changed`` e os leitores recarregam suas listas
+_layout_version = 0
+_layout_lock = threading.Lock()
+
+_COLUMNS = (
+    "usuario_id, acao, tabela_afetada, id_afetado, dados_anteriores, dados_novos, "
+    "data_hora, endereco_ip"
+)
+
+
+def partition_table(month: str) -> str:
+    """'2025-10' -> 'auditoria_2025_10'"""
+    if not _MONTH.match(month):
+        raise ValueError(f"Mês inválido: {month}")
+    return PARTITION_PREFIX + month.replace("-", "_")
+
+
+def partition_month(table: str) -> Optional[str]:
+    """'auditoria_2025_10' -> '2025-10' (None se não for partição)"""
+    match = _TABLE.match(table)
+    return f"{match.group(1)}-{match.group(2)}" if match else None
+
+
+def month_for_id(entity_id: int) -> Optional[str]:
+    """Mês da partição dona do id (None para ids da tabela original)"""
+    if entity_id < PARTITION_ID_BASE:
+        return None
+    prefix = str(entity_id // PARTITION_ID_BASE)
+    return f"{prefix[:4]}-{prefix[4:6]}" if len(prefix) == 6 else None
+
+
+def layout_changed() -> None:
+    """Invalida as listas de partições e segmentos em cache"""
+    global _layout_version
+    with _layout_lock:
+        _layout_version += 1
+
+
+def layout_version() -> int:
+    """Versão atual do layout (muda a cada ``layout_changed``)"""
+    return _layout_version
+
+
+def partition_months(conn: Any) -> List[str]:
+    """Meses com partição no banco, em ordem (``conn``: sqlite3 ou DatabaseConnection)"""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+        (PARTITION_PREFIX + "[0-9][0-9][0-9][0-9]_[0-9][0-9]",),
+    ).fetchall()
+    return sorted(month for month in (partition_month(row[0]) for row in rows) if month)
+
+
+def ensure_partition(conn: Any, month: str) -> str:
+    """
+    Cria a partição do mês, se faltar, com a sequência de ids do mês.
+
+    Não faz commit: roda dentro da transação de quem chamou.
+    """
+    table = partition_table(month)
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            usuario_id INTEGER,
+            acao TEXT NOT NULL,
+            tabela_afetada TEXT NOT NULL,
+            id_afetado INTEGER,
+            dados_anteriores TEXT,
+            dados_novos TEXT,
+            data_hora TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            endereco_ip TEXT,
+            FOREIGN KEY (usuario_id) REFERENCES usuarios (id)
+        )
+        """
+    )
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_data_hora ON {table} (data_hora)")
+    conn.execute(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT ?, ? "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = ?)",
+        (table, int(month.replace("-", "")) * PARTITION_ID_BASE, table),
+    )
+    layout_changed()
+    return table
+
+
+def drop_partition(conn: Any, month: str) -> None:
+    """Remove o mês inteiro (DROP TABLE); não faz commit"""
+    table = partition_table(month)
+    conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table,))
+    layout_changed()
+    logger.info(f"Audit partition {table} dropped")
+
+
+def migrate_unpartitioned(conn: Any) -> int:
+    """
+    Move as linhas de ``auditoria`` para as partições dos seus meses.
+
+    Os ids originais são mantidos (ficam abaixo de ``PARTITION_ID_BASE``).
+    Não faz commit.
+
+    Returns:
+        int: Linhas movidas
+    """
+    months = [
+        row[0]
+        for row in conn.execute("SELECT DISTINCT substr(data_hora, 1, 7) FROM auditoria").fetchall()
+        if row[0] and _MONTH.match(row[0])
+    ]
+    moved = 0
+    for month in months:
+        table = ensure_partition(conn, month)
+        cursor = conn.execute(
+            f"INSERT INTO {table} (id, {_COLUMNS}) SELECT id, {_COLUMNS} FROM auditoria "
+            "WHERE substr(data_hora, 1, 7) = ?",
+            (month,),
+        )
+        moved += cursor.rowcount
+        conn.execute("DELETE FROM auditoria WHERE substr(data_hora, 1, 7) = ?", (month,))
+    return moved
@@ -3,13 +3,32 @@ Repositório de auditoria: registros de ações do sistema.
 
 Implementa IAuditRepository com lógica de persistência para logs de auditoria.
 """
+import heapq
 import json
 import sqlite3
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple
+
+from .audit_archive import (
+    archive_dir_for,
+    attached_segment,
+    decompress_payload,
+    months_in_range,
+    segment_months,
+    segment_path,
+)
+from .audit_partitions import (
+    ensure_partition,
+    layout_changed,
+    layout_version,
+    month_for_id,
+    partition_months,
+    partition_table,
+)
 from .connection import DatabaseConnection
 from .interfaces import IAuditRepository
+from ..config import Config
 from ..core.logger import logger
 
 
@@ -23,8 +42,15 @@ class AuditRepository(IAuditRepository):
     - Contagem de registros
     """
 
-    def __init__(self):
+    def __init__(self, partitioned: Optional[bool] = None):
         self._db = DatabaseConnection.get_instance()
+        self._archive_dir: Optional[str] = None
+        self._partitioned = (
+            Config.Database.AUDIT_PARTITIONED if partitioned is None else partitioned
+        )
+        self._partition_month: Optional[str] = None  # Partição já criada nesta instância
+        # (versão do layout, partições, segmentos): evita sqlite_master e listdir por consulta
+        self._layout: Optional[Tuple[int, List[str], List[str]]] = None
 
     def create_log(
         self,
@@ -57,16 +83,38 @@ class AuditRepository(IAuditRepository):
             )
             new_json = json.dumps(dados_novos, ensure_ascii=False) if dados_novos else None
 
+            # Particionado: mês e data_hora do mesmo instante, a linha cai na partição certa
+            table, data_hora, month = "auditoria", None, None
+            if self._partitioned:
+                now = datetime.now(timezone.utc)
+                month, data_hora = now.strftime("%Y-%m"), now.strftime("%Y-%m-%d %H:%M:%S")
+                table = partition_table(month)
+                if month != self._partition_month:
+                    ensure_partition(self._db, month)
+
             self._db.execute(
-                """
-                INSERT INTO auditoria
-                (usuario_id, acao, tabela_afetada, id_afetado, dados_anteriores, dados_novos, endereco_ip)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                f"""
+                INSERT INTO {table}
+                (usuario_id, acao, tabela_afetada, id_afetado, dados_anteriores, dados_novos,
+                 endereco_ip, data_hora)
+                VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
             """,
-                (usuario_id, acao, tabela_afetada, id_afetado, prev_json, new_json, endereco_ip),
+                (
+                    usuario_id,
+                    acao,
+                    tabela_afetada,
+                    id_afetado,
+                    prev_json,
+                    new_json,
+                    endereco_ip,
+                    data_hora,
+                ),
             )
 
             self._db.commit()
+            if month != self._partition_month:
+                layout_changed()  # Partição nova já visível para outras conexões
+            self._partition_month = month
             return self._db.lastrowid()
 
         except sqlite3.Error as e:
@@ -100,48 +148,48 @@ class AuditRepository(IAuditRepository):
             Lista de dicionários com os logs
         """
         try:
-            query = """
+            where, params = _filter_clause(
+                filtro_usuario, filtro_acao, filtro_tabela, data_inicio, data_fim
+            )
+            query = (
+                """
                 SELECT
                     a.id, a.acao, a.tabela_afetada, a.id_afetado,
                     a.dados_anteriores, a.dados_novos, a.data_hora,
                     u.username as usuario
-                FROM auditoria a
+                FROM {table} a
                 LEFT JOIN usuarios u ON a.usuario_id = u.id
                 WHERE 1=1
             """
-            params: List[Any] = []
-
-            if filtro_usuario is not None:
-                query += " AND a.usuario_id = ?"
-                params.append(filtro_usuario)
-            if filtro_acao:
-                query += " AND a.acao = ?"
-                params.append(filtro_acao)
-            if filtro_tabela:
-                query += " AND a.tabela_afetada = ?"
-                params.append(filtro_tabela)
-            if data_inicio:
-                query += " AND DATE(a.data_hora) >= ?"
-                params.append(data_inicio)
-            if data_fim:
-                query += " AND DATE(a.data_hora) <= ?"
-                params.append(data_fim)
-
-            query += " ORDER BY a.data_hora DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-
-            self._db.execute(query, tuple(params))
-            columns = [desc[0] for desc in self._db.cursor.description]
+                + where
+                + " ORDER BY a.data_hora DESC LIMIT ? OFFSET ?"
+            )
+
+            sources = self._sources(data_inicio, data_fim)
+            if len(sources) == 1:
+                columns, rows = self._fetch(sources[0], query, (*params, limit, offset))
+            else:
+                # Cada fonte devolve as primeiras offset+limit; a junção ordenada pagina
+                window = (*params, offset + limit, 0)
+                fetched = [self._fetch(source, query, window) for source in sources]
+                columns = fetched[0][0]
+                data_hora = columns.index("data_hora")
+                merged = heapq.merge(
+                    *(rows for _, rows in fetched), key=lambda r: r[data_hora] or "", reverse=True
+                )
+                rows = list(islice(merged, offset, offset + limit))
 
             results = []
-            for row in self._db.fetchall():
+            for row in rows:
                 result = dict(zip(columns, row))
 
-                # Parse JSON fields
+                # Parse JSON fields (comprimidos nos segmentos arquivados)
                 if result.get("dados_anteriores"):
-                    result["dados_anteriores"] = json.loads(result["dados_anteriores"])
+                    result["dados_anteriores"] = json.loads(
+                        decompress_payload(result["dados_anteriores"])
+                    )
                 if result.get("dados_novos"):
-                    result["dados_novos"] = json.loads(result["dados_novos"])
+                    result["dados_novos"] = json.loads(decompress_payload(result["dados_novos"]))
 
                 # Format date
                 if result.get("data_hora"):
@@ -181,36 +229,87 @@ class AuditRepository(IAuditRepository):
             Número total de registros
         """
         try:
-            query = "SELECT COUNT(*) FROM auditoria a WHERE 1=1"
-            params: List[Any] = []
-
-            if filtro_usuario is not None:
-                query += " AND a.usuario_id = ?"
-                params.append(filtro_usuario)
-            if filtro_acao:
-                query += " AND a.acao = ?"
-                params.append(filtro_acao)
-            if filtro_tabela:
-                query += " AND a.tabela_afetada = ?"
-                params.append(filtro_tabela)
-            if data_inicio:
-                query += " AND DATE(a.data_hora) >= ?"
-                params.append(data_inicio)
-            if data_fim:
-                query += " AND DATE(a.data_hora) <= ?"
-                params.append(data_fim)
-
-            self._db.execute(query, tuple(params))
-            return self._db.fetchone()[0]
+            where, params = _filter_clause(
+                filtro_usuario, filtro_acao, filtro_tabela, data_inicio, data_fim
+            )
+            query = "SELECT COUNT(*) FROM {table} a WHERE 1=1" + where
+
+            return sum(
+                self._fetch(source, query, params)[1][0][0]
+                for source in self._sources(data_inicio, data_fim)
+            )
 
         except sqlite3.Error as e:
             logger.error(f"Database error counting audit logs: {e}")
             return 0
 
+    def _sources(
+        self, data_inicio: Optional[str], data_fim: Optional[str]
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Tabelas que o período alcança (poda de partições e segmentos).
+
+        Returns:
+            (tabela, mês do segmento arquivado a anexar ou None)
+        """
+        sources: List[Tuple[str, Optional[str]]] = [("auditoria", None)]
+        sources += [
+            (partition_table(month), None)
+            for month in months_in_range(self._months()[0], data_inicio, data_fim)
+        ]
+        sources += [("auditoria", month) for month in self._archived_months(data_inicio, data_fim)]
+        return sources
+
+    def _fetch(
+        self, source: Tuple[str, Optional[str]], query: str, params: Tuple[Any, ...]
+    ) -> Tuple[List[str], List[Any]]:
+        """Executa ``query`` (com ``{table}``) na fonte; devolve (colunas, linhas)"""
+        table, segment = source
+        if segment is None:
+            self._db.execute(query.format(table=table), params)
+            return [desc[0] for desc in self._db.cursor.description], self._db.fetchall()
+        schema = f"arquivo_{segment.replace('-', '_')}"
+        with self._attached(segment, schema) as conn:
+            cursor = conn.execute(query.format(table=f"{schema}.{table}"), params)
+            return [desc[0] for desc in cursor.description], cursor.fetchall()
+
+    def _archived_months(self, data_inicio: Optional[str], data_fim: Optional[str]) -> List[str]:
+        """Meses arquivados que o período alcança (nenhum no caso comum)"""
+        return months_in_range(self._months()[1], data_inicio, data_fim)
+
+    def _months(self) -> Tuple[List[str], List[str]]:
+        """(meses com partição, meses arquivados), relidos só quando o layout muda"""
+        version = layout_version()
+        if self._layout is None or self._layout[0] != version:
+            if self._archive_dir is None:
+                self._archive_dir = archive_dir_for(self._db.db_path)
+            self._layout = (
+                version,
+                partition_months(self._db),
+                segment_months(self._archive_dir),
+            )
+        return self._layout[1], self._layout[2]
+
+    def _attached(self, month: str, schema: str):
+        """Conexão de leitura com o segmento do mês anexado durante o bloco"""
+        path = segment_path(self._archive_dir, month)
+        return attached_segment(self._db.db_path, path, schema)
+
     # Métodos da interface IRepository
     def find_by_id(self, entity_id: int) -> Optional[Dict[str, Any]]:
         """Implementação de IRepository.find_by_id"""
-        self._db.execute("SELECT * FROM auditoria WHERE id = ?", (entity_id,))
+        # Ids de partição carregam o mês: consulta direto a tabela dele. Ids
+        # antigos podem ter ido para partições em migrate_unpartitioned
+        month = month_for_id(entity_id)
+        months = self._months()[0]
+        if month is not None:
+            tables = [partition_table(month)] if month in months else []
+        else:
+            tables = ["auditoria"] + [partition_table(m) for m in months]
+        if not tables:
+            return None
+        query = " UNION ALL ".join(f"SELECT * FROM {table} WHERE id = ?" for table in tables)
+        self._db.execute(query, (entity_id,) * len(tables))
         row = self._db.fetchone()
         if row:
             return {"id": row[0], "usuario_id": row[1], "acao": row[2], "data_hora": row[3]}
@@ -266,3 +365,34 @@ class AuditRepository(IAuditRepository):
     def find_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Implementação de IAuditRepository.find_by_date_range"""
         return self.get_logs(data_inicio=start_date, data_fim=end_date)
+
+
+def _filter_clause(
+    filtro_usuario: Optional[int],
+    filtro_acao: Optional[str],
+    filtro_tabela: Optional[str],
+    data_inicio: Optional[str],
+    data_fim: Optional[str],
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Condições ``AND ...`` e parâmetros dos filtros de get_logs/count_logs"""
+    query = ""
+    params: List[Any] = []
+
+    if filtro_usuario is not None:
+        query += " AND a.usuario_id = ?"
+        params.append(filtro_usuario)
+    if filtro_acao:
+        query += " AND a.acao = ?"
+        params.append(filtro_acao)
+    if filtro_tabela:
+        query += " AND a.tabela_afetada = ?"
+        params.append(filtro_tabela)
+    # Comparações diretas em data_hora (sem DATE()) usam o índice das partições
+    if data_inicio:
+        query += " AND a.data_hora >= ?"
+        params.append(data_inicio)
+    if data_fim:
+        query += " AND a.data_hora < date(?, '+1 day')"
+        params.append(data_fim)
+
+    return query, tuple(params)
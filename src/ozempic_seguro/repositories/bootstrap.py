@@ -0,0 +1,72 @@
+"""
+Bootstrap do banco: etapas executadas uma única vez por banco de dados.
+
+As etapas aplicadas ficam registradas na tabela ``bootstrap`` (migração 002)
+e rodam na abertura da conexão, não a cada construção de repositório.
+"""
+import os
+import sqlite3
+
+from .security import hash_password
+from ..core.logger import logger
+
+DEFAULT_USERS_STEP = "default_users"
+
+
+def run_bootstrap(db) -> None:
+    """
+    Executa as etapas de bootstrap ainda não aplicadas.
+
+    Args:
+        db: DatabaseConnection já migrada
+    """
+    if _is_applied(db, DEFAULT_USERS_STEP):
+        return
+
+    ensure_default_users(db)
+    _mark_applied(db, DEFAULT_USERS_STEP)
+
+
+def ensure_default_users(db) -> None:
+    """Garante que os usuários padrão (admin e técnico) existam"""
+    _create_user_if_missing(
+        db,
+        os.getenv("OZEMPIC_ADMIN_USERNAME", "00"),
+        os.getenv("OZEMPIC_ADMIN_PASSWORD", "admin@2025"),
+        "ADMINISTRADOR",
+        "administrador",
+    )
+    _create_user_if_missing(
+        db,
+        os.getenv("OZEMPIC_TECNICO_USERNAME", "01"),
+        os.getenv("OZEMPIC_TECNICO_PASSWORD", "tecnico@2025"),
+        "TÉCNICO",
+        "tecnico",
+    )
+
+
+def _is_applied(db, step: str) -> bool:
+    db.execute("SELECT 1 FROM bootstrap WHERE step = ?", (step,))
+    return db.fetchone() is not None
+
+
+def _mark_applied(db, step: str) -> None:
+    db.execute("INSERT OR IGNORE INTO bootstrap (step) VALUES (?)", (step,))
+    db.commit()
+
+
+def _create_user_if_missing(db, username: str, senha: str, nome: str, tipo: str) -> None:
+    db.execute("SELECT COUNT(*) FROM usuarios WHERE username = ?", (username,))
+    if db.fetchone()[0] > 0:
+        return
+
+    try:
+        db.execute(
+            "INSERT INTO usuarios (username, senha_hash, nome_completo, tipo, ativo) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (username, hash_password(senha), nome, tipo, 1),
+        )
+        db.commit()
+        logger.info(f"Default {tipo} user created: {username}")
+    except sqlite3.IntegrityError:
+        db.rollback()
@@ -1,14 +1,19 @@
 """
 Gerenciador de conexão com banco de dados.
 
-Responsabilidade única: gerenciar conexão SQLite e executar migrations.
+Responsabilidade única: gerenciar conexão SQLite e executar migrations
+(seguidas do bootstrap de dados, aplicado uma única vez por banco).
 """
 import sqlite3
 import os
 import threading
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..core.logger import logger, log_exceptions, DatabaseException
+from .bootstrap import run_bootstrap
+from .migrations import run_migrations
+from .pragmas import apply_pragmas, resolve_profile
+from ..core.logger import logger, log_exceptions
+from ..core.startup_profiler import get_profiler
 from ..config import Config
 
 
@@ -19,7 +24,13 @@ class DatabaseConnection:
     Responsabilidades:
     - Criar e manter conexão SQLite
     - Executar migrations
-    - Fornecer cursor para operações
+    - Fornecer cursor para operações (uma conexão e um cursor por thread)
+
+    Cada thread (Tk, BackgroundLoader, pipeline de inicialização, rehash)
+    recebe sua própria ``sqlite3.Connection``: ``commit``/``rollback`` de um
+    worker não confirma nem desfaz statements de outra thread. O WAL deixa
+    as leituras correrem em paralelo; escritas concorrentes esperam o lock
+    do banco até ``DB_TIMEOUT``.
 
     Uso:
         conn = DatabaseConnection.get_instance()
@@ -39,8 +50,15 @@ class DatabaseConnection:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialize()
+                    # Publica só depois de inicializada: outras threads (pipeline
+                    # de inicialização) não podem ver uma conexão pela metade
+                    instance = super().__new__(cls)
+                    try:
+                        instance._initialize()
+                    except Exception:
+                        instance.close()
+                        raise
+                    cls._instance = instance
         return cls._instance
 
     @classmethod
@@ -55,18 +73,27 @@ class DatabaseConnection:
         logger.info("Initializing database connection")
 
         db_path = self._get_db_path()
+        self._db_path = db_path
         self._is_new_db = not os.path.exists(db_path)
 
-        self._conn = sqlite3.connect(
-            db_path,
-            timeout=Config.Database.DB_TIMEOUT,
-            check_same_thread=Config.Database.DB_CHECK_SAME_THREAD,
-        )
-        self._conn.row_factory = sqlite3.Row
-        self._cursor = self._conn.cursor()
-
-        self._configure_pragmas()
-        self._run_migrations()
+        # Conexões abertas por thread; as de threads encerradas são fechadas
+        # quando outra thread abre a sua
+        self._local = threading.local()
+        self._thread_conns: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._conns_lock = threading.Lock()
+        self._pragma_settings: Dict[str, Any] = {}
+
+        profiler = get_profiler()
+        with profiler.phase("db.connect"):
+            self._conn = self._open()
+        self._register(self._conn)
+
+        with profiler.phase("db.pragmas"):
+            self._configure_pragmas()
+        with profiler.phase("db.migrations"):
+            self._run_migrations()
+        with profiler.phase("db.bootstrap"):
+            self._run_bootstrap()
 
         logger.info("Database connection initialized successfully")
 
@@ -77,72 +104,94 @@ class DatabaseConnection:
         os.makedirs(data_dir, exist_ok=True)
         return os.path.join(data_dir, Config.Database.DB_NAME)
 
+    def _open(self) -> sqlite3.Connection:
+        """Abre uma conexão ao arquivo do banco"""
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=Config.Database.DB_TIMEOUT,
+            check_same_thread=Config.Database.DB_CHECK_SAME_THREAD,
+            # Caminhos comuns seguem valendo; permite ATTACH de segmentos com file:...?mode=ro
+            uri=True,
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _register(self, conn: sqlite3.Connection) -> None:
+        """Associa ``conn`` à thread atual e fecha as de threads encerradas"""
+        self._local.conn = conn
+        with self._conns_lock:
+            alive = []
+            for thread, other in self._thread_conns:
+                if thread.is_alive():
+                    alive.append((thread, other))
+                else:
+                    other.close()
+            alive.append((threading.current_thread(), conn))
+            self._thread_conns = alive
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Abre a conexão da thread atual com os mesmos pragmas da principal"""
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        conn = self._open()
+        if Config.Database.ENABLE_FOREIGN_KEYS:
+            conn.execute("PRAGMA foreign_keys = ON;")
+        apply_pragmas(conn, self._pragma_settings)
+        self._register(conn)
+        return conn
+
     def _configure_pragmas(self) -> None:
-        """Configura pragmas de performance"""
+        """Configura pragmas de integridade e os do perfil de performance"""
+        if self._is_new_db and Config.Database.INCREMENTAL_AUTO_VACUUM:
+            # Só vale antes da primeira tabela; permite o VACUUM incremental
+            self.cursor.execute("PRAGMA auto_vacuum = INCREMENTAL;")
         if Config.Database.ENABLE_FOREIGN_KEYS:
-            self._cursor.execute("PRAGMA foreign_keys = ON;")
+            self.cursor.execute("PRAGMA foreign_keys = ON;")
         if Config.Database.ENABLE_WAL_MODE:
-            self._cursor.execute("PRAGMA journal_mode = WAL;")
-        self._cursor.execute(f"PRAGMA cache_size = {Config.Database.CACHE_SIZE};")
+            # Devolve uma linha; consumir finaliza o statement antes das migrations
+            self.cursor.execute("PRAGMA journal_mode = WAL;").fetchall()
+        self._pragma_profile, settings = resolve_profile()
+        self._pragma_settings = dict(settings)
+        apply_pragmas(self._conn, settings)
         self._conn.commit()
+        logger.info(f"Database pragma profile: {self._pragma_profile}")
 
     @log_exceptions("Database Migrations")
     def _run_migrations(self) -> None:
-        """Executa scripts SQL de migrations"""
-        base_dir = os.path.dirname(os.path.dirname(__file__))
-        migrations_dir = os.path.join(base_dir, Config.App.MIGRATIONS_DIR)
-        os.makedirs(migrations_dir, exist_ok=True)
-
-        # Cria tabela de controle
-        self._cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS migrations (
-                version INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """
-        )
-        self._conn.commit()
-
-        # Detecta versões aplicadas
-        applied = {row[0] for row in self._cursor.execute("SELECT version FROM migrations")}
-
-        # Aplica novos scripts
-        if not os.path.exists(migrations_dir):
-            return
-
-        migration_files = sorted([f for f in os.listdir(migrations_dir) if f.endswith(".sql")])
+        """Aplica as migrations pendentes do manifesto (nada se user_version está em dia)"""
+        run_migrations(self._conn)
 
-        for fname in migration_files:
-            version = int(fname.split("_")[0])
-            if version in applied:
-                continue
-
-            logger.info(f"Applying migration: {fname}")
-            path = os.path.join(migrations_dir, fname)
-
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    self._conn.executescript(f.read())
-                self._cursor.execute(
-                    "INSERT INTO migrations (version, name) VALUES (?, ?)", (version, fname)
-                )
-                self._conn.commit()
-                logger.info(f"Migration applied: {fname}")
-            except Exception as e:
-                logger.error(f"Migration failed {fname}: {e}")
-                raise DatabaseException(f"Migration failed: {fname}")
+    @log_exceptions("Database Bootstrap")
+    def _run_bootstrap(self) -> None:
+        """Executa etapas de bootstrap ainda não aplicadas (usuários padrão)"""
+        run_bootstrap(self)
 
     @property
     def conn(self) -> sqlite3.Connection:
-        """Retorna conexão SQLite"""
-        return self._conn
+        """Retorna a conexão SQLite da thread atual (aberta sob demanda)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._thread_connection()
+        return conn
 
     @property
     def cursor(self) -> sqlite3.Cursor:
-        """Retorna cursor SQLite"""
-        return self._cursor
+        """Retorna o cursor SQLite da thread atual (criado sob demanda)"""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self.conn.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    @property
+    def db_path(self) -> str:
+        """Caminho do arquivo do banco"""
+        return self._db_path
+
+    @property
+    def pragma_profile(self) -> str:
+        """Nome do perfil de PRAGMA em uso"""
+        return self._pragma_profile
 
     @property
     def is_new_database(self) -> bool:
@@ -151,43 +200,46 @@ class DatabaseConnection:
 
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Executa query e retorna cursor"""
-        return self._cursor.execute(query, params)
+        return self.cursor.execute(query, params)
 
     def executemany(self, query: str, params_list: list) -> sqlite3.Cursor:
         """Executa query para múltiplos registros"""
-        return self._cursor.executemany(query, params_list)
+        return self.cursor.executemany(query, params_list)
 
     def commit(self) -> None:
-        """Confirma transação"""
-        self._conn.commit()
+        """Confirma a transação da thread atual"""
+        self.conn.commit()
 
     def rollback(self) -> None:
-        """Reverte transação"""
-        self._conn.rollback()
+        """Reverte a transação da thread atual"""
+        self.conn.rollback()
 
     def fetchone(self):
         """Retorna um registro"""
-        return self._cursor.fetchone()
+        return self.cursor.fetchone()
 
     def fetchall(self) -> list:
         """Retorna todos os registros"""
-        return self._cursor.fetchall()
+        return self.cursor.fetchall()
 
     def lastrowid(self) -> int:
         """Retorna ID do último registro inserido"""
-        return self._cursor.lastrowid
+        return self.cursor.lastrowid
 
     def close(self) -> None:
         """Fecha conexão"""
         if hasattr(self, "_conn") and self._conn:
+            with self._conns_lock:
+                conns, self._thread_conns = self._thread_conns, []
             try:
-                self._conn.close()
+                for _, conn in conns:
+                    conn.close()
                 logger.info("Database connection closed")
             except Exception as e:
                 logger.warning(f"Error closing database connection: {e}")
             finally:
                 self._conn = None
-                self._cursor = None
+                self._local = threading.local()
 
     def __del__(self) -> None:
         """Destrutor - garante fechamento da conexão"""
@@ -0,0 +1,277 @@
+"""
+Manutenção do banco em segundo plano: checkpoint do WAL, PRAGMA optimize e
+VACUUM incremental.
+
+As rodadas só começam com a aplicação ociosa (telas iniciais alternando) e
+rodam numa thread dedicada, com conexão própria e ``busy_timeout`` zero:
+se o banco estiver ocupado a tarefa fica para a próxima rodada. Um progress
+handler interrompe a operação ao estourar o orçamento de tempo ou assim que
+o usuário volta a usar a aplicação, de modo que nenhuma ação do usuário
+espera pela manutenção.
+
+Uso:
+    maintenance = get_maintenance()
+    maintenance.notify_idle()      # alternância das telas iniciais
+    maintenance.notify_activity()  # usuário tocou na tela
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .connection import DatabaseConnection
+from ..config import Config
+from ..core.logger import logger
+
+TASKS = ("checkpoint", "optimize", "incremental_vacuum")
+
+
+class MaintenanceResult(NamedTuple):
+    """Resultado de uma tarefa de manutenção"""
+
+    task: str
+    finished_at: float  # epoch
+    duration_ms: float
+    status: str  # ok, skipped, busy, interrupted, error
+    detail: str
+
+
+class DatabaseMaintenance:
+    """
+    Agenda e executa as tarefas de manutenção com orçamento de tempo.
+
+    Cada tarefa tem seu intervalo; uma rodada executa, em ordem, as tarefas
+    vencidas enquanto houver orçamento. Tarefas interrompidas ou com o
+    banco ocupado continuam vencidas e rodam na próxima oportunidade.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        enabled: bool = Config.Database.MAINTENANCE_ENABLED,
+        budget_ms: float = Config.Database.MAINTENANCE_BUDGET_MS,
+        intervals: Optional[Dict[str, float]] = None,
+        wal_truncate_bytes: int = Config.Database.MAINTENANCE_WAL_TRUNCATE_BYTES,
+        vacuum_pages: int = Config.Database.MAINTENANCE_VACUUM_PAGES,
+        history: int = Config.Database.MAINTENANCE_HISTORY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.db_path = db_path
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.intervals = {
+            "checkpoint": Config.Database.MAINTENANCE_CHECKPOINT_INTERVAL,
+            "optimize": Config.Database.MAINTENANCE_OPTIMIZE_INTERVAL,
+            "incremental_vacuum": Config.Database.MAINTENANCE_VACUUM_INTERVAL,
+            **(intervals or {}),
+        }
+        self.wal_truncate_bytes = wal_truncate_bytes
+        self.vacuum_pages = vacuum_pages
+        self._clock = clock
+        self._last_run: Dict[str, float] = {}
+        self._history: "deque[MaintenanceResult]" = deque(maxlen=history)
+        self._abort = threading.Event()
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+
+    def due_tasks(self) -> List[str]:
+        """Tarefas cujo intervalo já passou"""
+        now = self._clock()
+        return [
+            task
+            for task in TASKS
+            if task not in self._last_run or now - self._last_run[task] >= self.intervals[task]
+        ]
+
+    def notify_idle(self) -> bool:
+        """
+        Aplicação ociosa: agenda uma rodada se houver tarefa vencida.
+
+        Returns:
+            bool: True se uma rodada foi agendada
+        """
+        with self._lock:
+            if not self.enabled or self._closed:
+                return False
+            if self._future is not None and not self._future.done():
+                return False
+            due = self.due_tasks()
+            if not due:
+                return False
+            self._abort.clear()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="db-maintenance"
+                )
+            self._future = self._executor.submit(self._run_logged, due)
+        return True
+
+    def notify_activity(self) -> None:
+        """Usuário ativo: interrompe a rodada em andamento"""
+        self._abort.set()
+
+    def wait(self, timeout: Optional[float] = None) -> List[MaintenanceResult]:
+        """Espera a rodada agendada (testes); retorna seus resultados"""
+        future = self._future
+        return future.result(timeout) if future is not None else []
+
+    def run(self, tasks: Optional[Sequence[str]] = None) -> List[MaintenanceResult]:
+        """
+        Executa uma rodada na thread atual.
+
+        Args:
+            tasks: Tarefas a executar (padrão: as vencidas)
+        """
+        tasks = self.due_tasks() if tasks is None else list(tasks)
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        conn = self._connection()
+        conn.set_progress_handler(
+            lambda: int(self._abort.is_set() or time.perf_counter() > deadline), 1000
+        )
+        results = []
+        try:
+            for task in tasks:
+                if self._abort.is_set() or time.perf_counter() >= deadline:
+                    break
+                results.append(self._run_task(conn, task))
+        finally:
+            conn.set_progress_handler(None, 0)
+        return results
+
+    def status(self) -> List[MaintenanceResult]:
+        """Resultados recentes, do mais novo para o mais antigo"""
+        with self._lock:
+            return list(reversed(self._history))
+
+    def wal_size(self) -> int:
+        """Tamanho atual do arquivo -wal em bytes"""
+        try:
+            return os.path.getsize(self.db_path + "-wal")
+        except OSError:
+            return 0
+
+    def shutdown(self) -> None:
+        """Interrompe a rodada em andamento e fecha a conexão"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        self._abort.set()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Sem espera por locks: banco ocupado = tarefa adiada
+            self._conn = sqlite3.connect(
+                self.db_path, timeout=0, isolation_level=None, check_same_thread=False
+            )
+        return self._conn
+
+    def _run_logged(self, tasks: Sequence[str]) -> List[MaintenanceResult]:
+        try:
+            return self.run(tasks)
+        except Exception as e:
+            logger.error(f"Database maintenance failed: {e}")
+            return []
+
+    def _run_task(self, conn: sqlite3.Connection, task: str) -> MaintenanceResult:
+        start = time.perf_counter()
+        try:
+            status, detail = getattr(self, f"_{task}")(conn)
+        except sqlite3.OperationalError as e:
+            message = str(e)
+            if "interrupt" in message:
+                status = "interrupted"
+            elif "locked" in message or "busy" in message:
+                status = "busy"
+            else:
+                status = "error"
+            detail = message
+        except sqlite3.Error as e:
+            status, detail = "error", str(e)
+
+        result = MaintenanceResult(
+            task, time.time(), (time.perf_counter() - start) * 1000, status, detail
+        )
+        with self._lock:
+            self._history.append(result)
+            if status in ("ok", "skipped", "error"):
+                self._last_run[task] = self._clock()
+        if status == "error":
+            logger.warning(f"Database maintenance task {task} failed: {detail}")
+        else:
+            logger.debug(
+                f"Database maintenance {task}: {status} in {result.duration_ms:.1f} ms {detail}"
+            )
+        return result
+
+    def _checkpoint(self, conn: sqlite3.Connection) -> Tuple[str, str]:
+        wal = self.wal_size()
+        if wal == 0:
+            return "skipped", "WAL vazio"
+        mode = "TRUNCATE" if wal >= self.wal_truncate_bytes else "PASSIVE"
+        busy, frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        if frames < 0:
+            return "skipped", "banco fora do modo WAL"
+        if busy:
+            return "busy", f"{mode}: {checkpointed}/{frames} páginas"
+        detail = f"{mode}: {checkpointed}/{frames} páginas"
+        return "ok", f"{detail}, WAL {_kb(wal)} -> {_kb(self.wal_size())}"
+
+    def _optimize(self, conn: sqlite3.Connection) -> Tuple[str, str]:
+        conn.execute("PRAGMA analysis_limit = 400").fetchall()
+        conn.execute("PRAGMA optimize").fetchall()
+        return "ok", ""
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection) -> Tuple[str, str]:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return "skipped", "auto_vacuum incremental desativado"
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if not free:
+            return "skipped", "nenhuma página livre"
+        # executescript roda o pragma até o fim (execute libera só uma página)
+        conn.executescript(f"PRAGMA incremental_vacuum({min(free, self.vacuum_pages):d});")
+        remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return "ok", f"{free - remaining} de {free} páginas livres devolvidas"
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.0f} KB"
+
+
+_maintenance: Optional[DatabaseMaintenance] = None
+_maintenance_lock = threading.Lock()
+
+
+def get_maintenance() -> DatabaseMaintenance:
+    """Manutenção do banco da aplicação"""
+    global _maintenance
+    with _maintenance_lock:
+        if _maintenance is None:
+            _maintenance = DatabaseMaintenance(DatabaseConnection.get_instance().db_path)
+        return _maintenance
+
+
+def shutdown_maintenance() -> None:
+    """Encerra a manutenção (fechamento da aplicação)"""
+    global _maintenance
+    with _maintenance_lock:
+        maintenance, _maintenance = _maintenance, None
+    if maintenance is not None:
+        maintenance.shutdown()
+
+
+def interrupt_maintenance() -> None:
+    """Interrompe a rodada em andamento, se houver (usuário ativo)"""
+    maintenance = _maintenance
+    if maintenance is not None:
+        maintenance.notify_activity()
@@ -0,0 +1,158 @@
+"""
+Migrations do banco: manifesto com checksums e aplicação em lote.
+
+O manifesto lista cada script de ``migrations/`` com o SHA-256 do conteúdo.
+``PRAGMA user_version`` guarda a última versão aplicada: com o banco em dia
+a abertura faz uma única leitura de pragma, sem listar o diretório. As
+migrations pendentes rodam numa só transação junto com o registro na
+tabela ``migrations`` e o novo ``user_version``.
+
+Para adicionar uma migration: crie ``NNN_nome.sql`` e acrescente a entrada
+ao ``MANIFEST`` (o checksum esperado aparece na falha de
+``tests/test_migrations.py``). Os scripts não devem abrir nem fechar
+transações.
+"""
+import hashlib
+import os
+import sqlite3
+from typing import List, NamedTuple, Set, Tuple
+
+from ..config import Config
+from ..core.exceptions import MigrationError
+from ..core.logger import logger
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), Config.App.MIGRATIONS_DIR)
+
+
+class Migration(NamedTuple):
+    """Entrada do manifesto"""
+
+    version: int
+    name: str
+    checksum: str
+
+
+MANIFEST: Tuple[Migration, ...] = (
+    Migration(
+        1, "001_initial.sql", "e94027a5c4d1e18a0ad2e328a0d6b9b7055e432f6ce7505c2f184019e4826f50"
+    ),
+    Migration(
+        2, "002_bootstrap.sql", "ecb4e8eba9534da986093969a2cc9348e76ccc08aa83c74554f90eac3d70c1d9"
+    ),
+    Migration(
+        3,
+        "003_state_journal.sql",
+        "5438380c71532e07a944dd2acf45b84162c5d5b8f8e5565226970c16200f20d4",
+    ),
+)
+
+LATEST_VERSION = MANIFEST[-1].version
+
+
+def checksum(sql: str) -> str:
+    """SHA-256 do script, independente de quebra de linha (CRLF no Windows)"""
+    return hashlib.sha256(sql.replace("\r\n", "\n").encode("utf-8")).hexdigest()
+
+
+def load_script(migration: Migration, directory: str = MIGRATIONS_DIR) -> str:
+    """Lê o script e confere o checksum do manifesto"""
+    try:
+        with open(os.path.join(directory, migration.name), "r", encoding="utf-8") as f:
+            sql = f.read()
+    except OSError as e:
+        raise MigrationError(migration.name, f"script não encontrado: {e}") from e
+    actual = checksum(sql)
+    if actual != migration.checksum:
+        raise MigrationError(migration.name, f"checksum {actual} difere do manifesto")
+    return sql
+
+
+def run_migrations(
+    conn: sqlite3.Connection,
+    manifest: Tuple[Migration, ...] = MANIFEST,
+    directory: str = MIGRATIONS_DIR,
+) -> List[str]:
+    """
+    Aplica as migrations pendentes.
+
+    Returns:
+        Nomes das migrations aplicadas (vazio se o banco já estava em dia)
+    """
+    latest = manifest[-1].version if manifest else 0
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    if current >= latest:
+        return []
+
+    applied = _prepare_history(conn, manifest)
+    pending = [m for m in manifest if m.version not in applied]
+
+    # Lê e confere tudo antes de tocar no banco
+    parts = ["BEGIN IMMEDIATE;"]
+    for migration in pending:
+        parts.append(load_script(migration, directory))
+        parts.append(
+            "\n;INSERT INTO migrations (version, name, checksum) VALUES "
+            f"({migration.version:d}, {_quote(migration.name)}, {_quote(migration.checksum)});"
+        )
+    parts.append(f"PRAGMA user_version = {latest:d};")
+    parts.append("COMMIT;")
+
+    names = [m.name for m in pending]
+    if names:
+        logger.info(f"Applying migrations: {', '.join(names)}")
+    try:
+        conn.executescript("\n".join(parts))
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
+        logger.error(f"Migration failed ({', '.join(names) or 'user_version'}): {e}")
+        raise MigrationError(", ".join(names) or "user_version", str(e)) from e
+
+    if names:
+        logger.info(f"Migrations applied: {', '.join(names)} (user_version={latest})")
+    return names
+
+
+def _prepare_history(conn: sqlite3.Connection, manifest: Tuple[Migration, ...]) -> Set[int]:
+    """
+    Garante a tabela ``migrations`` (com checksum) e confere o histórico.
+
+    Bancos anteriores ao manifesto ganham a coluna e os checksums; um
+    checksum gravado diferente do manifesto só é logado.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            checksum TEXT
+        )
+        """
+    )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(migrations)")}
+    if "checksum" not in columns:
+        conn.execute("ALTER TABLE migrations ADD COLUMN checksum TEXT")
+
+    by_version = {m.version: m for m in manifest}
+    applied = set()
+    for version, name, recorded in conn.execute(
+        "SELECT version, name, checksum FROM migrations"
+    ).fetchall():
+        applied.add(version)
+        expected = by_version.get(version)
+        if expected is None:
+            logger.warning(f"Applied migration {name} is not in the manifest")
+        elif recorded is None:
+            conn.execute(
+                "UPDATE migrations SET checksum = ? WHERE version = ?",
+                (expected.checksum, version),
+            )
+        elif recorded != expected.checksum:
+            logger.warning(f"Applied migration {name} checksum differs from the manifest")
+    conn.commit()
+    return applied
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
@@ -0,0 +1,83 @@
+"""
+Perfis de PRAGMA do SQLite.
+
+Cada perfil de ``DatabaseConfig.PRAGMA_PROFILES`` define ``synchronous``,
+``busy_timeout``, ``temp_store``, ``mmap_size``, ``cache_size`` e
+``wal_autocheckpoint``. O perfil vem de ``OZEMPIC_DB_PROFILE`` ou, na
+ausência dela, de ``DatabaseConfig.PRAGMA_PROFILE``.
+``scripts/benchmark_db_profiles.py`` compara os perfis nas operações reais.
+"""
+import os
+import sqlite3
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..config import Config
+from ..core.logger import logger
+
+PROFILE_ENV_VAR = "OZEMPIC_DB_PROFILE"
+
+# Ordem de aplicação; valores textuais aceitos por pragma
+_PRAGMAS = (
+    "busy_timeout",
+    "synchronous",
+    "temp_store",
+    "mmap_size",
+    "cache_size",
+    "wal_autocheckpoint",
+)
+_KEYWORDS = {
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+}
+
+
+def resolve_profile(name: Optional[str] = None) -> Tuple[str, Mapping[str, Any]]:
+    """
+    Perfil pedido (argumento, variável de ambiente ou configuração).
+
+    Nome desconhecido é logado e cai no perfil padrão.
+
+    Returns:
+        (nome, pragmas)
+    """
+    profiles = Config.Database.PRAGMA_PROFILES
+    default = Config.Database.PRAGMA_PROFILE
+    requested = name or os.getenv(PROFILE_ENV_VAR) or default
+    key = requested.strip().lower()
+    if key not in profiles:
+        logger.warning(f"Unknown database profile '{requested}', using '{default}'")
+        key = default
+    return key, profiles[key]
+
+
+def pragma_statements(settings: Mapping[str, Any]) -> List[str]:
+    """Comandos PRAGMA do perfil (valores validados, nada interpolado cru)"""
+    unknown = set(settings) - set(_PRAGMAS)
+    if unknown:
+        raise ValueError(f"PRAGMA não suportado: {', '.join(sorted(unknown))}")
+
+    statements = []
+    for pragma in _PRAGMAS:
+        if pragma not in settings:
+            continue
+        value = settings[pragma]
+        if pragma in _KEYWORDS:
+            value = str(value).upper()
+            if value not in _KEYWORDS[pragma]:
+                raise ValueError(f"Valor inválido para {pragma}: {settings[pragma]}")
+        else:
+            value = int(value)
+        statements.append(f"PRAGMA {pragma} = {value};")
+    return statements
+
+
+def apply_pragmas(conn: sqlite3.Connection, settings: Mapping[str, Any]) -> None:
+    """Aplica os pragmas do perfil na conexão"""
+    for statement in pragma_statements(settings):
+        # Alguns pragmas devolvem linha; consumir finaliza o statement
+        conn.execute(statement).fetchall()
+
+
+def current_pragmas(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Valores em vigor na conexão (diagnóstico e testes)"""
+    return {pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0] for pragma in _PRAGMAS}
@@ -1,21 +1,150 @@
 """
 Módulo de segurança: funções de hash e verificação de senha com bcrypt.
 Sistema 100% bcrypt - sem suporte legacy.
+
+O custo padrão vem de ``OZEMPIC_BCRYPT_ROUNDS`` (ou ``BCRYPT_ROUNDS``) e pode
+ser calibrado para o hardware com ``calibrate_bcrypt_rounds``.
 """
+import os
+import time
+from typing import Optional
+
 import bcrypt
 
+from ..config import Config
+from ..core.logger import logger
+
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2x$", "$2y$")
+
+# Custo usado por hash_password quando rounds não é informado
+_default_rounds: Optional[int] = None
+
+
+def _clamp_rounds(rounds: int) -> int:
+    """Limita o custo ao intervalo permitido pela configuração"""
+    return max(Config.Security.BCRYPT_MIN_ROUNDS, min(Config.Security.BCRYPT_MAX_ROUNDS, rounds))
+
+
+def _rounds_from_env() -> Optional[int]:
+    """Lê OZEMPIC_BCRYPT_ROUNDS, se definido e válido"""
+    value = os.getenv("OZEMPIC_BCRYPT_ROUNDS")
+    if not value:
+        return None
+    try:
+        return _clamp_rounds(int(value))
+    except ValueError:
+        logger.warning(f"OZEMPIC_BCRYPT_ROUNDS inválido: {value!r}")
+        return None
+
+
+def get_default_rounds() -> int:
+    """Retorna o custo bcrypt usado para novos hashes"""
+    if _default_rounds is not None:
+        return _default_rounds
+    env_rounds = _rounds_from_env()
+    return env_rounds if env_rounds is not None else Config.Security.BCRYPT_ROUNDS
+
+
+def set_default_rounds(rounds: Optional[int]) -> None:
+    """Define o custo bcrypt padrão (None volta ao valor da configuração)"""
+    global _default_rounds
+    _default_rounds = _clamp_rounds(rounds) if rounds is not None else None
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: Optional[float] = None,
+    min_rounds: Optional[int] = None,
+    max_rounds: Optional[int] = None,
+) -> int:
+    """
+    Mede o hardware e retorna o maior custo que cabe no orçamento de latência.
+
+    Faz um único hash no custo mínimo e extrapola: cada round dobra o tempo.
+
+    Args:
+        target_ms: Tempo máximo desejado por verificação (padrão: BCRYPT_TARGET_MS)
+        min_rounds: Custo mínimo aceito (padrão: BCRYPT_MIN_ROUNDS)
+        max_rounds: Custo máximo aceito (padrão: BCRYPT_MAX_ROUNDS)
+
+    Returns:
+        int: Custo calibrado
+    """
+    target_ms = target_ms if target_ms is not None else Config.Security.BCRYPT_TARGET_MS
+    min_rounds = min_rounds if min_rounds is not None else Config.Security.BCRYPT_MIN_ROUNDS
+    max_rounds = max_rounds if max_rounds is not None else Config.Security.BCRYPT_MAX_ROUNDS
+
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibracao", bcrypt.gensalt(rounds=min_rounds))
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 1e-3)
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+        elapsed_ms *= 2
+        rounds += 1
+
+    logger.info(f"bcrypt calibrado: {rounds} rounds (~{elapsed_ms:.0f}ms por verificação)")
+    return rounds
+
+
+def configure_bcrypt_rounds() -> int:
+    """
+    Define o custo padrão na inicialização.
+
+    OZEMPIC_BCRYPT_ROUNDS tem prioridade; sem ele, o custo é calibrado,
+    nunca abaixo de BCRYPT_MIN_ROUNDS.
+    """
+    env_rounds = _rounds_from_env()
+    rounds = env_rounds if env_rounds is not None else calibrate_bcrypt_rounds()
+    set_default_rounds(rounds)
+    return rounds
+
+
+def get_hash_rounds(senha_hash: str) -> Optional[int]:
+    """
+    Extrai o custo de um hash bcrypt ($2b$12$...).
+
+    Returns:
+        int: Custo do hash ou None se o formato for inválido
+    """
+    if not senha_hash or not senha_hash.startswith(_BCRYPT_PREFIXES):
+        return None
+    try:
+        return int(senha_hash[4:6])
+    except ValueError:
+        return None
+
+
+def needs_rehash(senha_hash: str, rounds: Optional[int] = None) -> bool:
+    """
+    Verifica se o hash usa custo menor que o desejado.
+
+    Args:
+        senha_hash (str): Hash armazenado no banco
+        rounds (int): Custo desejado (padrão: get_default_rounds())
+
+    Returns:
+        bool: True se o hash deve ser refeito
+    """
+    current = get_hash_rounds(senha_hash)
+    if current is None:
+        return False
+    target = rounds if rounds is not None else get_default_rounds()
+    return current < target
+
 
-def hash_password(senha: str, rounds: int = 12) -> str:
+def hash_password(senha: str, rounds: Optional[int] = None) -> str:
     """
     Gera um hash seguro para a senha usando bcrypt.
 
     Args:
         senha (str): Senha a ser hasheada
-        rounds (int): Número de rounds para bcrypt (padrão: 12)
+        rounds (int): Número de rounds para bcrypt (padrão: get_default_rounds())
 
     Returns:
         str: Hash da senha
     """
+    if rounds is None:
+        rounds = get_default_rounds()
     # Converte senha para bytes
     senha_bytes = senha.encode("utf-8")
     # Gera salt e hash com bcrypt
@@ -38,7 +167,7 @@ def verify_password(senha: str, senha_hash: str) -> bool:
     """
     try:
         # Verifica se é bcrypt (começa com $2a$, $2b$, $2x$ ou $2y$)
-        if not senha_hash.startswith(("$2a$", "$2b$", "$2x$", "$2y$")):
+        if not senha_hash.startswith(_BCRYPT_PREFIXES):
             # Hash inválido ou formato desconhecido
             return False
 
@@ -61,4 +190,4 @@ def is_bcrypt_hash(senha_hash: str) -> bool:
     Returns:
         bool: True se for bcrypt, False caso contrário
     """
-    return senha_hash.startswith(("$2a$", "$2b$", "$2x$", "$2y$"))
+    return senha_hash.startswith(_BCRYPT_PREFIXES)
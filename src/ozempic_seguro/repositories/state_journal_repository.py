@@ -0,0 +1,75 @@
+"""
+Repositório do diário de estado: bloqueios que devem sobreviver a reinícios.
+
+Guarda prazos em epoch (relógio de parede), o único relógio comparável entre
+execuções. Quem lê converte o tempo restante para o relógio monotônico local.
+"""
+import time
+from typing import Dict, Optional
+
+from .connection import DatabaseConnection
+from ..core.logger import logger
+
+
+class StateJournalRepository:
+    """
+    Diário de prazos de bloqueio (bloqueio do sistema e lockouts de login).
+
+    Escrito apenas quando o estado muda e lido uma vez na inicialização;
+    as verificações de bloqueio continuam em memória.
+    """
+
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        self._db = db or DatabaseConnection.get_instance()
+
+    def save(self, key: str, expires_at: float) -> bool:
+        """
+        Grava (ou substitui) o prazo de uma chave.
+
+        Args:
+            key: Identificador do estado (ex.: "system_block")
+            expires_at: Prazo em epoch (segundos)
+
+        Returns:
+            True se gravado com sucesso
+        """
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO state_journal (key, expires_at) VALUES (?, ?)",
+                (key, expires_at),
+            )
+            self._db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao gravar estado '{key}': {e}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        """Remove a chave do diário"""
+        try:
+            self._db.execute("DELETE FROM state_journal WHERE key = ?", (key,))
+            self._db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao remover estado '{key}': {e}")
+            return False
+
+    def load_active(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Retorna os prazos ainda vigentes e descarta os vencidos.
+
+        Args:
+            now: Epoch de referência (padrão: time.time())
+
+        Returns:
+            Dict chave -> segundos restantes
+        """
+        now = time.time() if now is None else now
+        try:
+            self._db.execute("DELETE FROM state_journal WHERE expires_at <= ?", (now,))
+            self._db.commit()
+            self._db.execute("SELECT key, expires_at FROM state_journal")
+            return {key: expires_at - now for key, expires_at in self._db.fetchall()}
+        except Exception as e:
+            logger.error(f"Erro ao carregar diário de estado: {e}")
+            return {}
@@ -3,13 +3,14 @@ Repositório de usuários: operações CRUD e autenticação.
 
 Implementa IUserRepository com lógica de persistência para usuários.
 """
-import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 import sqlite3
 
 from .connection import DatabaseConnection
 from .interfaces import IUserRepository
-from .security import hash_password, verify_password
+from .security import hash_password, verify_password, needs_rehash
 from ..core.logger import logger
 
 
@@ -23,62 +24,13 @@ class UserRepository(IUserRepository):
     - Verificações de regras de negócio (único admin, etc.)
     """
 
+    # Rehash de senhas com custo antigo roda fora do caminho do login
+    _rehash_executor: Optional[ThreadPoolExecutor] = None
+    _rehash_lock = threading.Lock()
+
     def __init__(self):
         self._db = DatabaseConnection.get_instance()
-        self._ensure_default_users()
-
-    def _ensure_default_users(self) -> None:
-        """Garante que usuários padrão existam"""
-        if self._db.is_new_database:
-            self._create_default_admin()
-            self._create_default_tecnico()
-        else:
-            # Verifica se existem
-            self._db.execute(
-                "SELECT COUNT(*) FROM usuarios WHERE username = ?",
-                (os.getenv("OZEMPIC_ADMIN_USERNAME", "00"),),
-            )
-            if self._db.fetchone()[0] == 0:
-                self._create_default_admin()
-
-            self._db.execute(
-                "SELECT COUNT(*) FROM usuarios WHERE username = ?",
-                (os.getenv("OZEMPIC_TECNICO_USERNAME", "01"),),
-            )
-            if self._db.fetchone()[0] == 0:
-                self._create_default_tecnico()
-
-    def _create_default_admin(self) -> None:
-        """Cria usuário administrador padrão"""
-        username = os.getenv("OZEMPIC_ADMIN_USERNAME", "00")
-        senha = os.getenv("OZEMPIC_ADMIN_PASSWORD", "admin@2025")
-        senha_hash = hash_password(senha)
-
-        try:
-            self._db.execute(
-                "INSERT INTO usuarios (username, senha_hash, nome_completo, tipo, ativo) VALUES (?, ?, ?, ?, ?)",
-                (username, senha_hash, "ADMINISTRADOR", "administrador", 1),
-            )
-            self._db.commit()
-            logger.info(f"Default admin user created: {username}")
-        except sqlite3.IntegrityError:
-            self._db.rollback()
-
-    def _create_default_tecnico(self) -> None:
-        """Cria usuário técnico padrão"""
-        username = os.getenv("OZEMPIC_TECNICO_USERNAME", "01")
-        senha = os.getenv("OZEMPIC_TECNICO_PASSWORD", "tecnico@2025")
-        senha_hash = hash_password(senha)
-
-        try:
-            self._db.execute(
-                "INSERT INTO usuarios (username, senha_hash, nome_completo, tipo, ativo) VALUES (?, ?, ?, ?, ?)",
-                (username, senha_hash, "TÉCNICO", "tecnico", 1),
-            )
-            self._db.commit()
-            logger.info(f"Default tecnico user created: {username}")
-        except sqlite3.IntegrityError:
-            self._db.rollback()
+        self._pending_rehash: Optional[Future] = None
 
     def create_user(
         self, username: str, senha: str, nome_completo: str, tipo: str
@@ -129,9 +81,49 @@ class UserRepository(IUserRepository):
         row = self._db.fetchone()
 
         if row and verify_password(password, row[2]):
+            if needs_rehash(row[2]):
+                self._schedule_rehash(row[0], password, row[2])
             return {"id": row[0], "username": row[1], "nome_completo": row[3], "tipo": row[4]}
         return None
 
+    @classmethod
+    def _get_rehash_executor(cls) -> ThreadPoolExecutor:
+        with cls._rehash_lock:
+            if cls._rehash_executor is None:
+                cls._rehash_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="bcrypt-rehash"
+                )
+            return cls._rehash_executor
+
+    def _schedule_rehash(self, user_id: int, password: str, old_hash: str) -> None:
+        """Agenda o rehash da senha com o custo bcrypt atual"""
+        self._pending_rehash = self._get_rehash_executor().submit(
+            self._rehash_password, user_id, password, old_hash
+        )
+
+    def _rehash_password(self, user_id: int, password: str, old_hash: str) -> bool:
+        """
+        Regrava o hash com o custo atual.
+
+        Só atualiza se o hash armazenado ainda for o verificado no login,
+        para não sobrescrever uma troca de senha concorrente.
+        """
+        try:
+            new_hash = hash_password(password)
+            self._db.execute(
+                "UPDATE usuarios SET senha_hash = ? WHERE id = ? AND senha_hash = ?",
+                (new_hash, user_id, old_hash),
+            )
+            self._db.commit()
+            updated = self._db.cursor.rowcount > 0
+            if updated:
+                logger.info(f"Password hash upgraded for user id {user_id}")
+            return updated
+        except sqlite3.Error as e:
+            logger.error(f"Database error rehashing password: {e}")
+            self._db.rollback()
+            return False
+
     def delete_user(self, user_id: int) -> bool:
         """
         Exclui usuário por ID.
@@ -3,9 +3,15 @@ Módulo de serviços - Camada de lógica de negócio.
 
 Fornece serviços que encapsulam regras de negócio e orquestram repositórios.
 """
-from .user_service import UserService
-from .audit_service import AuditService
-from .service_factory import get_user_service, get_audit_service
+from importlib import import_module
+
+# Importados sob demanda: importar um serviço não carrega os demais
+_LAZY_EXPORTS = {
+    "UserService": "user_service",
+    "AuditService": "audit_service",
+    "get_user_service": "service_factory",
+    "get_audit_service": "service_factory",
+}
 
 __all__ = [
     "UserService",
@@ -13,3 +19,16 @@ __all__ = [
     "get_user_service",
     "get_audit_service",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
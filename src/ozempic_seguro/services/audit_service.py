@@ -4,11 +4,12 @@ Serviço de auditoria: camada de negócio isolada para logs de auditoria.
 from typing import Optional, List, Dict, Any
 
 from ..repositories.audit_repository import AuditRepository
+from .service_factory import ServiceFactory
 
 
 class AuditService:
     def __init__(self):
-        self.audit_repo = AuditRepository()
+        self.audit_repo: AuditRepository = ServiceFactory.get_audit_repository()
 
     def get_logs(
         self,
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from .audit_service import AuditService
+from .service_factory import ServiceFactory
 from ..core.logger import logger
 
 
@@ -102,8 +103,8 @@ class AuditViewService:
     DEFAULT_PAGE_SIZE = 50
     AVAILABLE_ACTIONS = ["Todas", "LOGIN", "LOGOUT", "CRIAR", "ATUALIZAR", "EXCLUIR"]
 
-    def __init__(self):
-        self._audit_service = AuditService()
+    def __init__(self, audit_service: Optional[AuditService] = None):
+        self._audit_service = audit_service or ServiceFactory.get_audit_service()
 
     def get_logs(
         self, filter: Optional[AuditFilter] = None, page: int = 1, per_page: int = DEFAULT_PAGE_SIZE
@@ -184,5 +185,5 @@ class AuditViewService:
 
 
 def get_audit_view_service() -> AuditViewService:
-    """Retorna instância do AuditViewService"""
-    return AuditViewService()
+    """Retorna instância compartilhada do AuditViewService"""
+    return ServiceFactory.get_audit_view_service()
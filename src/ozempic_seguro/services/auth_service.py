@@ -13,6 +13,7 @@ from enum import Enum
 
 from ..session.session_manager import SessionManager
 from .user_service import UserService
+from .service_factory import ServiceFactory
 from ..core.logger import logger
 from ..core.exceptions import (
     InvalidCredentialsError,
@@ -49,17 +50,24 @@ class AuthService:
     Encapsula toda a lógica de login que estava na LoginView.
     """
 
-    def __init__(self):
-        self._session_manager = SessionManager.get_instance()
-        self._user_service = UserService()
+    def __init__(
+        self,
+        user_service: Optional[UserService] = None,
+        session_manager: Optional[SessionManager] = None,
+    ):
+        self._session_manager = session_manager or SessionManager.get_instance()
+        self._user_service = user_service or ServiceFactory.get_user_service()
 
-    def login(self, username: str, password: str) -> LoginResult:
+    def login(self, username: str, password: str, start_session: bool = True) -> LoginResult:
         """
         Realiza tentativa de login.
 
         Args:
             username: Nome de usuário
             password: Senha
+            start_session: Define o usuário da sessão em caso de sucesso. A tela
+                de login autentica fora da thread do Tk e passa False: a sessão
+                só troca no retorno, com a tela ainda viva (``start_session``)
 
         Returns:
             LoginResult com o resultado da tentativa
@@ -86,7 +94,8 @@ class AuthService:
 
             # Sucesso - registra e configura sessão
             self._session_manager.record_login_attempt(username, success=True)
-            self._session_manager.set_current_user(user)
+            if start_session:
+                self.start_session(user)
 
             panel = self._get_user_panel(user)
 
@@ -113,6 +122,10 @@ class AuthService:
                 else 0,
             )
 
+    def start_session(self, user: Dict[str, Any]) -> None:
+        """Define o usuário autenticado como usuário da sessão"""
+        self._session_manager.set_current_user(user)
+
     def logout(self) -> None:
         """Realiza logout do usuário atual"""
         current_user = self._session_manager.get_current_user()
@@ -192,5 +205,5 @@ class AuthService:
 
 # Função de conveniência para obter instância
 def get_auth_service() -> AuthService:
-    """Retorna instância do AuthService"""
-    return AuthService()
+    """Retorna instância compartilhada do AuthService"""
+    return ServiceFactory.get_auth_service()
@@ -0,0 +1,400 @@
+"""
+Serviço de backup online do banco.
+
+Responsabilidades:
+- Copiar o banco em uso com a API de backup do SQLite, página a página
+- Verificar a cópia com ``PRAGMA integrity_check``
+- Comprimir o snapshot (gzip) e aplicar a retenção
+- Espelhar os segmentos da auditoria arquivada (``audit_archive``)
+
+A origem é uma conexão própria, somente leitura, aberta para o backup e
+fechada ao fim. Ela mantém uma transação de leitura durante a cópia: o WAL
+fixa o snapshot do início, as escritas das outras threads seguem normalmente
+e não reiniciam a cópia, e nada de uma transação ainda não confirmada entra
+no destino. Cada passo copia ``BACKUP_PAGES_PER_STEP`` páginas e a thread
+dorme ``BACKUP_STEP_SLEEP`` entre passos.
+
+O arquivamento tira linhas antigas do banco, então o snapshot sozinho não
+guarda o histórico inteiro: os segmentos mensais são copiados para
+``<backup_dir>/AUDIT_ARCHIVE_DIR``. Como não mudam depois de gravados, só
+segmentos novos ou regravados (tamanho ou mtime diferentes) são copiados, e
+a retenção não os apaga.
+"""
+import gzip
+import os
+import shutil
+import sqlite3
+import stat
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from urllib.request import pathname2url
+
+from .service_factory import ServiceFactory
+from ..config import Config
+from ..core.logger import logger
+from ..repositories.audit_archive import archive_dir_for, segment_months, segment_path
+from ..repositories.connection import DatabaseConnection
+
+BACKUP_SUFFIX = ".db.gz"
+_PARTIAL_SUFFIX = ".part"
+_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+@dataclass
+class BackupResult:
+    """Resultado de um backup"""
+
+    success: bool
+    path: Optional[str]
+    pages: int
+    duration_ms: float
+    message: str
+    segments: int = 0  # Segmentos de auditoria copiados neste backup
+
+
+@dataclass
+class BackupInfo:
+    """Backup existente no diretório"""
+
+    path: str
+    created_at: datetime
+    size_bytes: int
+
+
+class BackupAborted(Exception):
+    """Backup interrompido pelo encerramento da aplicação"""
+
+
+class BackupService:
+    """
+    Serviço de backup do banco.
+
+    ``maybe_backup`` agenda um backup em segundo plano quando o último
+    ficou mais velho que ``BACKUP_INTERVAL_HOURS``; ``backup_now`` faz o
+    backup na thread atual.
+
+    ``db_path`` é o banco copiado (por padrão, o da ``DatabaseConnection``);
+    ``archive_dir`` é o diretório dos segmentos da auditoria, por padrão o
+    ``AUDIT_ARCHIVE_DIR`` ao lado do banco.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        backup_dir: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+        enabled: bool = Config.Security.BACKUP_ENABLED,
+        auto_backup: bool = Config.Database.AUTO_BACKUP,
+        interval_hours: float = Config.Database.BACKUP_INTERVAL_HOURS,
+        retention_days: int = Config.Security.BACKUP_RETENTION_DAYS,
+        pages_per_step: int = Config.Database.BACKUP_PAGES_PER_STEP,
+        step_sleep: float = Config.Database.BACKUP_STEP_SLEEP,
+    ):
+        self._db_path = db_path
+        self.backup_dir = backup_dir or _default_backup_dir()
+        self.archive_dir = archive_dir
+        self.enabled = enabled
+        self.auto_backup = auto_backup
+        self.interval_hours = interval_hours
+        self.retention_days = retention_days
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self._abort = threading.Event()
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_result: Optional[BackupResult] = None
+        self._closed = False
+
+    @property
+    def last_result(self) -> Optional[BackupResult]:
+        """Resultado do último backup feito nesta execução"""
+        return self._last_result
+
+    def is_due(self) -> bool:
+        """True se não há backup ou o mais recente passou do intervalo"""
+        latest = self.latest_backup()
+        if latest is None:
+            return True
+        age = datetime.now() - latest.created_at
+        return age.total_seconds() >= self.interval_hours * 3600
+
+    def maybe_backup(self) -> bool:
+        """
+        Agenda um backup em segundo plano se o automático estiver vencido.
+
+        Returns:
+            bool: True se um backup foi agendado
+        """
+        if not self.enabled or not self.auto_backup:
+            return False
+        with self._lock:
+            if self._closed or (self._future is not None and not self._future.done()):
+                return False
+        if not self.is_due():
+            return False
+        return self.start_backup()
+
+    def start_backup(self) -> bool:
+        """Agenda um backup em segundo plano; False se já houver um em andamento"""
+        with self._lock:
+            if not self.enabled or self._closed:
+                return False
+            if self._future is not None and not self._future.done():
+                return False
+            self._abort.clear()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-backup")
+            self._future = self._executor.submit(self.backup_now)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[BackupResult]:
+        """Espera o backup agendado (testes); retorna seu resultado"""
+        future = self._future
+        return future.result(timeout) if future is not None else None
+
+    def backup_now(self) -> BackupResult:
+        """
+        Faz o backup na thread atual: cópia, verificação, compressão e retenção.
+
+        Returns:
+            BackupResult: Resultado (nunca levanta exceção)
+        """
+        if not self.enabled:
+            return BackupResult(False, None, 0, 0.0, "Backup desativado")
+
+        with self._run_lock:
+            start = time.perf_counter()
+            os.makedirs(self.backup_dir, exist_ok=True)
+            self._remove_partials()
+
+            name = f"{_db_stem()}-{datetime.now().strftime(_TIMESTAMP_FORMAT)}"
+            snapshot = os.path.join(self.backup_dir, name + ".db" + _PARTIAL_SUFFIX)
+            target = os.path.join(self.backup_dir, name + BACKUP_SUFFIX)
+            try:
+                pages = self._copy(snapshot)
+                self._compress(snapshot, target)
+                # Depois do snapshot: linhas que já saíram do banco copiado
+                # estão em segmentos gravados antes da remoção
+                segments = self._mirror_segments()
+                result = BackupResult(
+                    True,
+                    target,
+                    pages,
+                    (time.perf_counter() - start) * 1000,
+                    "Backup concluído",
+                    segments,
+                )
+            except BackupAborted:
+                result = BackupResult(
+                    False, None, 0, (time.perf_counter() - start) * 1000, "Backup interrompido"
+                )
+            except (sqlite3.Error, OSError) as e:
+                result = BackupResult(
+                    False, None, 0, (time.perf_counter() - start) * 1000, f"Falha no backup: {e}"
+                )
+            finally:
+                _remove(snapshot)
+
+            self._last_result = result
+            if result.success:
+                removed = self.apply_retention()
+                logger.info(
+                    f"Database backup {os.path.basename(target)}: {result.pages} pages "
+                    f"and {result.segments} audit segments in {result.duration_ms:.0f} ms, "
+                    f"{removed} old backups removed"
+                )
+            else:
+                logger.warning(f"Database backup failed: {result.message}")
+            return result
+
+    def list_backups(self) -> List[BackupInfo]:
+        """Backups existentes, do mais novo para o mais antigo"""
+        try:
+            names = os.listdir(self.backup_dir)
+        except OSError:
+            return []
+        backups = []
+        for filename in names:
+            if not filename.endswith(BACKUP_SUFFIX):
+                continue
+            path = os.path.join(self.backup_dir, filename)
+            stamp = filename[: -len(BACKUP_SUFFIX)].rsplit("-", 2)[-2:]
+            try:
+                created_at = datetime.strptime("-".join(stamp), _TIMESTAMP_FORMAT)
+                size = os.path.getsize(path)
+            except (ValueError, OSError):
+                continue
+            backups.append(BackupInfo(path, created_at, size))
+        backups.sort(key=lambda b: b.created_at, reverse=True)
+        return backups
+
+    def latest_backup(self) -> Optional[BackupInfo]:
+        """Backup mais recente, se houver"""
+        backups = self.list_backups()
+        return backups[0] if backups else None
+
+    def apply_retention(self) -> int:
+        """
+        Apaga backups mais velhos que ``retention_days``; o mais recente fica sempre.
+
+        Returns:
+            int: Quantidade de backups apagados
+        """
+        backups = self.list_backups()
+        now = datetime.now()
+        removed = 0
+        for backup in backups[1:]:
+            expired = (now - backup.created_at).total_seconds() > self.retention_days * 86400
+            if expired and _remove(backup.path):
+                removed += 1
+        return removed
+
+    def shutdown(self) -> None:
+        """Interrompe o backup em andamento (fechamento da aplicação)"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        self._abort.set()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _copy(self, snapshot: str) -> int:
+        """Copia o banco para ``snapshot`` em passos e verifica a cópia"""
+        copied = 0
+
+        def progress(status: int, remaining: int, total: int) -> None:
+            nonlocal copied
+            copied = total - remaining
+            if self._abort.is_set():
+                raise BackupAborted()
+            if remaining:
+                # ``sleep`` de backup() só vale para BUSY/LOCKED; a pausa entre
+                # passos normais deixa a thread do Tk usar a conexão
+                time.sleep(self.step_sleep)
+
+        src = self._open_source()
+        dst = sqlite3.connect(snapshot)
+        try:
+            # Transação de leitura aberta: a cópia inteira vem do mesmo snapshot
+            src.execute("BEGIN")
+            src.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            src.backup(dst, pages=self.pages_per_step, progress=progress, sleep=self.step_sleep)
+            src.execute("COMMIT")
+            (status,) = dst.execute("PRAGMA integrity_check").fetchone()
+            if status != "ok":
+                raise sqlite3.DatabaseError(f"integrity_check: {status}")
+            # O snapshot vira um arquivo único, sem depender de -wal
+            dst.execute("PRAGMA journal_mode = DELETE").fetchall()
+        finally:
+            dst.close()
+            src.close()
+        return copied
+
+    def _source_path(self) -> str:
+        """Arquivo do banco copiado"""
+        if self._db_path is None:
+            return DatabaseConnection.get_instance().db_path
+        return self._db_path
+
+    def _open_source(self) -> sqlite3.Connection:
+        """Conexão somente leitura e exclusiva do backup"""
+        return sqlite3.connect(
+            f"file:{pathname2url(os.path.abspath(self._source_path()))}?mode=ro",
+            uri=True,
+            timeout=Config.Database.DB_TIMEOUT,
+            isolation_level=None,
+        )
+
+    def _compress(self, snapshot: str, target: str) -> None:
+        partial = target + _PARTIAL_SUFFIX
+        try:
+            with open(snapshot, "rb") as src, gzip.open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(partial, target)
+        finally:
+            _remove(partial)
+
+    def segments_backup_dir(self) -> str:
+        """Diretório das cópias dos segmentos de auditoria"""
+        return os.path.join(self.backup_dir, Config.Database.AUDIT_ARCHIVE_DIR)
+
+    def _mirror_segments(self) -> int:
+        """
+        Copia segmentos novos ou regravados para o backup.
+
+        Returns:
+            int: Segmentos copiados
+        """
+        archive_dir = self.archive_dir or archive_dir_for(self._source_path())
+        months = segment_months(archive_dir)
+        if not months:
+            return 0
+        target_dir = self.segments_backup_dir()
+        os.makedirs(target_dir, exist_ok=True)
+        copied = 0
+        for month in months:
+            if self._abort.is_set():
+                raise BackupAborted()
+            src = segment_path(archive_dir, month)
+            dst = segment_path(target_dir, month)
+            if _same_file(src, dst):
+                continue
+            partial = dst + _PARTIAL_SUFFIX
+            try:
+                shutil.copyfile(src, partial)
+                shutil.copystat(src, partial)  # mtime (comparação) e somente leitura
+                if os.path.exists(dst):
+                    os.chmod(dst, stat.S_IRUSR | stat.S_IWUSR)
+                os.replace(partial, dst)
+            finally:
+                _remove(partial)
+            copied += 1
+        return copied
+
+    def _remove_partials(self) -> None:
+        """Sobras de backups interrompidos por queda ou encerramento"""
+        for directory in (self.backup_dir, self.segments_backup_dir()):
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for filename in names:
+                if filename.endswith(_PARTIAL_SUFFIX):
+                    _remove(os.path.join(directory, filename))
+
+
+def _default_backup_dir() -> str:
+    base_dir = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(base_dir, Config.App.BACKUP_DIR)
+
+
+def _same_file(src: str, dst: str) -> bool:
+    """True se ``dst`` já é cópia de ``src`` (mesmo tamanho e mtime)"""
+    try:
+        a, b = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return a.st_size == b.st_size and a.st_mtime_ns == b.st_mtime_ns
+
+
+def _db_stem() -> str:
+    return os.path.splitext(Config.Database.DB_NAME)[0]
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def get_backup_service() -> BackupService:
+    """Função de conveniência para obter BackupService"""
+    return ServiceFactory.get_backup_service()
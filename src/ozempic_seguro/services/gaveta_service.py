@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from ..repositories.gaveta_repository import GavetaRepository
 from ..session.session_manager import SessionManager
 from ..core.logger import logger
+from .service_factory import ServiceFactory
 
 
 # =============================================================================
@@ -114,7 +115,7 @@ class GavetaService:
 
     def _initialize(self):
         """Inicializa dependências"""
-        self._repository = GavetaRepository()
+        self._repository: GavetaRepository = ServiceFactory.get_gaveta_repository()
         self._session_manager = SessionManager.get_instance()
 
     @classmethod
@@ -17,10 +17,15 @@ Exemplo de uso:
 
     # Para testes - injetar mocks
     ServiceFactory.set_mock_user_service(mock_service)
+
+    # Ou substituir apenas dentro de um bloco
+    with ServiceFactory.override("auth_service", fake_auth):
+        ...
 """
 from __future__ import annotations
 
-from typing import Dict, Any, TypeVar, Callable, cast
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, TypeVar, Callable, cast
 import threading
 
 from ..core.logger import logger, log_exceptions
@@ -31,13 +36,17 @@ T = TypeVar("T")
 ServiceType = TypeVar("ServiceType")
 
 
+_MISSING = object()
+
+
 class ServiceRegistry:
     """Registry thread-safe para gerenciar instâncias de serviços"""
 
     def __init__(self):
         self._services: Dict[str, Any] = {}
         self._mocks: Dict[str, Any] = {}
-        self._lock = threading.Lock()
+        # Reentrante: a factory de um serviço pode obter suas dependências do registry
+        self._lock = threading.RLock()
         self._config_validated = False
 
     def register_service(self, service_name: str, service_instance: Any) -> None:
@@ -80,6 +89,21 @@ class ServiceRegistry:
             self._mocks[service_name] = mock_instance
             logger.debug(f"Mock set for service: {service_name}")
 
+    @contextmanager
+    def override(self, service_name: str, instance: Any) -> Iterator[Any]:
+        """Substitui um serviço apenas dentro do bloco (restaura o anterior ao sair)"""
+        with self._lock:
+            previous = self._mocks.get(service_name, _MISSING)
+            self._mocks[service_name] = instance
+        try:
+            yield instance
+        finally:
+            with self._lock:
+                if previous is _MISSING:
+                    self._mocks.pop(service_name, None)
+                else:
+                    self._mocks[service_name] = previous
+
     def clear_mocks(self) -> None:
         """Remove todos os mocks"""
         with self._lock:
@@ -126,6 +150,85 @@ class ServiceFactory:
 
         return _registry.get_service("audit_service", create_audit_service)
 
+    @staticmethod
+    def get_auth_service():
+        """Retorna instância singleton de AuthService"""
+
+        def create_auth_service():
+            from .auth_service import AuthService
+
+            return AuthService()
+
+        return _registry.get_service("auth_service", create_auth_service)
+
+    @staticmethod
+    def get_timer_control_service():
+        """Retorna instância singleton de TimerControlService"""
+
+        def create_timer_control_service():
+            from .timer_control_service import TimerControlService
+
+            return TimerControlService()
+
+        return _registry.get_service("timer_control_service", create_timer_control_service)
+
+    @staticmethod
+    def get_audit_view_service():
+        """Retorna instância singleton de AuditViewService"""
+
+        def create_audit_view_service():
+            from .audit_view_service import AuditViewService
+
+            return AuditViewService()
+
+        return _registry.get_service("audit_view_service", create_audit_view_service)
+
+    @staticmethod
+    def get_user_management_service():
+        """Retorna instância singleton de UserManagementService"""
+
+        def create_user_management_service():
+            from .user_management_service import UserManagementService
+
+            return UserManagementService()
+
+        return _registry.get_service("user_management_service", create_user_management_service)
+
+    @staticmethod
+    def get_user_registration_service():
+        """Retorna instância singleton de UserRegistrationService"""
+
+        def create_user_registration_service():
+            from .user_registration_service import UserRegistrationService
+
+            return UserRegistrationService()
+
+        return _registry.get_service(
+            "user_registration_service", create_user_registration_service
+        )
+
+    @staticmethod
+    def get_gaveta_service():
+        """Retorna instância singleton de GavetaService"""
+
+        def create_gaveta_service():
+            from .gaveta_service import GavetaService
+
+            return GavetaService.get_instance()
+
+        return _registry.get_service("gaveta_service", create_gaveta_service)
+
+    @staticmethod
+    def get_backup_service():
+        """Retorna instância singleton de BackupService"""
+
+        def create_backup_service():
+            from .backup_service import BackupService
+
+            return BackupService()
+
+        return _registry.get_service("backup_service", create_backup_service)
+
     @staticmethod
     def get_session_manager():
         """Retorna instância singleton de SessionManager"""
@@ -148,6 +251,51 @@ class ServiceFactory:
 
         return _registry.get_service("security_logger", create_security_logger)
 
+    # Repositórios compartilhados (sem estado além da conexão singleton)
+    @staticmethod
+    def get_user_repository():
+        """Retorna instância compartilhada de UserRepository"""
+
+        def create_user_repository():
+            from ..repositories.user_repository import UserRepository
+
+            return UserRepository()
+
+        return _registry.get_service("user_repository", create_user_repository)
+
+    @staticmethod
+    def get_audit_repository():
+        """Retorna instância compartilhada de AuditRepository"""
+
+        def create_audit_repository():
+            from ..repositories.audit_repository import AuditRepository
+
+            return AuditRepository()
+
+        return _registry.get_service("audit_repository", create_audit_repository)
+
+    @staticmethod
+    def get_gaveta_repository():
+        """Retorna instância compartilhada de GavetaRepository"""
+
+        def create_gaveta_repository():
+            from ..repositories.gaveta_repository import GavetaRepository
+
+            return GavetaRepository()
+
+        return _registry.get_service("gaveta_repository", create_gaveta_repository)
+
+    @staticmethod
+    def get_state_journal_repository():
+        """Retorna instância compartilhada de StateJournalRepository"""
+
+        def create_state_journal_repository():
+            from ..repositories.state_journal_repository import StateJournalRepository
+
+            return StateJournalRepository()
+
+        return _registry.get_service("state_journal_repository", create_state_journal_repository)
+
     # Métodos para testes
     @staticmethod
     def set_mock_user_service(mock_service: Any) -> None:
@@ -159,6 +307,17 @@ class ServiceFactory:
         """Define mock para AuditService (apenas para testes)"""
         _registry.set_mock("audit_service", mock_service)
 
+    @staticmethod
+    def override(service_name: str, instance: Any):
+        """
+        Substitui um serviço apenas dentro de um bloco ``with`` (para testes).
+
+        Exemplo:
+            with ServiceFactory.override("auth_service", fake_auth):
+                frame = LoginFrame(master, callback)
+        """
+        return _registry.override(service_name, instance)
+
     @staticmethod
     def clear_all_mocks() -> None:
         """Remove todos os mocks"""
@@ -179,6 +338,14 @@ class ServiceFactory:
                 "database_manager": "database_manager" in _registry._services,
                 "session_manager": "session_manager" in _registry._services,
                 "security_logger": "security_logger" in _registry._services,
+                "auth_service": "auth_service" in _registry._services,
+                "timer_control_service": "timer_control_service" in _registry._services,
+                "audit_view_service": "audit_view_service" in _registry._services,
+                "user_management_service": "user_management_service" in _registry._services,
+                "user_registration_service": "user_registration_service"
+                in _registry._services,
+                "gaveta_service": "gaveta_service" in _registry._services,
+                "backup_service": "backup_service" in _registry._services,
             }
 
 
@@ -7,10 +7,11 @@ Responsabilidades:
 - Obter tempo restante
 - Gerenciar estado do timer
 """
-from typing import Tuple
+from typing import Optional, Tuple
 from dataclasses import dataclass
 
 from ..session.session_manager import SessionManager
+from .service_factory import ServiceFactory
 from ..core.logger import logger
 
 
@@ -50,8 +51,8 @@ class TimerControlService:
     Encapsula toda a lógica de timer que estava nas views.
     """
 
-    def __init__(self):
-        self._session = SessionManager.get_instance()
+    def __init__(self, session_manager: Optional[SessionManager] = None):
+        self._session = session_manager or SessionManager.get_instance()
 
     def get_status(self) -> TimerStatus:
         """
@@ -167,5 +168,5 @@ class TimerControlService:
 
 
 def get_timer_control_service() -> TimerControlService:
-    """Retorna instância do TimerControlService"""
-    return TimerControlService()
+    """Retorna instância compartilhada do TimerControlService"""
+    return ServiceFactory.get_timer_control_service()
@@ -11,6 +11,7 @@ from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
 
 from .user_service import UserService
+from .service_factory import ServiceFactory
 from ..core.logger import logger
 from ..core.exceptions import (
     UserNotFoundError,
@@ -91,8 +92,8 @@ class UserManagementService:
     Encapsula toda a lógica de gerenciamento que estava na GerenciamentoUsuariosView.
     """
 
-    def __init__(self):
-        self._user_service = UserService()
+    def __init__(self, user_service: Optional[UserService] = None):
+        self._user_service = user_service or ServiceFactory.get_user_service()
 
     def get_all_users(self) -> List[UserData]:
         """
@@ -304,5 +305,5 @@ class UserManagementService:
 
 
 def get_user_management_service() -> UserManagementService:
-    """Retorna instância do UserManagementService"""
-    return UserManagementService()
+    """Retorna instância compartilhada do UserManagementService"""
+    return ServiceFactory.get_user_management_service()
@@ -10,6 +10,7 @@ from typing import Optional, List
 from dataclasses import dataclass, field
 
 from .user_service import UserService
+from .service_factory import ServiceFactory
 from ..core.logger import logger
 from ..core.exceptions import (
     UserAlreadyExistsError,
@@ -41,8 +42,8 @@ class UserRegistrationService:
     MAX_PASSWORD_LENGTH = 8
     MIN_PASSWORD_LENGTH = 4
 
-    def __init__(self):
-        self._user_service = UserService()
+    def __init__(self, user_service: Optional[UserService] = None):
+        self._user_service = user_service or ServiceFactory.get_user_service()
 
     def register(self, nome: str, username: str, senha: str, tipo: str) -> RegistrationResult:
         """
@@ -167,5 +168,5 @@ class UserRegistrationService:
 
 
 def get_user_registration_service() -> UserRegistrationService:
-    """Retorna instância do UserRegistrationService"""
-    return UserRegistrationService()
+    """Retorna instância compartilhada do UserRegistrationService"""
+    return ServiceFactory.get_user_registration_service()
@@ -12,6 +12,7 @@ from ..repositories.security_logger import SecurityLogger
 from ..core.validators import Validators
 from ..config import SecurityConfig
 from ..core.base_views import BaseService
+from .service_factory import ServiceFactory
 from ..core.exceptions import (
     UserNotFoundError,
     UserAlreadyExistsError,
@@ -27,8 +28,9 @@ from ..core.exceptions import (
 class UserService(BaseService):
     def __init__(self):
         super().__init__()
-        self.user_repo = UserRepository()
-        self.audit_repo = AuditRepository()
+        # Repositórios compartilhados: construir um serviço não consulta o banco
+        self.user_repo: UserRepository = ServiceFactory.get_user_repository()
+        self.audit_repo: AuditRepository = ServiceFactory.get_audit_repository()
 
     def create_user(
         self,
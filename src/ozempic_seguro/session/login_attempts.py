@@ -1,10 +1,30 @@
 """
 Gerenciador de tentativas de login para controle de força bruta.
 """
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import threading
+import time
+from typing import Callable, Dict, Any, Optional
 
 from ..config import Config
+from ..core.cache import ExpiringLRU
+from ..core.logger import logger
+from ..core.scheduler import ScheduledTask, get_scheduler
+
+# Intervalo mínimo entre varreduras de entradas vencidas
+_SWEEP_MIN_INTERVAL = 1.0
+
+# Prefixo das chaves de lockout no diário de estado
+LOCKOUT_KEY_PREFIX = "lockout:"
+
+
+class _AttemptRecord:
+    """Contador de falhas e prazo monotônico de bloqueio de um username"""
+
+    __slots__ = ("count", "locked_until")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.locked_until: Optional[float] = None
 
 
 class LoginAttemptsManager:
@@ -15,115 +35,177 @@ class LoginAttemptsManager:
     - Registrar tentativas de login
     - Controlar bloqueio por tentativas excessivas
     - Fornecer status de bloqueio
+
+    As tentativas ficam num LRU limitado com TTL igual à janela de bloqueio:
+    usernames sem falhas recentes expiram sozinhos e a memória não cresce
+    com nomes arbitrários digitados na tela de login. Bloqueios ativos ficam
+    fixados no LRU: inundar o mapa com usernames descartáveis não os derruba.
+
+    Thread-safe: o login roda fora da thread do Tk.
     """
 
-    def __init__(self):
-        self._login_attempts: Dict[str, Dict] = {}
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: Optional[int] = None,
+    ):
+        self._lock = threading.RLock()
+        self._clock = clock
         self._max_login_attempts: int = Config.Security.MAX_LOGIN_ATTEMPTS
         self._lockout_duration: int = Config.Security.LOCKOUT_DURATION_MINUTES
+        self._login_attempts = ExpiringLRU(
+            max_entries or Config.Security.LOGIN_ATTEMPTS_MAX_ENTRIES,
+            self._lockout_duration * 60,
+            clock=clock,
+            pinned=self._is_active_lockout,
+        )
+        # Uma única tarefa no agendador descarta as entradas vencidas
+        self._sweep_task: Optional[ScheduledTask] = None
+        # Diário de estado (save/delete); None mantém lockouts só em memória
+        self._journal: Optional[Any] = None
+
+    def _is_active_lockout(self, record: _AttemptRecord) -> bool:
+        """Registro com bloqueio ainda vigente (não pode ser descartado)"""
+        return record.locked_until is not None and self._clock() < record.locked_until
+
+    def set_journal(self, journal: Optional[Any]) -> None:
+        """Define o diário onde os lockouts são persistidos a cada mudança"""
+        self._journal = journal
+
+    def restore_lockout(self, username: str, remaining_seconds: float) -> None:
+        """Restaura um lockout lido do diário na inicialização"""
+        if remaining_seconds <= 0:
+            return
+        with self._lock:
+            record = _AttemptRecord()
+            record.count = self._max_login_attempts
+            record.locked_until = self._clock() + remaining_seconds
+            self._login_attempts.set(username, record)
+            if self._sweep_task is None or not self._sweep_task.active:
+                self._schedule_sweep(self._lockout_duration * 60)
 
     def record_attempt(self, username: str, success: bool = True) -> None:
         """Registra tentativa de login"""
-        now = datetime.now()
-
-        if username not in self._login_attempts:
-            self._login_attempts[username] = {"count": 0, "last_attempt": now, "locked_until": None}
-
-        attempt_data = self._login_attempts[username]
-
-        if success:
-            attempt_data["count"] = 0
-            attempt_data["locked_until"] = None
-        else:
-            attempt_data["count"] += 1
-            attempt_data["last_attempt"] = now
-
-            if attempt_data["count"] >= self._max_login_attempts:
-                attempt_data["locked_until"] = now + timedelta(minutes=self._lockout_duration)
+        with self._lock:
+            if success:
+                self.reset(username)
+                return
+
+            now = self._clock()
+            record = self._login_attempts.get(username)
+            if record is None or (record.locked_until is not None and now >= record.locked_until):
+                record = _AttemptRecord()
+
+            record.count += 1
+            if record.count >= self._max_login_attempts:
+                record.locked_until = now + self._lockout_duration * 60
+                self._persist(username, time.time() + self._lockout_duration * 60)
+
+            self._login_attempts.set(username, record)
+            # TTL único: a varredura pendente sempre vence antes desta entrada
+            if self._sweep_task is None or not self._sweep_task.active:
+                self._schedule_sweep(self._lockout_duration * 60)
+
+    def _schedule_sweep(self, seconds: float) -> None:
+        """Agenda a varredura para o prazo mais próximo"""
+        seconds = max(seconds, _SWEEP_MIN_INTERVAL)
+        task = self._sweep_task
+        if task is not None and task.active and task.remaining() <= seconds:
+            return  # Já existe varredura antes deste prazo
+        if task is None or not task.reschedule(seconds):
+            self._sweep_task = get_scheduler().call_later(seconds, self._sweep_expired)
+
+    def _sweep_expired(self) -> None:
+        """Descarta entradas vencidas e agenda a próxima varredura"""
+        with self._lock:
+            self._login_attempts.purge_expired()
+            next_expiry = self._login_attempts.next_expiry()
+            if next_expiry is not None:
+                self._schedule_sweep(next_expiry)
+
+    def _get_lock_deadline(self, username: str) -> Optional[float]:
+        """Prazo de bloqueio vigente (None se não bloqueado)"""
+        record = self._login_attempts.get(username)
+        if record is None or record.locked_until is None:
+            return None
+        if self._clock() >= record.locked_until:
+            self._login_attempts.delete(username)
+            return None
+        return record.locked_until
 
     def is_locked(self, username: str) -> bool:
         """Verifica se usuário está bloqueado"""
-        if username not in self._login_attempts:
-            return False
-
-        attempt_data = self._login_attempts[username]
-
-        if attempt_data["locked_until"] is None:
-            return False
-
-        if datetime.now() >= attempt_data["locked_until"]:
-            attempt_data["locked_until"] = None
-            attempt_data["count"] = 0
-            return False
-
-        return True
+        with self._lock:
+            return self._get_lock_deadline(username) is not None
 
     def get_remaining_time_minutes(self, username: str) -> int:
         """Retorna tempo restante de bloqueio em minutos"""
-        if username not in self._login_attempts:
-            return 0
-
-        attempt_data = self._login_attempts[username]
-
-        if attempt_data["locked_until"] is None:
-            return 0
-
-        remaining = attempt_data["locked_until"] - datetime.now()
-        return max(0, int(remaining.total_seconds() / 60))
+        return self.get_remaining_time_seconds(username) // 60
 
     def get_remaining_time_seconds(self, username: str) -> int:
         """Retorna tempo restante de bloqueio em segundos"""
-        if username not in self._login_attempts:
-            return 0
-
-        attempt_data = self._login_attempts[username]
-
-        if attempt_data["locked_until"] is None:
-            return 0
-
-        remaining = attempt_data["locked_until"] - datetime.now()
-        return max(0, int(remaining.total_seconds()))
+        with self._lock:
+            deadline = self._get_lock_deadline(username)
+            if deadline is None:
+                return 0
+            return max(0, int(deadline - self._clock()))
 
     def get_remaining_attempts(self, username: str) -> int:
         """Retorna número de tentativas restantes"""
-        if username not in self._login_attempts:
-            return self._max_login_attempts
+        with self._lock:
+            record = self._login_attempts.get(username)
+            if record is None:
+                return self._max_login_attempts
 
-        attempt_data = self._login_attempts[username]
-        used_attempts = attempt_data["count"]
-        remaining = self._max_login_attempts - used_attempts
-        return max(0, remaining)
+            return max(0, self._max_login_attempts - record.count)
 
     def get_status_message(self, username: str) -> Dict[str, Any]:
         """Retorna mensagem personalizada sobre o status de login"""
-        if self.is_locked(username):
-            remaining_time = self.get_remaining_time_minutes(username)
-            remaining_seconds = self.get_remaining_time_seconds(username)
-
-            if remaining_time > 0:
+        with self._lock:
+            if self.is_locked(username):
+                remaining_time = self.get_remaining_time_minutes(username)
+                remaining_seconds = self.get_remaining_time_seconds(username)
+
+                if remaining_time > 0:
+                    return {
+                        "locked": True,
+                        "message": f"Conta bloqueada por {remaining_time} minuto(s)",
+                        "detailed_message": f"Muitas tentativas incorretas. Tente novamente em {remaining_time}:{remaining_seconds % 60:02d}",
+                        "remaining_seconds": remaining_seconds,
+                        "remaining_attempts": 0,
+                    }
+
+            remaining_attempts = self.get_remaining_attempts(username)
+            if remaining_attempts < self._max_login_attempts:
                 return {
-                    "locked": True,
-                    "message": f"Conta bloqueada por {remaining_time} minuto(s)",
-                    "detailed_message": f"Muitas tentativas incorretas. Tente novamente em {remaining_time}:{remaining_seconds % 60:02d}",
-                    "remaining_seconds": remaining_seconds,
-                    "remaining_attempts": 0,
+                    "locked": False,
+                    "message": f"Atenção: {remaining_attempts} tentativa(s) restante(s)",
+                    "remaining_attempts": remaining_attempts,
                 }
 
-        remaining_attempts = self.get_remaining_attempts(username)
-        if remaining_attempts < self._max_login_attempts:
-            return {
-                "locked": False,
-                "message": f"Atenção: {remaining_attempts} tentativa(s) restante(s)",
-                "remaining_attempts": remaining_attempts,
-            }
-
-        return {"locked": False, "message": "", "remaining_attempts": remaining_attempts}
+            return {"locked": False, "message": "", "remaining_attempts": remaining_attempts}
 
     def reset(self, username: str) -> None:
         """Reseta tentativas de login de um usuário"""
-        if username in self._login_attempts:
-            self._login_attempts[username] = {
-                "count": 0,
-                "last_attempt": None,
-                "locked_until": None,
-            }
+        with self._lock:
+            record = self._login_attempts.get(username)
+            self._login_attempts.delete(username)
+            if record is not None and record.locked_until is not None:
+                self._persist(username, None)
+
+    def _persist(self, username: str, expires_at: Optional[float]) -> None:
+        """Grava (ou remove, se None) o lockout do username no diário"""
+        if self._journal is None:
+            return
+        key = LOCKOUT_KEY_PREFIX + username
+        try:
+            if expires_at is None:
+                self._journal.delete(key)
+            else:
+                self._journal.save(key, expires_at)
+        except Exception as e:
+            logger.error(f"Erro ao persistir lockout de '{username}': {e}")
+
+    def tracked_count(self) -> int:
+        """Número de usernames rastreados"""
+        return len(self._login_attempts)
@@ -3,14 +3,47 @@ Gerenciador de sessão principal do sistema Ozempic Seguro.
 
 Responsável por controlar sessões de usuário, timeouts e bloqueios.
 """
+from dataclasses import dataclass, replace
 from datetime import datetime
 import threading
 from typing import Optional, Dict, Any, Callable
 
 from ..config import Config
 from ..core.logger import logger
-from .login_attempts import LoginAttemptsManager
-from .timer_manager import TimerManager
+from ..core.scheduler import ScheduledTask, get_scheduler
+from .login_attempts import LOCKOUT_KEY_PREFIX, LoginAttemptsManager
+from .timer_manager import SYSTEM_BLOCK_KEY, TimerManager
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """
+    Estado imutável da sessão.
+
+    Trocado por inteiro a cada mudança: quem lê pega uma referência e vê
+    usuário, atividade e timeout consistentes entre si, sem lock.
+    """
+
+    user: Optional[Dict[str, Any]] = None
+    last_activity: Optional[datetime] = None
+    timeout_minutes: int = Config.Security.SESSION_TIMEOUT_MINUTES
+    user_id: Optional[int] = None
+    tipo: Optional[str] = None
+
+    @classmethod
+    def for_user(
+        cls, user: Optional[Dict[str, Any]], last_activity: Optional[datetime], timeout: int
+    ) -> "SessionSnapshot":
+        """Cria snapshot derivando id e tipo do usuário"""
+        if not user:
+            return cls(user=user, last_activity=last_activity, timeout_minutes=timeout)
+        return cls(
+            user=user,
+            last_activity=last_activity,
+            timeout_minutes=timeout,
+            user_id=user.get("id"),
+            tipo=user.get("tipo"),
+        )
 
 
 class SessionManager:
@@ -22,6 +55,9 @@ class SessionManager:
     - Controle de timeout de sessão
     - Delegação para LoginAttemptsManager e TimerManager
 
+    Leituras usam o snapshot atual sem lock; escritas (Tk, login em
+    background e expiração no agendador) serializam em ``_state_lock``.
+
     Uso:
         session = SessionManager.get_instance()
         session.set_current_user(user_dict)
@@ -43,20 +79,87 @@ class SessionManager:
 
     def _initialize(self) -> None:
         """Inicializa atributos da instância"""
-        self._current_user: Optional[Dict[str, Any]] = None
-        self._last_activity: Optional[datetime] = None
-        self._session_timeout: int = Config.Security.SESSION_TIMEOUT_MINUTES
-        self._timeout_timer: Optional[threading.Timer] = None
+        self._state_lock = threading.RLock()
+        self._state = SessionSnapshot()
+        # Prazo de expiração no agendador compartilhado (sem thread por atividade)
+        self._timeout_timer: Optional[ScheduledTask] = None
 
         # Componentes delegados
         self._login_attempts = LoginAttemptsManager()
         self._timer = TimerManager()
 
+    # ==================== Snapshot ====================
+
+    @property
+    def snapshot(self) -> SessionSnapshot:
+        """Snapshot atual da sessão (leitura sem lock)"""
+        return self._state
+
+    def _swap(self, **changes: Any) -> SessionSnapshot:
+        """Substitui o snapshot aplicando ``changes`` (chamar com _state_lock)"""
+        state = self._state
+        if "user" in changes:
+            state = SessionSnapshot.for_user(
+                changes.pop("user"), state.last_activity, state.timeout_minutes
+            )
+        if changes:
+            state = replace(state, **changes)
+        self._state = state
+        return state
+
+    # Acesso por atributo (código e testes legados) sobre o snapshot
+    @property
+    def _current_user(self) -> Optional[Dict[str, Any]]:
+        return self._state.user
+
+    @_current_user.setter
+    def _current_user(self, user: Optional[Dict[str, Any]]) -> None:
+        with self._state_lock:
+            self._swap(user=user)
+
+    @property
+    def _last_activity(self) -> Optional[datetime]:
+        return self._state.last_activity
+
+    @_last_activity.setter
+    def _last_activity(self, value: Optional[datetime]) -> None:
+        with self._state_lock:
+            self._swap(last_activity=value)
+
+    @property
+    def _session_timeout(self) -> int:
+        return self._state.timeout_minutes
+
+    @_session_timeout.setter
+    def _session_timeout(self, minutes: int) -> None:
+        with self._state_lock:
+            self._swap(timeout_minutes=minutes)
+
     @classmethod
     def set_audit_callback(cls, callback: Callable[[int, str, str, Dict], None]) -> None:
         """Define callback para auditoria (evita import circular)."""
         cls._audit_callback = callback
 
+    def attach_state_journal(self, journal) -> None:
+        """
+        Persiste bloqueios no diário e restaura os que ainda estão vigentes.
+
+        Lido uma única vez na inicialização; depois o diário só é escrito
+        quando um bloqueio muda, sem consultas no caminho de is_blocked().
+
+        Args:
+            journal: Objeto com save(key, expires_at), delete(key) e
+                load_active() -> {key: segundos_restantes}
+        """
+        for key, remaining in journal.load_active().items():
+            if key == SYSTEM_BLOCK_KEY:
+                self._timer.restore_block(remaining)
+            elif key.startswith(LOCKOUT_KEY_PREFIX):
+                self._login_attempts.restore_lockout(key[len(LOCKOUT_KEY_PREFIX) :], remaining)
+
+        self._timer.set_journal(journal)
+        self._login_attempts.set_journal(journal)
+
     @classmethod
     def get_instance(cls):
         """Retorna a instância singleton do SessionManager"""
@@ -68,21 +171,21 @@ class SessionManager:
 
     def set_current_user(self, user):
         """Define o usuário atual da sessão"""
-        self._current_user = user
-        if user:
-            self._last_activity = datetime.now()
-            self._start_timeout_timer()
-        else:
-            self._stop_timeout_timer()
-            self._last_activity = None
+        with self._state_lock:
+            if user:
+                self._swap(user=user, last_activity=datetime.now())
+                self._start_timeout_timer()
+            else:
+                self._stop_timeout_timer()
+                self._swap(user=user, last_activity=None)
 
     def get_current_user(self):
         """Retorna o usuário atual da sessão"""
-        return self._current_user
+        return self._state.user
 
     def is_logged_in(self):
         """Verifica se há um usuário logado"""
-        return self._current_user is not None
+        return self._state.user is not None
 
     def logout(self):
         """Faz logout do usuário atual"""
@@ -90,85 +193,106 @@ class SessionManager:
 
     def update_activity(self):
         """Atualiza o timestamp da última atividade e reinicia timer"""
-        if self._current_user:
-            self._last_activity = datetime.now()
-            self._stop_timeout_timer()
-            self._start_timeout_timer()
+        if not self._state.user:
+            return
+        with self._state_lock:
+            if self._state.user:
+                self._swap(last_activity=datetime.now())
+                self._start_timeout_timer()
 
     update_last_activity = update_activity  # Alias para compatibilidade
 
     def is_admin(self):
         """Verifica se o usuário atual é administrador"""
-        return self._current_user and self._current_user.get("tipo") == "administrador"
+        state = self._state
+        return state.user and state.tipo == "administrador"
 
     def is_tecnico(self):
         """Verifica se o usuário atual é técnico"""
-        if self._current_user is None:
-            return False
-        return self._current_user.get("tipo") == "tecnico"
+        return self._state.tipo == "tecnico"
 
     def get_user_id(self):
         """Obtém o ID do usuário atualmente logado"""
-        if self._current_user and "id" in self._current_user:
-            return self._current_user["id"]
-        return None
+        return self._state.user_id
 
     # ==================== Timeout de Sessão ====================
 
+    @staticmethod
+    def _remaining_seconds(state: SessionSnapshot) -> float:
+        """Segundos até a expiração do snapshot (sem usuário: 0)"""
+        if not state.user or not state.last_activity:
+            return 0.0
+        elapsed = datetime.now() - state.last_activity
+        return (state.timeout_minutes * 60) - elapsed.total_seconds()
+
     def is_session_expired(self):
         """Verifica se a sessão expirou por inatividade"""
-        if not self._current_user or not self._last_activity:
+        state = self._state
+        if not state.user or not state.last_activity:
             return False
+        return self._remaining_seconds(state) < 0
 
-        time_since_activity = datetime.now() - self._last_activity
-        return time_since_activity.total_seconds() > (self._session_timeout * 60)
-
-    def _start_timeout_timer(self):
-        """Inicia o timer de timeout da sessão"""
-        self._stop_timeout_timer()
+    def _start_timeout_timer(self, delay: Optional[float] = None):
+        """Inicia (ou adia) o prazo de timeout da sessão"""
+        with self._state_lock:
+            if not self._state.user:
+                self._stop_timeout_timer()
+                return
 
-        if self._current_user:
-            self._timeout_timer = threading.Timer(self._session_timeout * 60, self._expire_session)
-            self._timeout_timer.start()
+            if delay is None:
+                delay = self._state.timeout_minutes * 60
+            timer = self._timeout_timer
+            if timer is None or not timer.reschedule(delay):
+                self._timeout_timer = get_scheduler().call_later(delay, self._expire_session)
 
     def _stop_timeout_timer(self):
         """Para o timer de timeout"""
-        if self._timeout_timer:
-            self._timeout_timer.cancel()
-            self._timeout_timer = None
+        with self._state_lock:
+            if self._timeout_timer:
+                self._timeout_timer.cancel()
+                self._timeout_timer = None
 
     def _expire_session(self) -> None:
         """Expira a sessão por inatividade"""
-        if self._current_user:
-            user_id = self._current_user.get("id")
+        with self._state_lock:
+            if self._timeout_timer is not None and not self._timeout_timer.active:
+                self._timeout_timer = None
+
+            state = self._state
+            if not state.user:
+                return
+
+            remaining = self._remaining_seconds(state)
+            if remaining > 0:
+                # Atividade chegou enquanto o prazo disparava: reagenda
+                self._start_timeout_timer(remaining)
+                return
+
+            self._stop_timeout_timer()
+            self._swap(user=None, last_activity=None)
 
-            if self._audit_callback:
-                try:
-                    self._audit_callback(
-                        user_id, "SESSAO_EXPIRADA", "SESSOES", {"motivo": "timeout_inatividade"}
-                    )
-                except Exception as e:
-                    logger.error(f"Error logging session expiration: {e}")
+        user_id = state.user_id
+        if self._audit_callback:
+            try:
+                self._audit_callback(
+                    user_id, "SESSAO_EXPIRADA", "SESSOES", {"motivo": "timeout_inatividade"}
+                )
+            except Exception as e:
+                logger.error(f"Error logging session expiration: {e}")
 
-            logger.info(f"Session expired for user {user_id}")
-            self._current_user = None
-            self._last_activity = None
+        logger.info(f"Session expired for user {user_id}")
 
     def get_session_remaining_time(self):
         """Retorna tempo restante da sessão em minutos"""
-        if not self._current_user or not self._last_activity:
-            return 0
-
-        elapsed = datetime.now() - self._last_activity
-        remaining_seconds = (self._session_timeout * 60) - elapsed.total_seconds()
-        return max(0, int(remaining_seconds / 60))
+        return max(0, int(self._remaining_seconds(self._state) / 60))
 
     def set_session_timeout(self, minutes):
         """Define o timeout da sessão em minutos"""
         if self.is_admin():
-            self._session_timeout = minutes
-            if self._current_user:
-                self._start_timeout_timer()
+            with self._state_lock:
+                self._swap(timeout_minutes=minutes)
+                if self._state.user:
+                    self._start_timeout_timer()
             return True
         return False
 
@@ -184,9 +308,7 @@ class SessionManager:
 
     def block_for_minutes(self, minutes=5):
         """Bloqueia o sistema por um número específico de minutos"""
-        if not (
-            self.is_admin() or (self._current_user and self._current_user.get("tipo") == "vendedor")
-        ):
+        if not (self.is_admin() or (self._state.user and self._state.tipo == "vendedor")):
             return False
         if not self._timer.is_enabled():
             return False
@@ -255,12 +377,15 @@ class SessionManager:
 
     def cleanup(self) -> None:
         """Limpa a sessão e para timers"""
-        self._stop_timeout_timer()
+        with self._state_lock:
+            self._stop_timeout_timer()
+            state = self._state
+            self._swap(user=None, last_activity=None)
 
-        if self._current_user and self._audit_callback:
+        if state.user and self._audit_callback:
             try:
                 self._audit_callback(
-                    self._current_user.get("id"),
+                    state.user_id,
                     "SESSION_CLEANUP",
                     "SESSOES",
                     {"details": "Sessão encerrada via cleanup"},
@@ -268,7 +393,5 @@ class SessionManager:
             except Exception as e:
                 logger.debug(f"Could not log cleanup: {e}")
 
-        self._current_user = None
-        self._last_activity = None
-        self._timeout_timer = None
-        self._timer.clear_block()
+        # Bloqueio persistido continua valendo no próximo início
+        self._timer.clear_block(persist=False)
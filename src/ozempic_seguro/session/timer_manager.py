@@ -1,8 +1,15 @@
 """
 Gerenciador de timer e bloqueio do sistema.
 """
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from ..core.logger import logger
+from ..core.scheduler import ScheduledTask, get_scheduler
+
+# Chave do bloqueio do sistema no diário de estado
+SYSTEM_BLOCK_KEY = "system_block"
 
 
 class TimerManager:
@@ -14,9 +21,24 @@ class TimerManager:
     - Gerenciar estado do timer (ativado/desativado)
     """
 
-    def __init__(self):
+    def __init__(self, on_expire: Optional[Callable[[], None]] = None):
         self._blocked_until: Optional[datetime] = None
         self._timer_enabled: bool = True
+        self._expiry_task: Optional[ScheduledTask] = None
+        self._on_expire = on_expire
+        # Diário de estado (save/delete); None mantém o bloqueio só em memória
+        self._journal: Optional[Any] = None
+
+    def set_journal(self, journal: Optional[Any]) -> None:
+        """Define o diário onde o bloqueio é persistido a cada mudança"""
+        self._journal = journal
+
+    def restore_block(self, remaining_seconds: float) -> None:
+        """Restaura um bloqueio lido do diário na inicialização"""
+        if remaining_seconds <= 0:
+            return
+        self._blocked_until = datetime.now() + timedelta(seconds=remaining_seconds)
+        self._schedule_expiry(remaining_seconds)
 
     def is_blocked(self) -> bool:
         """Verifica se o sistema está bloqueado"""
@@ -46,11 +68,57 @@ class TimerManager:
             return False
 
         self._blocked_until = datetime.now() + timedelta(minutes=minutes)
+        self._schedule_expiry(minutes * 60)
+        self._persist(time.time() + minutes * 60)
         return True
 
-    def clear_block(self) -> None:
-        """Remove o bloqueio do sistema"""
+    def clear_block(self, persist: bool = True) -> None:
+        """
+        Remove o bloqueio do sistema.
+
+        Args:
+            persist: False apenas descarta o estado em memória (encerramento),
+                mantendo o bloqueio no diário para o próximo início
+        """
+        had_block = self._blocked_until is not None
+        self._blocked_until = None
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
+        if persist and had_block:
+            self._persist(None)
+
+    def _persist(self, expires_at: Optional[float]) -> None:
+        """Grava (ou remove, se None) o prazo do bloqueio no diário"""
+        if self._journal is None:
+            return
+        try:
+            if expires_at is None:
+                self._journal.delete(SYSTEM_BLOCK_KEY)
+            else:
+                self._journal.save(SYSTEM_BLOCK_KEY, expires_at)
+        except Exception as e:
+            logger.error(f"Erro ao persistir bloqueio do sistema: {e}")
+
+    def _schedule_expiry(self, seconds: float) -> None:
+        """Agenda (ou move) a expiração do bloqueio no agendador compartilhado"""
+        if self._expiry_task is None or not self._expiry_task.reschedule(seconds):
+            self._expiry_task = get_scheduler().call_later(seconds, self._expire_block)
+
+    def _expire_block(self) -> None:
+        """Libera o bloqueio quando o prazo vence"""
+        if self._blocked_until is None:
+            return
+
+        remaining = (self._blocked_until - datetime.now()).total_seconds()
+        if remaining > 0:
+            # Relógio de parede atrás do monotônico: tenta de novo no prazo
+            self._schedule_expiry(remaining)
+            return
+
         self._blocked_until = None
+        if self._on_expire:
+            self._on_expire()
 
     def set_enabled(self, enabled: bool) -> None:
         """Ativa ou desativa a função de timer"""
@@ -9,16 +9,32 @@ Este pacote organiza os componentes em módulos separados por funcionalidade:
 - keyboard: Teclado virtual
 - common: Componentes comuns (Header, ImageCache)
 - loading: Overlays de carregamento e splash screen
+
+Os submódulos são importados sob demanda (``__getattr__``): importar um
+componente não carrega os demais (ex.: gavetas, que traz os serviços).
 """
+from importlib import import_module
 
-# Importações para manter compatibilidade com código existente
-from .common import Header, ImageCache, MainButton
-from .buttons import ModernButton, VoltarButton, FinalizarSessaoButton
-from .dialogs import ModernConfirmDialog, ToastNotification
-from .layouts import ResponsiveFrame, ResponsiveButtonGrid
-from .gavetas import GavetaButton, GavetaButtonGrid
-from .keyboard import TecladoVirtual
-from .loading import LoadingOverlay, SplashScreen, TransitionOverlay
+# Nome exportado -> submódulo que o define
+_LAZY_EXPORTS = {
+    "Header": "common",
+    "ImageCache": "common",
+    "MainButton": "common",
+    "ModernButton": "buttons",
+    "VoltarButton": "buttons",
+    "FinalizarSessaoButton": "buttons",
+    "ModernConfirmDialog": "dialogs",
+    "ToastNotification": "dialogs",
+    "ResponsiveFrame": "layouts",
+    "ResponsiveButtonGrid": "layouts",
+    "GavetaButton": "gavetas",
+    "GavetaButtonGrid": "gavetas",
+    "TecladoVirtual": "keyboard",
+    "LoadingOverlay": "loading",
+    "SplashScreen": "loading",
+    "TransitionOverlay": "loading",
+    "BackgroundLoader": "loading",
+}
 
 __all__ = [
     # Common
@@ -44,4 +60,18 @@ __all__ = [
     "LoadingOverlay",
     "SplashScreen",
     "TransitionOverlay",
+    "BackgroundLoader",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Próximos acessos não passam por aqui
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,8 +2,8 @@
 Componentes de botões: ModernButton, VoltarButton, FinalizarSessaoButton
 """
 import customtkinter
-from PIL import Image
-import os
+
+from .image_atlas import atlas_image
 
 
 class ModernButton(customtkinter.CTkButton):
@@ -89,11 +89,7 @@ class VoltarButton:
         self.frame = customtkinter.CTkFrame(master, fg_color="transparent")
         self.frame.place(relx=0.5, rely=0.88, anchor="center")
 
-        voltar_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..", "assets", "botao_voltar.png")
-        )
-
-        self.elipse_img = customtkinter.CTkImage(Image.open(voltar_path), size=(40, 40))
+        self.elipse_img = atlas_image("botao_voltar.png", (40, 40))
 
         self.btn_voltar = customtkinter.CTkButton(
             self.frame,
@@ -115,11 +111,7 @@ class FinalizarSessaoButton:
         self.frame = customtkinter.CTkFrame(master, fg_color="transparent")
         self.frame.place(relx=0.5, rely=0.88, anchor="center")
 
-        elipse_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..", "assets", "elipse.png")
-        )
-
-        self.elipse_img = customtkinter.CTkImage(Image.open(elipse_path), size=(40, 40))
+        self.elipse_img = atlas_image("elipse.png", (40, 40))
 
         self.btn_finalizar = customtkinter.CTkButton(
             self.frame,
@@ -2,8 +2,8 @@
 Componentes comuns: Header, ImageCache, MainButton
 """
 import customtkinter
-from PIL import Image
-import os
+
+from .image_atlas import atlas_image
 
 
 class ImageCache:
@@ -15,21 +15,13 @@ class ImageCache:
     @staticmethod
     def get_logo():
         if ImageCache._logo_img is None:
-            logo_path = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..", "assets", "logo.jpg")
-            )
-            imagem = Image.open(logo_path)
-            ImageCache._logo_img = customtkinter.CTkImage(imagem, size=(60, 60))
+            ImageCache._logo_img = atlas_image("logo.jpg", (60, 60))
         return ImageCache._logo_img
 
     @staticmethod
     def get_digital():
         if ImageCache._digital_img is None:
-            digital_path = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..", "assets", "digital.png")
-            )
-            imagem = Image.open(digital_path)
-            ImageCache._digital_img = customtkinter.CTkImage(imagem, size=(70, 70))
+            ImageCache._digital_img = atlas_image("digital.png", (70, 70))
         return ImageCache._digital_img
 
 
@@ -3,43 +3,28 @@ Componentes de gavetas: GavetaButton, GavetaButtonGrid
 """
 import customtkinter
 from tkinter import messagebox
-from PIL import Image
-import os
 
-from ...services.gaveta_service import GavetaService
+from ...services.service_factory import ServiceFactory
 from ...services.timer_control_service import get_timer_control_service
 from ...services.auth_service import get_auth_service
+from .image_atlas import atlas_image
 
 
 # Cache global de imagens de gavetas
 class _GavetaImageCache:
     _gaveta_aberta = None
     _gaveta_fechada = None
-    _assets_path = None
-
-    @classmethod
-    def _get_assets_path(cls):
-        if cls._assets_path is None:
-            cls._assets_path = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..", "assets")
-            )
-        return cls._assets_path
 
     @classmethod
     def get_gaveta_aberta(cls):
         if cls._gaveta_aberta is None:
-            cls._gaveta_aberta = customtkinter.CTkImage(
-                Image.open(os.path.join(cls._get_assets_path(), "gaveta.png")), size=(120, 120)
-            )
+            cls._gaveta_aberta = atlas_image("gaveta.png", (120, 120))
         return cls._gaveta_aberta
 
     @classmethod
     def get_gaveta_fechada(cls):
         if cls._gaveta_fechada is None:
-            cls._gaveta_fechada = customtkinter.CTkImage(
-                Image.open(os.path.join(cls._get_assets_path(), "gaveta_black.png")),
-                size=(120, 120),
-            )
+            cls._gaveta_fechada = atlas_image("gaveta_black.png", (120, 120))
         return cls._gaveta_fechada
 
 
@@ -50,7 +35,7 @@ class GavetaButton:
         self.frame = customtkinter.CTkFrame(master, fg_color="transparent")
         self.frame.pack(expand=True, fill="both")
 
-        self._gaveta_service = GavetaService.get_instance()
+        self._gaveta_service = ServiceFactory.get_gaveta_service()
         self.timer_service = get_timer_control_service()
         self.auth_service = get_auth_service()
         self.tipo_usuario = tipo_usuario
@@ -0,0 +1,258 @@
+"""
+Atlas de imagens pré-escaladas (gavetas, cabeçalho, telas iniciais).
+
+``scripts/build_assets.py`` redimensiona cada imagem de ``assets/`` para os
+tamanhos usados na interface em cada escala de DPI comum e grava os pixels
+RGBA crus, em sequência, em ``assets/atlas/atlas.bin`` (índice em
+``atlas.json``). Em tempo de execução o arquivo é mapeado em memória e cada
+variante vira uma ``Image`` sem decodificação nem reamostragem.
+
+Sem atlas (ou com a imagem de origem alterada depois do build, conferida
+por tamanho e SHA-256 do conteúdo) as imagens são carregadas e
+redimensionadas como antes. A conferência roda uma vez, na etapa ``images``
+do pipeline de inicialização, fora da thread do Tk.
+
+Uso:
+    imagem = atlas_image("gaveta.png", (120, 120))
+"""
+import hashlib
+import json
+import mmap
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import customtkinter
+from PIL import Image, ImageTk
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets"))
+ATLAS_DIR = os.path.join(ASSETS_DIR, "atlas")
+ATLAS_VERSION = 2
+
+# Imagens e tamanhos lógicos usados pela interface
+ATLAS_SPRITES: Tuple[Tuple[str, Tuple[int, int]], ...] = (
+    ("gaveta.png", (120, 120)),
+    ("gaveta_black.png", (120, 120)),
+    ("logo.jpg", (60, 60)),
+    ("logo.jpg", (300, 300)),
+    ("digital.png", (70, 70)),
+    ("dedo.png", (300, 300)),
+    ("botao_voltar.png", (40, 40)),
+    ("elipse.png", (40, 40)),
+)
+ATLAS_SCALES: Tuple[float, ...] = (1.0, 1.25, 1.5, 1.75, 2.0)
+
+_ALIGNMENT = 64
+Size = Tuple[int, int]
+
+
+def load_image(path: str) -> Image.Image:
+    """Abre e decodifica a imagem já (Image.open é preguiçoso); seguro fora da thread do Tk"""
+    imagem = Image.open(path)
+    imagem.load()
+    return imagem
+
+
+def source_digest(path: str) -> str:
+    """SHA-256 do arquivo de origem (detecta edições que mantêm o tamanho)"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def scaled_size(size: Size, scale: float) -> Size:
+    """Mesmo arredondamento do CTkImage para o tamanho escalado"""
+    return round(size[0] * scale), round(size[1] * scale)
+
+
+def build_atlas(
+    source_dir: str = ASSETS_DIR,
+    output_dir: str = ATLAS_DIR,
+    sprites: Iterable[Tuple[str, Size]] = ATLAS_SPRITES,
+    scales: Sequence[float] = ATLAS_SCALES,
+) -> Dict[str, List[Size]]:
+    """
+    Gera ``atlas.bin`` e ``atlas.json`` em ``output_dir``.
+
+    Imagens ausentes em ``source_dir`` são ignoradas.
+
+    Returns:
+        Variantes gravadas por imagem
+    """
+    wanted: Dict[str, List[Size]] = {}
+    for name, size in sprites:
+        variants = wanted.setdefault(name, [])
+        for scale in scales:
+            pixel_size = scaled_size(size, scale)
+            if pixel_size not in variants:
+                variants.append(pixel_size)
+
+    os.makedirs(output_dir, exist_ok=True)
+    bin_path = os.path.join(output_dir, "atlas.bin")
+    index_path = os.path.join(output_dir, "atlas.json")
+
+    index: Dict[str, dict] = {}
+    built: Dict[str, List[Size]] = {}
+    offset = 0
+    with open(bin_path + ".tmp", "wb") as out:
+        for name, variants in wanted.items():
+            source = os.path.join(source_dir, name)
+            if not os.path.exists(source):
+                continue
+            original = load_image(source).convert("RGBA")
+            entry = {
+                "source_size": os.path.getsize(source),
+                "source_sha256": source_digest(source),
+                "variants": {},
+            }
+            for width, height in sorted(variants):
+                pixels = original.resize((width, height), Image.Resampling.LANCZOS).tobytes()
+                padding = -offset % _ALIGNMENT
+                out.write(b"\0" * padding)
+                offset += padding
+                out.write(pixels)
+                entry["variants"][f"{width}x{height}"] = [offset, width, height]
+                offset += len(pixels)
+            index[name] = entry
+            built[name] = sorted(variants)
+
+    if not index:
+        os.remove(bin_path + ".tmp")
+        return built
+
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"version": ATLAS_VERSION, "sprites": index}, f, indent=2)
+    # Índice por último: um build interrompido não deixa índice apontando para lixo
+    os.replace(bin_path + ".tmp", bin_path)
+    os.replace(index_path + ".tmp", index_path)
+    return built
+
+
+class ImageAtlas:
+    """Leitor do atlas, com os pixels mapeados em memória"""
+
+    def __init__(self, directory: str = ATLAS_DIR, source_dir: str = ASSETS_DIR):
+        with open(os.path.join(directory, "atlas.json"), encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != ATLAS_VERSION:
+            raise ValueError(f"Versão do atlas incompatível: {index.get('version')}")
+        self._sprites: Dict[str, dict] = index["sprites"]
+        self._source_dir = source_dir
+        self._fresh: Dict[str, bool] = {}
+        with open(os.path.join(directory, "atlas.bin"), "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, name: str, size: Size) -> Optional[Image.Image]:
+        """Variante com ``size`` pixels (None se não existe ou está desatualizada)"""
+        entry = self._sprites.get(name)
+        if entry is None or not self._is_fresh(name, entry):
+            return None
+        variant = entry["variants"].get(f"{size[0]}x{size[1]}")
+        if variant is None:
+            return None
+        return self._image(*variant)
+
+    def largest(self, name: str) -> Optional[Image.Image]:
+        """Maior variante gravada (base para escalas fora do atlas)"""
+        entry = self._sprites.get(name)
+        if entry is None or not self._is_fresh(name, entry):
+            return None
+        offset, width, height = max(entry["variants"].values(), key=lambda v: v[1] * v[2])
+        return self._image(offset, width, height)
+
+    def verify_sources(self) -> None:
+        """Confere todas as imagens de origem de uma vez (lê e calcula o SHA-256)"""
+        for name, entry in self._sprites.items():
+            self._is_fresh(name, entry)
+
+    def _image(self, offset: int, width: int, height: int) -> Image.Image:
+        view = memoryview(self._map)[offset : offset + width * height * 4]
+        return Image.frombuffer("RGBA", (width, height), view, "raw", "RGBA", 0, 1)
+
+    def _is_fresh(self, name: str, entry: dict) -> bool:
+        fresh = self._fresh.get(name)
+        if fresh is None:
+            source = os.path.join(self._source_dir, name)
+            try:
+                # Tamanho primeiro: evita ler o arquivo quando já difere
+                fresh = os.path.getsize(source) == entry["source_size"] and (
+                    source_digest(source) == entry["source_sha256"]
+                )
+            except OSError:
+                fresh = True  # Instalação só com o atlas
+            self._fresh[name] = fresh
+        return fresh
+
+
+class AtlasImage(customtkinter.CTkImage):
+    """
+    CTkImage que busca cada escala pronta no atlas em vez de redimensionar.
+
+    Sobrescreve o par privado ``_get_scaled_light_photo_image`` /
+    ``_get_scaled_dark_photo_image`` do CTkImage; depende da versão fixada
+    (customtkinter==5.2.2 em requirements.txt e pyproject.toml). Não há
+    imagem escura: os dois modos usam as mesmas variantes do atlas.
+    """
+
+    def __init__(self, name: str, atlas: ImageAtlas, base: Image.Image, size: Size):
+        super().__init__(light_image=base, size=size)
+        self._atlas_name = name
+        self._atlas = atlas
+
+    def scaled_image(self, size: Size) -> Image.Image:
+        """Imagem com ``size`` pixels; reamostra a maior variante só se faltar no atlas"""
+        image = self._atlas.get(self._atlas_name, size)
+        if image is None:
+            image = (self._atlas.largest(self._atlas_name) or self._light_image).resize(
+                size, Image.Resampling.LANCZOS
+            )
+        return image
+
+    def _get_scaled_light_photo_image(self, scaled_size: Size) -> "ImageTk.PhotoImage":
+        photo = self._scaled_light_photo_images.get(scaled_size)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.scaled_image(scaled_size))
+            self._scaled_light_photo_images[scaled_size] = photo
+        return photo
+
+    def _get_scaled_dark_photo_image(self, scaled_size: Size) -> "ImageTk.PhotoImage":
+        return self._get_scaled_light_photo_image(scaled_size)
+
+
+_atlas: Optional[ImageAtlas] = None
+_atlas_loaded = False
+_images: Dict[Tuple[str, Size], customtkinter.CTkImage] = {}
+_lock = threading.Lock()
+
+
+def get_atlas() -> Optional[ImageAtlas]:
+    """Atlas da aplicação (None se ainda não foi gerado)"""
+    global _atlas, _atlas_loaded
+    with _lock:
+        if not _atlas_loaded:
+            _atlas_loaded = True
+            try:
+                _atlas = ImageAtlas()
+            except (OSError, ValueError, KeyError):
+                _atlas = None
+        return _atlas
+
+
+def atlas_image(name: str, size: Size) -> customtkinter.CTkImage:
+    """
+    CTkImage compartilhada para ``assets/<name>`` exibida em ``size``.
+
+    Usa o atlas quando disponível; senão decodifica o arquivo de origem.
+    """
+    key = (name, tuple(size))
+    image = _images.get(key)
+    if image is not None:
+        return image
+
+    atlas = get_atlas()
+    base = atlas.get(name, key[1]) if atlas is not None else None
+    if base is not None:
+        image = AtlasImage(name, atlas, base, key[1])
+    else:
+        image = customtkinter.CTkImage(load_image(os.path.join(ASSETS_DIR, name)), size=key[1])
+    with _lock:
+        return _images.setdefault(key, image)
@@ -1,10 +1,19 @@
 """
 Componentes de Loading/Splash Screen.
 
-Fornece overlay de carregamento para esconder o render das telas.
+Fornece overlay de carregamento para esconder o render das telas e
+carregador em background para consultas fora da thread do Tk.
 """
+import contextlib
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
 import customtkinter
-from typing import Optional, Callable
+
+from ...core.logger import logger
 
 
 class LoadingOverlay(customtkinter.CTkFrame):
@@ -270,3 +279,190 @@ class TransitionOverlay(customtkinter.CTkFrame):
             self.after(step_duration, lambda: step(new_alpha, remaining - 1))
 
         step(start, steps)
+
+
+@dataclass
+class _PendingLoad:
+    """Requisição em andamento no BackgroundLoader"""
+
+    generation: int
+    future: Future
+    on_success: Callable[[Any], None]
+    on_error: Optional[Callable[[BaseException], None]]
+
+
+class BackgroundLoader:
+    """
+    Executa consultas fora da thread do Tk e entrega os resultados na thread
+    da interface através de polling com ``after()``.
+
+    Requisições com a mesma chave substituem as anteriores: resultados
+    obsoletos são descartados. Ao destruir o widget, tudo é cancelado.
+
+    Uso:
+        loader = BackgroundLoader(frame, overlay=LoadingOverlay(frame))
+        loader.submit("logs", lambda: service.get_logs(), on_success=preencher)
+    """
+
+    POLL_INTERVAL_MS = 50
+    MAX_WORKERS = 2
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, widget, overlay: Optional[LoadingOverlay] = None):
+        self._widget = widget
+        self._overlay = overlay
+        self._results: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._pending: Dict[str, _PendingLoad] = {}
+        self._generations: Dict[str, int] = {}
+        self._poll_id: Optional[str] = None
+        self._overlay_visible = False
+        self._closed = False
+
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Pool compartilhado entre todas as telas"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.MAX_WORKERS, thread_name_prefix="ui-loader"
+                )
+            return cls._executor
+
+    @property
+    def is_loading(self) -> bool:
+        """Indica se há requisições pendentes"""
+        return bool(self._pending)
+
+    def submit(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        message: str = "Carregando...",
+    ) -> None:
+        """
+        Agenda ``func`` em uma thread de trabalho.
+
+        Args:
+            key: Identificador da requisição (substitui pendente com a mesma chave)
+            func: Função executada fora da thread do Tk (não deve tocar em widgets)
+            on_success: Chamado na thread do Tk com o resultado
+            on_error: Chamado na thread do Tk com a exceção (padrão: apenas loga)
+            message: Mensagem exibida no overlay
+        """
+        if self._closed:
+            return
+
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            previous.future.cancel()
+
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+
+        future = self._get_executor().submit(func)
+        self._pending[key] = _PendingLoad(generation, future, on_success, on_error)
+        future.add_done_callback(lambda f: self._results.put((key, generation, f)))
+
+        self._show_overlay(message)
+        self._schedule_poll()
+
+    def report_progress(self, value: float) -> None:
+        """Atualiza o progresso do overlay (pode ser chamado de qualquer thread)"""
+        self._results.put((None, value, None))
+
+    def cancel(self, key: Optional[str] = None) -> None:
+        """Cancela uma requisição (ou todas, se ``key`` for None)"""
+        keys = [key] if key is not None else list(self._pending)
+        for k in keys:
+            pending = self._pending.pop(k, None)
+            if pending is not None:
+                pending.future.cancel()
+                self._generations[k] = pending.generation + 1
+        if not self._pending:
+            self._hide_overlay()
+
+    def close(self) -> None:
+        """Cancela tudo e interrompe o polling"""
+        if self._closed:
+            return
+        self.cancel()
+        self._closed = True
+        if self._poll_id is not None:
+            with contextlib.suppress(Exception):
+                self._widget.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _on_destroy(self, event=None) -> None:
+        self.close()
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self._widget.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Entrega na thread do Tk os resultados prontos"""
+        self._poll_id = None
+        if self._closed:
+            return
+
+        while True:
+            try:
+                key, generation, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if key is None:
+                self._set_progress(generation)
+                continue
+
+            pending = self._pending.get(key)
+            if pending is None or pending.generation != generation or future.cancelled():
+                continue  # Resultado obsoleto
+            del self._pending[key]
+            self._deliver(key, pending, future)
+
+            if self._closed:
+                return
+
+        if self._pending:
+            self._schedule_poll()
+        else:
+            self._hide_overlay()
+
+    def _deliver(self, key: str, pending: _PendingLoad, future: Future) -> None:
+        error = future.exception()
+        try:
+            if error is None:
+                pending.on_success(future.result())
+            elif pending.on_error is not None:
+                pending.on_error(error)
+            else:
+                logger.error(f"Erro ao carregar '{key}': {error}")
+        except Exception as e:
+            logger.error(f"Erro ao exibir resultado de '{key}': {e}")
+
+    def _show_overlay(self, message: str) -> None:
+        if self._overlay is None:
+            return
+        if self._overlay_visible:
+            self._overlay.message_label.configure(text=message)
+            return
+        self._overlay_visible = True
+        self._overlay.show(message)
+
+    def _hide_overlay(self) -> None:
+        if self._overlay is None or not self._overlay_visible:
+            return
+        self._overlay_visible = False
+        with contextlib.suppress(Exception):  # Widget já destruído
+            self._overlay.hide()
+
+    def _set_progress(self, value: float) -> None:
+        if self._overlay is not None and self._overlay_visible:
+            self._overlay.set_progress(value)
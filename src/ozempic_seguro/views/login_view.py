@@ -1,13 +1,10 @@
 import customtkinter
 import tkinter as tk
 from tkinter import messagebox
-from .pages_adm.painel_administrador_view import PainelAdministradorFrame
-from .components import Header, VoltarButton, ModernButton
+from .components import Header, VoltarButton, ModernButton, BackgroundLoader, LoadingOverlay
 from ..services.auth_service import get_auth_service, UserPanel
 from ..config import UIConfig
-from .repositor_view import RepositorFrame
-from .vendedor_view import VendedorFrame
-from .tecnico_view import TecnicoFrame
+from ..core.logger import logger
 
 
 class LoginFrame(customtkinter.CTkFrame):
@@ -16,12 +13,16 @@ class LoginFrame(customtkinter.CTkFrame):
         self.show_iniciar_callback = show_iniciar_callback
         self.auth_service = get_auth_service()
         self.timer_job = None
+        self._autenticando = False
         # Não fazer pack aqui - NavigationController gerencia
         self.criar_topo()
         self.criar_interface_login()
         self.criar_teclado_numerico()
         self.criar_botao_voltar()
 
+        # bcrypt roda fora da thread do Tk para não travar a tela
+        self._loader = BackgroundLoader(self, overlay=LoadingOverlay(self))
+
     def criar_topo(self):
         Header(self, "Login")
 
@@ -123,15 +124,32 @@ class LoginFrame(customtkinter.CTkFrame):
         ).pack(side="left", padx=5)
 
     def verificar_login(self):
-        """Verifica credenciais usando AuthService"""
+        """Verifica credenciais usando AuthService em background"""
+        if self._autenticando:
+            return  # Evita envio duplo enquanto a verificação está em andamento
+
         usuario = self.usuario_entry.get().strip()
         senha = self.senha_entry.get()
 
-        # Usa AuthService para toda a lógica de login
-        result = self.auth_service.login(usuario, senha)
+        self._autenticando = True
+        self._loader.submit(
+            "login",
+            lambda: self.auth_service.login(usuario, senha, start_session=False),
+            on_success=lambda result: self._on_login_result(usuario, result),
+            on_error=self._on_login_error,
+            message="Verificando credenciais...",
+        )
+
+    def _on_login_result(self, usuario, result):
+        """Trata o resultado do login na thread do Tk"""
+        self._autenticando = False
 
         if result.success:
-            # Sucesso - abre painel apropriado
+            # Sessão só troca aqui, na thread do Tk: tela destruída ou login
+            # cancelado não chegam a este callback
+            if not self.winfo_exists():
+                return
+            self.auth_service.start_session(result.user)
             self._abrir_painel(result.panel)
         else:
             # Falha - mostra mensagem de erro
@@ -144,6 +162,12 @@ class LoginFrame(customtkinter.CTkFrame):
             # Atualiza status visual
             self.atualizar_status_login()
 
+    def _on_login_error(self, error):
+        """Trata erro inesperado durante o login"""
+        self._autenticando = False
+        logger.error(f"Erro ao realizar login: {error}")
+        messagebox.showerror("Erro", "Não foi possível realizar o login. Tente novamente.")
+
     def _abrir_painel(self, panel: UserPanel):
         """Abre o painel apropriado baseado no tipo de usuário"""
         panel_handlers = {
@@ -161,18 +185,26 @@ class LoginFrame(customtkinter.CTkFrame):
 
     def abrir_painel_tecnico(self):
         """Abre o painel do técnico"""
+        from .tecnico_view import TecnicoFrame
+
         self.pack_forget()
         TecnicoFrame(self.master, finalizar_sessao_callback=self.show_iniciar_callback)
 
     def abrir_painel_vendedor(self):
+        from .vendedor_view import VendedorFrame
+
         self.pack_forget()
         VendedorFrame(self.master, finalizar_sessao_callback=self.show_iniciar_callback)
 
     def abrir_painel_repositor(self):
+        from .repositor_view import RepositorFrame
+
         self.pack_forget()
         RepositorFrame(self.master, finalizar_sessao_callback=self.show_iniciar_callback)
 
     def abrir_painel_administrador(self):
+        from .pages_adm.painel_administrador_view import PainelAdministradorFrame
+
         self.pack_forget()
         # Get the current user from AuthService
         usuario_logado = self.auth_service.get_current_user()
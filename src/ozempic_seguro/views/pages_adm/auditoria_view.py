@@ -1,7 +1,9 @@
+import json
 import customtkinter
 from tkinter import ttk
 from datetime import datetime, timedelta
 from ...services.audit_view_service import get_audit_view_service, AuditFilter
+from ..components import BackgroundLoader, LoadingOverlay
 from ...core.logger import logger
 
 
@@ -35,13 +37,16 @@ class AuditoriaFrame(customtkinter.CTkFrame):
         self.criar_topo()
         self.criar_filtros()
         self.criar_tabela()
-        self.carregar_dados()
         self.criar_botao_voltar()
 
         # Remover overlay após tudo estar pronto
         self.update_idletasks()
         self._overlay.destroy()
 
+        # Consultas rodam fora da thread do Tk
+        self._loader = BackgroundLoader(self, overlay=LoadingOverlay(self))
+        self.carregar_dados()
+
     def criar_topo(self):
         """Cria o cabeçalho da página"""
         # Frame para o cabeçalho
@@ -180,66 +185,64 @@ class AuditoriaFrame(customtkinter.CTkFrame):
         self.tree.bind("<Double-1>", self.mostrar_detalhes)
 
     def carregar_dados(self, aplicar_filtros=False):
-        """Carrega os dados da tabela de auditoria usando AuditViewService"""
-        # Limpar a árvore
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Criar filtro usando o serviço
+        """Carrega os dados da tabela de auditoria em background"""
+        # Filtros lidos na thread do Tk; a consulta roda no carregador
         filtro = AuditFilter(
             acao=self.filtro_acao.get(),
             data_inicio=self.filtro_data_inicio.get(),
             data_fim=self.filtro_data_fim.get(),
         )
 
-        try:
-            # Obter os registros de auditoria usando o serviço
-            result = self.audit_view_service.get_logs(filter=filtro)
-
-            # Preencher a tabela com os registros
-            for log_item in result.items:
-                # Formatar detalhes
-                detalhes = ""
-                if log_item.dados_novos:
-                    try:
-                        import json
-
-                        dados = (
-                            json.loads(log_item.dados_novos)
-                            if isinstance(log_item.dados_novos, str)
-                            else log_item.dados_novos
-                        )
-                        if isinstance(dados, dict):
-                            detalhes = ", ".join([f"{k}: {v}" for k, v in dados.items()])
-                    except Exception:
-                        detalhes = str(log_item.dados_novos)[:50]
-
-                # Inserir na árvore
-                self.tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        log_item.data_hora_display,
-                        log_item.usuario,
-                        log_item.acao_display,
-                        log_item.tabela,
-                        log_item.id_afetado or "",
-                        detalhes,
-                    ),
-                    tags=("linha",),
+        self._loader.submit(
+            "logs",
+            lambda: self._montar_linhas(self.audit_view_service.get_logs(filter=filtro)),
+            on_success=self._preencher_tabela,
+            on_error=lambda e: logger.error(f"Erro ao carregar dados de auditoria: {e}"),
+            message="Carregando registros...",
+        )
+
+    @staticmethod
+    def _montar_linhas(result):
+        """Converte os registros em valores da tabela (executa fora da thread do Tk)"""
+        linhas = []
+        for log_item in result.items:
+            # Formatar detalhes
+            detalhes = ""
+            if log_item.dados_novos:
+                try:
+                    dados = (
+                        json.loads(log_item.dados_novos)
+                        if isinstance(log_item.dados_novos, str)
+                        else log_item.dados_novos
+                    )
+                    if isinstance(dados, dict):
+                        detalhes = ", ".join([f"{k}: {v}" for k, v in dados.items()])
+                except Exception:
+                    detalhes = str(log_item.dados_novos)[:50]
+
+            linhas.append(
+                (
+                    log_item.data_hora_display,
+                    log_item.usuario,
+                    log_item.acao_display,
+                    log_item.tabela,
+                    log_item.id_afetado or "",
+                    detalhes,
                 )
+            )
+        return linhas
 
-            # Configurar tags para cores alternadas
-            self.tree.tag_configure("linha", background="white")
-            self.tree.tag_configure("linha_alternada", background="#f0f0f0")
+    def _preencher_tabela(self, linhas):
+        """Preenche a árvore com as linhas carregadas"""
+        self.tree.delete(*self.tree.get_children())
 
-            # Alternar cores das linhas
-            for i, item in enumerate(self.tree.get_children()):
-                tag = "linha_alternada" if i % 2 == 0 else "linha"
-                self.tree.item(item, tags=(tag,))
+        # Configurar tags para cores alternadas
+        self.tree.tag_configure("linha", background="white")
+        self.tree.tag_configure("linha_alternada", background="#f0f0f0")
 
-        except Exception as e:
-            logger.error(f"Erro ao carregar dados de auditoria: {e}")
+        for i, valores in enumerate(linhas):
+            tag = "linha_alternada" if i % 2 == 0 else "linha"
+            self.tree.insert("", "end", values=valores, tags=(tag,))
 
     def formatar_detalhes_resumido(self, registro):
         """Formata os detalhes do registro para exibição resumida"""
@@ -1,13 +1,27 @@
 """
 Tela de Diagnóstico - Mostruário de gavetas conectadas.
-Mostra status de até 8 gavetas (conectadas/vazias, abertas/fechadas, funcionamento).
+Mostra status de até 8 gavetas (conectadas/vazias, abertas/fechadas, funcionamento),
+a última manutenção do banco e os logs mais recentes mantidos em memória.
 """
+import logging
+from datetime import datetime
+
 import customtkinter
 from ..components import Header, VoltarButton
+from ...core.log_buffer import LogEntry, get_ring_buffer
+from ...repositories.maintenance import MaintenanceResult, get_maintenance
 
 
 class DiagnosticoFrame(customtkinter.CTkFrame):
     BG_COLOR = "#3B6A7D"
+    LOG_LIMIT = 50
+
+    # Filtros do painel de logs: rótulo -> nível mínimo
+    FILTROS_LOG = {
+        "Erros": logging.ERROR,
+        "Avisos": logging.WARNING,
+        "Todos": logging.NOTSET,
+    }
 
     def __init__(self, master, voltar_callback=None, *args, **kwargs):
         self.voltar_callback = voltar_callback
@@ -82,6 +96,12 @@ class DiagnosticoFrame(customtkinter.CTkFrame):
         # Legenda
         self.criar_legenda(content_frame)
 
+        # Manutenção do banco (checkpoint, optimize, vacuum)
+        self.criar_manutencao(content_frame)
+
+        # Logs recentes (buffer em memória)
+        self.criar_logs_recentes(content_frame)
+
     def criar_grid_gavetas(self, parent):
         """Cria o grid 2x4 de gavetas"""
         grid_frame = customtkinter.CTkFrame(parent, fg_color="transparent")
@@ -213,5 +233,88 @@ class DiagnosticoFrame(customtkinter.CTkFrame):
             )
             lbl_item.pack()
 
+    def criar_manutencao(self, parent):
+        """Cria o resumo da manutenção do banco em segundo plano"""
+        manutencao = get_maintenance()
+        resultados = {}
+        for resultado in manutencao.status():
+            resultados.setdefault(resultado.task, resultado)
+
+        linhas = [f"WAL: {manutencao.wal_size() / 1024:.0f} KB"]
+        linhas += [self.formatar_manutencao(r) for r in resultados.values()]
+        if not resultados:
+            linhas.append("Nenhuma manutenção desde a inicialização.")
+
+        manutencao_frame = customtkinter.CTkFrame(parent, fg_color="#f9f9f9", corner_radius=10)
+        manutencao_frame.pack(pady=(0, 10), padx=20, fill="x")
+
+        customtkinter.CTkLabel(
+            manutencao_frame,
+            text="Manutenção do banco",
+            font=("Arial", 12, "bold"),
+            text_color="#333333",
+        ).pack(anchor="w", padx=20, pady=(10, 0))
+        customtkinter.CTkLabel(
+            manutencao_frame,
+            text="\n".join(linhas),
+            font=("Consolas", 11),
+            text_color="#555555",
+            justify="left",
+        ).pack(anchor="w", padx=20, pady=(0, 10))
+
+    @staticmethod
+    def formatar_manutencao(resultado: MaintenanceResult) -> str:
+        """Formata o último resultado de uma tarefa de manutenção"""
+        hora = datetime.fromtimestamp(resultado.finished_at).strftime("%d/%m %H:%M:%S")
+        linha = (
+            f"{hora} | {resultado.task:<18} | {resultado.status:<11} | "
+            f"{resultado.duration_ms:.0f} ms"
+        )
+        return f"{linha} | {resultado.detail}" if resultado.detail else linha
+
+    def criar_logs_recentes(self, parent):
+        """Cria o painel com os logs mais recentes do buffer em memória"""
+        logs_frame = customtkinter.CTkFrame(parent, fg_color="#f9f9f9", corner_radius=10)
+        logs_frame.pack(pady=(0, 20), padx=20, fill="both", expand=True)
+
+        topo = customtkinter.CTkFrame(logs_frame, fg_color="transparent")
+        topo.pack(fill="x", padx=20, pady=(10, 5))
+
+        lbl_titulo = customtkinter.CTkLabel(
+            topo, text="Logs recentes", font=("Arial", 12, "bold"), text_color="#333333"
+        )
+        lbl_titulo.pack(side="left")
+
+        self.filtro_log = customtkinter.CTkSegmentedButton(
+            topo, values=list(self.FILTROS_LOG), command=self.atualizar_logs
+        )
+        self.filtro_log.set("Erros")
+        self.filtro_log.pack(side="right")
+
+        self.txt_logs = customtkinter.CTkTextbox(
+            logs_frame, height=140, font=("Consolas", 11), text_color="#333333"
+        )
+        self.txt_logs.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+        self.atualizar_logs("Erros")
+
+    def atualizar_logs(self, filtro):
+        """Recarrega o painel de logs com o filtro selecionado"""
+        entradas = get_ring_buffer().query(
+            min_level=self.FILTROS_LOG.get(filtro, logging.NOTSET), limit=self.LOG_LIMIT
+        )
+        linhas = [self.formatar_log(entrada) for entrada in entradas]
+
+        self.txt_logs.configure(state="normal")
+        self.txt_logs.delete("1.0", "end")
+        self.txt_logs.insert("1.0", "\n".join(linhas) or "Nenhum registro recente.")
+        self.txt_logs.configure(state="disabled")
+
+    @staticmethod
+    def formatar_log(entrada: LogEntry) -> str:
+        """Formata um registro do buffer em uma linha do painel"""
+        hora = datetime.fromtimestamp(entrada.created).strftime("%d/%m %H:%M:%S")
+        return f"{hora} | {entrada.levelname:<8} | {entrada.name} | {entrada.message}"
+
     def criar_botao_voltar(self):
         VoltarButton(self, self.voltar_callback)
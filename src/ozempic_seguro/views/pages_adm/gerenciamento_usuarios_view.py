@@ -1,6 +1,14 @@
 import tkinter
 import customtkinter
-from ..components import Header, VoltarButton, ModernButton, ModernConfirmDialog, ToastNotification
+from ..components import (
+    Header,
+    VoltarButton,
+    ModernButton,
+    ModernConfirmDialog,
+    ToastNotification,
+    BackgroundLoader,
+    LoadingOverlay,
+)
 from ...services.user_management_service import get_user_management_service
 from ...core.logger import logger
 
@@ -37,6 +45,10 @@ class GerenciamentoUsuariosFrame(customtkinter.CTkFrame):
         self.update_idletasks()
         self._overlay.destroy()
 
+        # Carregar dados iniciais (consulta fora da thread do Tk)
+        self._loader = BackgroundLoader(self, overlay=LoadingOverlay(self))
+        self.carregar_dados()
+
     def criar_topo(self):
         # Cabeçalho
         self.header = Header(self, "Gerenciamento de Usuários")
@@ -77,9 +89,6 @@ class GerenciamentoUsuariosFrame(customtkinter.CTkFrame):
         self.scrollable_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         self.scrollable_frame.columnconfigure(0, weight=1)
 
-        # Carregar dados iniciais
-        self.carregar_dados()
-
     def criar_cabecalhos(self):
         # Frame para os cabeçalhos
         cabecalho_frame = customtkinter.CTkFrame(
@@ -109,101 +118,104 @@ class GerenciamentoUsuariosFrame(customtkinter.CTkFrame):
             lbl.grid(row=0, column=col, padx=15, pady=8, sticky="ew")
 
     def carregar_dados(self):
+        # Obter usuários usando o serviço de gerenciamento (fora da thread do Tk)
+        self._loader.submit(
+            "usuarios",
+            self.management_service.get_all_users,
+            on_success=self._exibir_usuarios,
+            on_error=lambda e: logger.error(f"Erro ao carregar usuários: {e}"),
+            message="Carregando usuários...",
+        )
+
+    def _exibir_usuarios(self, usuarios):
         # Limpar frame existente
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
 
-        try:
-            # Obter usuários usando o serviço de gerenciamento
-            usuarios = self.management_service.get_all_users()
-
-            # Adicionar itens
-            for idx, user in enumerate(usuarios):
-                # Frame para uma linha da tabela
-                linha_frame = customtkinter.CTkFrame(
-                    self.scrollable_frame,
-                    fg_color="#f0f0f0" if idx % 2 == 0 else "#f8f8f8",
-                    corner_radius=8,
-                    height=50,
-                    border_width=1,
-                    border_color="#e0e0e0",
-                )
-                linha_frame.grid(row=idx, column=0, sticky="nsew", pady=2, padx=5)
-                linha_frame.grid_propagate(False)
-
-                # Armazenar dados do usuário para uso no clique (usando UserData)
-                linha_frame.dados_usuario = (
-                    user.id,
-                    user.username,
-                    user.nome_completo,
-                    user.tipo,
-                    user.ativo,
-                    user.data_criacao,
-                )
-
-                # Frame para o conteúdo da linha que preenche todo o espaço
-                conteudo_frame = customtkinter.CTkFrame(linha_frame, fg_color="transparent")
-                conteudo_frame.pack(fill="both", expand=True, padx=10, pady=8)
-
-                # Configurar grid do conteúdo
-                for i in range(3):
-                    conteudo_frame.columnconfigure(i, weight=1)
-
-                # Dados a serem exibidos (usando propriedades do UserData)
-                dados = [user.username, user.nome_completo, user.tipo_display]
-
-                # Adicionar os dados como labels dentro do frame
-                for col, texto in enumerate(dados):
-                    # Frame para cada célula que preenche o espaço disponível
-                    cell_frame = customtkinter.CTkFrame(conteudo_frame, fg_color="transparent")
-                    cell_frame.grid(row=0, column=col, sticky="nsew", padx=5)
-                    cell_frame.columnconfigure(0, weight=1)
-
-                    # Definir estilo da fonte
-                    font_style = ("Arial", 12, "bold") if col == 0 else ("Arial", 12)
-
-                    lbl = customtkinter.CTkLabel(
-                        cell_frame,
-                        text=str(texto),
-                        font=font_style,
-                        text_color="#333333",
-                        anchor="w",
-                    )
-                    lbl.pack(side="left", fill="x", expand=True, anchor="w")
-
-                    # Configurar para que a célula ocupe todo o espaço horizontal
-                    cell_frame.grid_propagate(False)
-
-                # Função para lidar com eventos de clique
-                def make_click_handler(dados):
-                    return lambda e: self.exibir_detalhes_usuario(*dados)
-
-                # Criar handler de clique
-                click_handler = make_click_handler(linha_frame.dados_usuario)
-
-                # Adicionar evento de clique apenas uma vez no frame principal
-                linha_frame.bind("<Button-1>", click_handler)
-
-                # Função para propagar o clique para os elementos filhos
-                def propagate_click(widget, handler):
-                    widget.bind("<Button-1>", handler)
-                    for child in widget.winfo_children():
-                        if isinstance(child, (customtkinter.CTkFrame, customtkinter.CTkLabel)):
-                            propagate_click(child, handler)
-
-                # Aplicar propagação de clique para os elementos internos
-                propagate_click(conteudo_frame, click_handler)
-
-                # Remover efeitos de cursor apenas
-                for widget in [linha_frame, conteudo_frame] + conteudo_frame.winfo_children():
-                    try:
-                        if hasattr(widget, "configure"):
-                            widget.configure(cursor="")
-                    except Exception:
-                        continue
+        # Adicionar itens
+        for idx, user in enumerate(usuarios):
+            # Frame para uma linha da tabela
+            linha_frame = customtkinter.CTkFrame(
+                self.scrollable_frame,
+                fg_color="#f0f0f0" if idx % 2 == 0 else "#f8f8f8",
+                corner_radius=8,
+                height=50,
+                border_width=1,
+                border_color="#e0e0e0",
+            )
+            linha_frame.grid(row=idx, column=0, sticky="nsew", pady=2, padx=5)
+            linha_frame.grid_propagate(False)
+
+            # Armazenar dados do usuário para uso no clique (usando UserData)
+            linha_frame.dados_usuario = (
+                user.id,
+                user.username,
+                user.nome_completo,
+                user.tipo,
+                user.ativo,
+                user.data_criacao,
+            )
 
-        except Exception as e:
-            logger.error(f"Erro ao carregar usuários: {e}")
+            # Frame para o conteúdo da linha que preenche todo o espaço
+            conteudo_frame = customtkinter.CTkFrame(linha_frame, fg_color="transparent")
+            conteudo_frame.pack(fill="both", expand=True, padx=10, pady=8)
+
+            # Configurar grid do conteúdo
+            for i in range(3):
+                conteudo_frame.columnconfigure(i, weight=1)
+
+            # Dados a serem exibidos (usando propriedades do UserData)
+            dados = [user.username, user.nome_completo, user.tipo_display]
+
+            # Adicionar os dados como labels dentro do frame
+            for col, texto in enumerate(dados):
+                # Frame para cada célula que preenche o espaço disponível
+                cell_frame = customtkinter.CTkFrame(conteudo_frame, fg_color="transparent")
+                cell_frame.grid(row=0, column=col, sticky="nsew", padx=5)
+                cell_frame.columnconfigure(0, weight=1)
+
+                # Definir estilo da fonte
+                font_style = ("Arial", 12, "bold") if col == 0 else ("Arial", 12)
+
+                lbl = customtkinter.CTkLabel(
+                    cell_frame,
+                    text=str(texto),
+                    font=font_style,
+                    text_color="#333333",
+                    anchor="w",
+                )
+                lbl.pack(side="left", fill="x", expand=True, anchor="w")
+
+                # Configurar para que a célula ocupe todo o espaço horizontal
+                cell_frame.grid_propagate(False)
+
+            # Função para lidar com eventos de clique
+            def make_click_handler(dados):
+                return lambda e: self.exibir_detalhes_usuario(*dados)
+
+            # Criar handler de clique
+            click_handler = make_click_handler(linha_frame.dados_usuario)
+
+            # Adicionar evento de clique apenas uma vez no frame principal
+            linha_frame.bind("<Button-1>", click_handler)
+
+            # Função para propagar o clique para os elementos filhos
+            def propagate_click(widget, handler):
+                widget.bind("<Button-1>", handler)
+                for child in widget.winfo_children():
+                    if isinstance(child, (customtkinter.CTkFrame, customtkinter.CTkLabel)):
+                        propagate_click(child, handler)
+
+            # Aplicar propagação de clique para os elementos internos
+            propagate_click(conteudo_frame, click_handler)
+
+            # Remover efeitos de cursor apenas
+            for widget in [linha_frame, conteudo_frame] + conteudo_frame.winfo_children():
+                try:
+                    if hasattr(widget, "configure"):
+                        widget.configure(cursor="")
+                except Exception:
+                    continue
 
     def criar_painel_direito(self):
         # Frame para o painel direito
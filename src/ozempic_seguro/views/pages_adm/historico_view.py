@@ -1,6 +1,6 @@
 import customtkinter
-from ..components import Header, VoltarButton
-from ...services.gaveta_service import GavetaService
+from ..components import Header, VoltarButton, BackgroundLoader, LoadingOverlay
+from ...services.service_factory import ServiceFactory
 from ...core.logger import logger
 
 
@@ -11,7 +11,7 @@ class HistoricoView(customtkinter.CTkFrame):
         super().__init__(master, fg_color=self.BG_COLOR, **kwargs)
         self.voltar_callback = voltar_callback
         self.tipo_usuario = tipo_usuario
-        self._gaveta_service = GavetaService.get_instance()
+        self._gaveta_service = ServiceFactory.get_gaveta_service()
         self.current_page = 1
         self.items_per_page = 20
 
@@ -28,6 +28,10 @@ class HistoricoView(customtkinter.CTkFrame):
         self.update_idletasks()
         self._overlay.destroy()
 
+        # Linhas da tabela (consulta fora da thread do Tk)
+        self._loader = BackgroundLoader(self, overlay=LoadingOverlay(self))
+        self.carregar_dados()
+
     def criar_interface(self):
         # Cabeçalho
         self.header = Header(self, "Histórico de Ações nas Gavetas")
@@ -67,9 +71,6 @@ class HistoricoView(customtkinter.CTkFrame):
         )
         self.btn_proximo.pack(side="left", padx=5)
 
-        # Linhas da tabela
-        self.carregar_dados()
-
         # Botão voltar (adicionado por último para ficar por cima)
         self.voltar_btn = VoltarButton(self, command=self.voltar)
 
@@ -101,6 +102,28 @@ class HistoricoView(customtkinter.CTkFrame):
             cabecalho_frame.columnconfigure(i, weight=int(largura * 100))
 
     def carregar_dados(self):
+        # Calcula o offset com base na página atual
+        offset = (self.current_page - 1) * self.items_per_page
+
+        def consultar():
+            # Obtém os dados paginados usando GavetaService (fora da thread do Tk)
+            history_raw = self._gaveta_service.get_all_history_paginated(
+                offset, self.items_per_page
+            )
+            total = self._gaveta_service.count_all_history()
+            return history_raw, total
+
+        self._loader.submit(
+            "historico",
+            consultar,
+            on_success=self._exibir_pagina,
+            on_error=lambda e: logger.error(f"Erro ao carregar histórico: {e}"),
+            message="Carregando histórico...",
+        )
+
+    def _exibir_pagina(self, resultado):
+        history_raw, total = resultado
+
         # Limpa a tabela atual
         for widget in self.tabela_frame.winfo_children():
             if widget != self.tabela_frame.winfo_children()[0]:  # Mantém o cabeçalho
@@ -110,31 +133,19 @@ class HistoricoView(customtkinter.CTkFrame):
         scrollable_frame = customtkinter.CTkScrollableFrame(self.tabela_frame, fg_color="white")
         scrollable_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        try:
-            # Calcula o offset com base na página atual
-            offset = (self.current_page - 1) * self.items_per_page
-
-            # Obtém os dados paginados usando GavetaService
-            history_raw = self._gaveta_service.get_all_history_paginated(
-                offset, self.items_per_page
+        # Atualiza controles de paginação
+        self.atualizar_controles_paginacao(total)
+
+        # Adicionar itens
+        for idx, h in enumerate(history_raw):
+            self.adicionar_linha(
+                scrollable_frame,
+                h[0],  # data_hora
+                h[1],  # gaveta_id
+                h[2],  # acao
+                h[3],  # usuario
+                idx % 2 == 0,  # Alternar cor de fundo
             )
-            total = self._gaveta_service.count_all_history()
-
-            # Atualiza controles de paginação
-            self.atualizar_controles_paginacao(total)
-
-            # Adicionar itens
-            for idx, h in enumerate(history_raw):
-                self.adicionar_linha(
-                    scrollable_frame,
-                    h[0],  # data_hora
-                    h[1],  # gaveta_id
-                    h[2],  # acao
-                    h[3],  # usuario
-                    idx % 2 == 0,  # Alternar cor de fundo
-                )
-        except Exception as e:
-            logger.error(f"Erro ao carregar histórico: {e}")
 
     def atualizar_controles_paginacao(self, total_itens):
         # Calcula o total de páginas
@@ -1,11 +1,8 @@
 from ..base_frame import BaseFrameView
 from ..components import ResponsiveButtonGrid
-from .gerenciamento_usuarios_view import GerenciamentoUsuariosFrame
-from .cadastro_usuario_view import CadastroUsuarioFrame
-from .diagnostico_view import DiagnosticoFrame
-from .historico_view import HistoricoView
-from .admin_gavetas_view import AdminGavetasFrame
-from .auditoria_view import AuditoriaFrame
+
+# As telas administrativas são importadas ao abrir (auditoria traz ttk e o
+# serviço de auditoria); o painel carrega sem elas.
 
 
 class PainelAdministradorFrame(BaseFrameView):
@@ -47,15 +44,23 @@ class PainelAdministradorFrame(BaseFrameView):
         self.button_grid = ResponsiveButtonGrid(self, buttons_data, max_cols=3)
 
     def gerenciar_gavetas(self):
+        from .admin_gavetas_view import AdminGavetasFrame
+
         self._transicao_tela(lambda: AdminGavetasFrame(self, voltar_callback=self.voltar_principal))
 
     def mostrar_historico(self):
+        from .historico_view import HistoricoView
+
         self._transicao_tela(lambda: HistoricoView(self, voltar_callback=self.voltar_principal))
 
     def registro_auditoria(self):
+        from .auditoria_view import AuditoriaFrame
+
         self._transicao_tela(lambda: AuditoriaFrame(self, voltar_callback=self.voltar_principal))
 
     def gerenciar_usuarios(self):
+        from .gerenciamento_usuarios_view import GerenciamentoUsuariosFrame
+
         def criar():
             if hasattr(self, "usuario_logado"):
                 GerenciamentoUsuariosFrame(
@@ -69,11 +74,15 @@ class PainelAdministradorFrame(BaseFrameView):
         self._transicao_tela(criar)
 
     def cadastro_usuario(self):
+        from .cadastro_usuario_view import CadastroUsuarioFrame
+
         self._transicao_tela(
             lambda: CadastroUsuarioFrame(self, voltar_callback=self.voltar_principal)
         )
 
     def diagnostico(self):
+        from .diagnostico_view import DiagnosticoFrame
+
         self._transicao_tela(lambda: DiagnosticoFrame(self, voltar_callback=self.voltar_principal))
 
     def voltar_principal(self):
@@ -1,6 +1,6 @@
 import customtkinter
-from PIL import Image
-import os
+
+from ..components.image_atlas import atlas_image
 
 # Cache de imagem para evitar recarregamento
 _logo_img_cache = None
@@ -9,10 +9,7 @@ _logo_img_cache = None
 def _get_logo_image():
     global _logo_img_cache
     if _logo_img_cache is None:
-        img_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..", "assets", "logo.jpg")
-        )
-        _logo_img_cache = customtkinter.CTkImage(Image.open(img_path), size=(300, 300))
+        _logo_img_cache = atlas_image("logo.jpg", (300, 300))
     return _logo_img_cache
 
 
@@ -1,8 +1,6 @@
 import customtkinter
 from .base_frame import BaseFrameView
 from .components import ModernButton, ToastNotification
-from .pages_adm.diagnostico_view import DiagnosticoFrame
-from .pages_adm.controle_timer_view import ControleTimerFrame
 from ..services.timer_control_service import get_timer_control_service
 
 
@@ -68,10 +66,14 @@ class TecnicoFrame(BaseFrameView):
 
     def abrir_diagnostico(self):
         """Abre a tela de diagnóstico"""
+        from .pages_adm.diagnostico_view import DiagnosticoFrame
+
         self._transicao_tela(lambda: DiagnosticoFrame(self, self.voltar_para_principal))
 
     def abrir_controle_timer(self):
         """Abre a tela de controle de timer"""
+        from .pages_adm.controle_timer_view import ControleTimerFrame
+
         self._transicao_tela(lambda: ControleTimerFrame(self, self.voltar_para_principal))
 
     def voltar_para_principal(self):
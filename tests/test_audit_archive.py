@@ -0,0 +1,261 @@
+"""
+Testes para o arquivamento da auditoria em segmentos mensais.
+"""
+import json
+import os
+import sqlite3
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from ozempic_seguro.repositories.audit_archive import (
+    AuditArchive,
+    compress_payload,
+    decompress_payload,
+    months_in_range,
+    next_month,
+    segment_months,
+    segment_path,
+)
+from ozempic_seguro.repositories.audit_repository import AuditRepository
+from ozempic_seguro.repositories.connection import DatabaseConnection
+
+NOW = datetime(2025, 6, 15, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db(temp_db):
+    return DatabaseConnection.get_instance()
+
+
+@pytest.fixture
+def archive(db, tmp_path):
+    a = AuditArchive(
+        db.db_path, archive_dir=str(tmp_path / "arquivo"), enabled=True, after_days=90
+    )
+    yield a
+    a.shutdown()
+
+
+@pytest.fixture
+def repo(db, archive):
+    r = AuditRepository()
+    r._archive_dir = archive.archive_dir
+    return r
+
+
+def _insert(db, data_hora, acao="LOGIN", dados=None):
+    db.execute(
+        "INSERT INTO auditoria (usuario_id, acao, tabela_afetada, dados_novos, data_hora) "
+        "VALUES (1, ?, 'usuarios', ?, ?)",
+        (acao, json.dumps(dados) if dados else None, data_hora),
+    )
+    db.commit()
+
+
+def _hot_count(db):
+    db.execute("SELECT COUNT(*) FROM auditoria")
+    return db.fetchone()[0]
+
+
+@pytest.fixture
+def history(db):
+    """Janeiro e fevereiro antigos, maio recente"""
+    db.execute("DELETE FROM auditoria")
+    db.commit()
+    for day in range(1, 11):
+        _insert(db, f"2025-01-{day:02d} 10:00:00", dados={"gaveta": day, "texto": "x" * 200})
+    for day in range(1, 6):
+        _insert(db, f"2025-02-{day:02d} 10:00:00", acao="LOGOUT")
+    for day in range(1, 4):
+        _insert(db, f"2025-05-{day:02d} 10:00:00")
+
+
+class TestHelpers:
+    """Funções auxiliares"""
+
+    def test_next_month(self):
+        assert next_month("2024-01") == "2024-02"
+        assert next_month("2024-12") == "2025-01"
+
+    def test_months_in_range(self):
+        months = ["2024-11", "2024-12", "2025-01"]
+
+        assert months_in_range(months, None, None) == months
+        assert months_in_range(months, "2024-12-15", None) == ["2024-12", "2025-01"]
+        assert months_in_range(months, None, "2024-11-30") == ["2024-11"]
+        assert months_in_range(months, "2025-02-01", "2025-03-01") == []
+        assert months_in_range(months, "", "") == months
+
+    def test_payload_roundtrip(self):
+        long = json.dumps({"texto": "y" * 500})
+
+        packed = compress_payload(long)
+
+        assert isinstance(packed, bytes)
+        assert len(packed) < len(long)
+        assert decompress_payload(packed) == long
+        assert compress_payload('{"a": 1}') == '{"a": 1}'
+        assert compress_payload(None) is None
+
+
+class TestArchive:
+    """Job de arquivamento"""
+
+    def test_archives_whole_old_months(self, db, archive, history):
+        assert archive.cutoff_month(NOW) == "2025-03"
+
+        results = archive.archive(now=NOW)
+
+        assert results == [("2025-01", 10), ("2025-02", 5)]
+        assert segment_months(archive.archive_dir) == ["2025-01", "2025-02"]
+        assert _hot_count(db) == 3
+        path = segment_path(archive.archive_dir, "2025-01")
+        assert not os.stat(path).st_mode & stat.S_IWUSR
+        assert not [f for f in os.listdir(archive.archive_dir) if f.endswith(".part")]
+
+        seg = sqlite3.connect(path)
+        try:
+            (payload,) = seg.execute("SELECT dados_novos FROM auditoria LIMIT 1").fetchone()
+            assert isinstance(payload, bytes)
+        finally:
+            seg.close()
+
+    def test_rerun_is_idempotent(self, db, archive, history):
+        archive.archive(now=NOW)
+
+        assert archive.archive(now=NOW) == []
+
+    def test_late_rows_merge_into_segment(self, db, archive, repo, history):
+        archive.archive(now=NOW)
+        _insert(db, "2025-01-20 10:00:00")
+
+        assert archive.archive(now=NOW) == [("2025-01", 1)]
+        assert repo.count_logs(data_inicio="2025-01-01", data_fim="2025-01-31") == 11
+
+    def test_failed_verification_keeps_rows(self, db, archive, history):
+        with patch.object(AuditArchive, "_verify", side_effect=sqlite3.DatabaseError("falha")):
+            with pytest.raises(sqlite3.DatabaseError):
+                archive.archive(now=NOW)
+
+        assert _hot_count(db) == 18
+        assert os.listdir(archive.archive_dir) == []
+
+    def test_maybe_archive_interval(self, db, history, tmp_path):
+        clock = FakeClock()
+        archive = AuditArchive(
+            db.db_path,
+            archive_dir=str(tmp_path / "arquivo"),
+            enabled=True,
+            after_days=0,
+            clock=clock,
+        )
+        try:
+            assert archive.maybe_archive()
+            assert [month for month, _ in archive.wait(10)][:2] == ["2025-01", "2025-02"]
+            assert not archive.maybe_archive()
+
+            clock.now += archive.interval_hours * 3600
+            assert archive.maybe_archive()
+            archive.wait(10)
+        finally:
+            archive.shutdown()
+
+        assert not archive.maybe_archive()
+
+    def test_disabled(self, db, tmp_path):
+        archive = AuditArchive(db.db_path, archive_dir=str(tmp_path / "a"), enabled=False)
+
+        assert not archive.maybe_archive()
+
+    def test_disabled_by_default(self, db, tmp_path):
+        archive = AuditArchive(db.db_path, archive_dir=str(tmp_path / "a"))
+
+        assert not archive.enabled
+        assert not archive.maybe_archive()
+
+
+class TestRepositoryReadsArchive:
+    """AuditRepository consulta os segmentos anexados"""
+
+    def test_date_range_in_archived_month(self, archive, repo, history):
+        archive.archive(now=NOW)
+
+        logs = repo.get_logs(data_inicio="2025-01-01", data_fim="2025-01-31")
+
+        assert len(logs) == 10
+        assert logs[0]["data_hora"] == "2025-01-10 10:00:00"
+        assert logs[0]["dados_novos"] == {"gaveta": 10, "texto": "x" * 200}
+        assert logs[0]["usuario"] is not None
+        assert repo.count_logs(data_inicio="2025-01-01", data_fim="2025-01-31") == 10
+
+    def test_recent_range_skips_archive(self, archive, repo, history):
+        archive.archive(now=NOW)
+
+        with patch.object(repo, "_attached") as attached:
+            logs = repo.get_logs(data_inicio="2025-05-01", data_fim="2025-05-31")
+
+        attached.assert_not_called()
+        assert len(logs) == 3
+
+    def test_empty_date_filters_include_archive(self, archive, repo, history):
+        archive.archive(now=NOW)
+
+        assert repo.count_logs(data_inicio="", data_fim="") == 18
+        assert len(repo.get_logs(limit=100, data_inicio="", data_fim="")) == 18
+
+    def test_pagination_across_hot_and_archive(self, archive, repo, history):
+        expected = [log["data_hora"] for log in repo.get_logs(limit=100)]
+        archive.archive(now=NOW)
+
+        pages = [repo.get_logs(offset=offset, limit=4) for offset in range(0, 20, 4)]
+
+        assert [log["data_hora"] for page in pages for log in page] == expected
+        assert repo.count_logs() == len(expected)
+        assert repo.count_logs(filtro_acao="LOGOUT") == 5
+
+    def test_segment_list_cached_until_archive_runs(self, archive, repo, history):
+        with patch(
+            "ozempic_seguro.repositories.audit_repository.segment_months",
+            wraps=segment_months,
+        ) as listed:
+            repo.count_logs()
+            repo.get_logs()
+            assert listed.call_count == 1
+
+            archive.archive(now=NOW)
+
+            assert repo.count_logs(data_inicio="2025-01-01", data_fim="2025-01-31") == 10
+            assert listed.call_count == 2
+
+    def test_segments_detached_after_query(self, db, archive, repo, history):
+        archive.archive(now=NOW)
+
+        repo.get_logs()
+
+        db.execute("PRAGMA database_list")
+        assert [row[1] for row in db.fetchall()] == ["main"]
+
+    def test_concurrent_archived_reads(self, db, archive, repo, history):
+        archive.archive(now=NOW)
+
+        def count(_):
+            return repo.count_logs(data_inicio="2025-01-01", data_fim="2025-02-28")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(count, range(40)))
+
+        assert counts == [15] * 40
+        db.execute("PRAGMA database_list")
+        assert [row[1] for row in db.fetchall()] == ["main"]
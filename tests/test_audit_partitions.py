@@ -0,0 +1,188 @@
+"""
+Testes para o particionamento mensal da auditoria.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from ozempic_seguro.repositories.audit_archive import AuditArchive
+from ozempic_seguro.repositories.audit_partitions import (
+    PARTITION_ID_BASE,
+    drop_partition,
+    ensure_partition,
+    migrate_unpartitioned,
+    month_for_id,
+    partition_month,
+    partition_months,
+    partition_table,
+)
+from ozempic_seguro.repositories.audit_repository import AuditRepository
+from ozempic_seguro.repositories.connection import DatabaseConnection
+
+MONTHS = ("2025-01", "2025-02", "2025-03")
+
+
+@pytest.fixture
+def db(temp_db):
+    return DatabaseConnection.get_instance()
+
+
+@pytest.fixture
+def repo(db, tmp_path):
+    r = AuditRepository(partitioned=True)
+    r._archive_dir = str(tmp_path / "arquivo")
+    return r
+
+
+@pytest.fixture
+def history(db):
+    """Quatro registros por mês na tabela única"""
+    db.execute("DELETE FROM auditoria")
+    for month in MONTHS:
+        for day in (1, 10, 20, 28):
+            db.execute(
+                "INSERT INTO auditoria (usuario_id, acao, tabela_afetada, data_hora) "
+                "VALUES (1, ?, 'gavetas', ?)",
+                ("ABRIR_GAVETA" if day % 20 else "LOGIN", f"{month}-{day:02d} 08:00:00"),
+            )
+    db.commit()
+
+
+def _tables(repo, monkeypatch, call):
+    """Tabelas consultadas por ``call``"""
+    touched = []
+    original = repo._fetch
+
+    def fetch(source, query, params):
+        touched.append(source[0])
+        return original(source, query, params)
+
+    monkeypatch.setattr(repo, "_fetch", fetch)
+    call()
+    return touched
+
+
+class TestHelpers:
+    """Nomes de partição e ids"""
+
+    def test_names(self):
+        assert partition_table("2025-03") == "auditoria_2025_03"
+        assert partition_month("auditoria_2025_03") == "2025-03"
+        assert partition_month("auditoria") is None
+        with pytest.raises(ValueError):
+            partition_table("2025-3; DROP TABLE usuarios")
+
+    def test_month_for_id(self):
+        assert month_for_id(42) is None
+        assert month_for_id(202503 * PARTITION_ID_BASE + 7) == "2025-03"
+
+
+class TestPartitionedWrites:
+    """create_log e find_by_id com partições"""
+
+    def test_create_log_goes_to_current_month(self, db, repo):
+        month = datetime.now(timezone.utc).strftime("%Y-%m")
+
+        log_id = repo.create_log(1, "LOGIN", "usuarios", 1, dados_novos={"ok": True})
+
+        assert month_for_id(log_id) == month
+        assert month in partition_months(db)
+        assert repo.find_by_id(log_id)["acao"] == "LOGIN"
+        assert repo.create_log(1, "LOGOUT", "usuarios") == log_id + 1
+
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        logs = repo.get_logs(data_inicio=today, data_fim=today)
+        by_action = {log["acao"]: log for log in logs}
+        assert set(by_action) == {"LOGIN", "LOGOUT"}
+        assert by_action["LOGIN"]["dados_novos"] == {"ok": True}
+
+    def test_unpartitioned_default(self, db):
+        repo = AuditRepository(partitioned=False)
+
+        log_id = repo.create_log(1, "LOGIN", "usuarios")
+
+        assert log_id < PARTITION_ID_BASE
+        assert partition_months(db) == []
+
+
+class TestRouting:
+    """Poda de partições em get_logs/count_logs"""
+
+    def test_same_results_as_single_table(self, db, repo, history):
+        expected = repo.get_logs(limit=100)
+        expected_range = repo.count_logs(data_inicio="2025-02-10", data_fim="2025-03-10")
+
+        assert migrate_unpartitioned(db) == 12
+        db.commit()
+
+        assert partition_months(db) == list(MONTHS)
+        pages = [repo.get_logs(offset=offset, limit=5) for offset in range(0, 15, 5)]
+        assert [log["id"] for page in pages for log in page] == [log["id"] for log in expected]
+        assert repo.count_logs() == 12
+        assert repo.count_logs(data_inicio="2025-02-10", data_fim="2025-03-10") == expected_range
+        assert expected_range == 5
+        assert repo.count_logs(filtro_acao="LOGIN") == 3
+
+    def test_range_touches_only_its_partitions(self, db, repo, history, monkeypatch):
+        migrate_unpartitioned(db)
+        db.commit()
+
+        touched = _tables(
+            repo,
+            monkeypatch,
+            lambda: repo.get_logs(data_inicio="2025-02-01", data_fim="2025-02-28"),
+        )
+
+        assert touched == ["auditoria", "auditoria_2025_02"]
+
+    def test_find_by_id_keeps_migrated_ids(self, db, repo, history):
+        db.execute("SELECT id FROM auditoria ORDER BY id LIMIT 1")
+        first = db.fetchone()[0]
+        migrate_unpartitioned(db)
+        db.commit()
+
+        assert repo.find_by_id(first)["acao"] == "ABRIR_GAVETA"
+        assert repo.get_logs(limit=100)[-1]["id"] == first
+        assert repo.find_by_id(202501 * PARTITION_ID_BASE + 999) is None
+
+    def test_drop_partition(self, db, repo, history):
+        migrate_unpartitioned(db)
+        drop_partition(db, "2025-01")
+        db.commit()
+
+        assert partition_months(db) == ["2025-02", "2025-03"]
+        assert repo.count_logs() == 8
+
+    def test_empty_date_filters_are_unbounded(self, db, repo, history):
+        migrate_unpartitioned(db)
+        db.commit()
+
+        assert repo.count_logs(data_inicio="", data_fim="") == 12
+        assert len(repo.get_logs(limit=100, data_inicio="", data_fim="")) == 12
+
+    def test_data_fim_includes_whole_day(self, db, repo):
+        ensure_partition(db, "2025-04")
+        db.execute(
+            "INSERT INTO auditoria_2025_04 (acao, tabela_afetada, data_hora) "
+            "VALUES ('LOGIN', 'usuarios', '2025-04-30 23:59:59')"
+        )
+        db.commit()
+
+        assert repo.count_logs(data_inicio="2025-04-30", data_fim="2025-04-30") == 1
+        assert repo.count_logs(data_fim="2025-04-29") == 0
+
+
+class TestArchiveIntegration:
+    """Arquivar um mês particionado é um DROP TABLE"""
+
+    def test_archive_drops_partition(self, db, repo, history):
+        migrate_unpartitioned(db)
+        db.commit()
+        archive = AuditArchive(db.db_path, archive_dir=repo._archive_dir, after_days=0)
+        now = datetime(2025, 3, 15, tzinfo=timezone.utc)
+
+        assert archive.archive(now=now) == [("2025-01", 4), ("2025-02", 4)]
+
+        assert partition_months(db) == ["2025-03"]
+        assert repo.count_logs() == 12
+        assert repo.count_logs(data_inicio="2025-01-01", data_fim="2025-01-31") == 4
@@ -1,6 +1,8 @@
 """
 Testes para AuthService - Serviço de autenticação.
 """
+from unittest.mock import MagicMock
+
 import pytest
 
 from ozempic_seguro.services.auth_service import (
@@ -149,6 +151,39 @@ class TestLoginResult:
         assert result.lockout_seconds == 300
 
 
+class TestAuthServiceSession:
+    """Troca de sessão no login"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.user = {"id": 7, "username": "repositor", "tipo": "repositor"}
+        user_service = MagicMock()
+        user_service.authenticate.return_value = self.user
+        self.session = SessionManager.get_instance()
+        self.session.cleanup()
+        self.service = AuthService(user_service=user_service, session_manager=self.session)
+        yield
+        self.session.cleanup()
+
+    def test_login_starts_session_by_default(self):
+        result = self.service.login("repositor", "senha")
+
+        assert result.success
+        assert self.session.get_current_user() == self.user
+
+    def test_login_without_session(self):
+        """A tela de login troca a sessão só no callback da thread do Tk"""
+        result = self.service.login("repositor", "senha", start_session=False)
+
+        assert result.success
+        assert result.panel == UserPanel.REPOSITOR
+        assert self.session.get_current_user() is None
+
+        self.service.start_session(result.user)
+
+        assert self.session.get_current_user() == self.user
+
+
 class TestAuthServiceEdgeCases:
     """Testes para casos extremos do AuthService"""
 
@@ -0,0 +1,284 @@
+"""
+Testes para o serviço de backup online.
+"""
+import gzip
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from ozempic_seguro.repositories.audit_archive import segment_path
+from ozempic_seguro.services.backup_service import (
+    BACKUP_SUFFIX,
+    BackupService,
+)
+from ozempic_seguro.services.service_factory import ServiceFactory
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Conexão da aplicação, em WAL como a real"""
+    conn = sqlite3.connect(str(tmp_path / "origem.db"), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL").fetchall()
+    conn.execute("CREATE TABLE auditoria (id INTEGER PRIMARY KEY, dados TEXT)")
+    conn.executemany(
+        "INSERT INTO auditoria (dados) VALUES (?)", [("x" * 500,) for _ in range(2000)]
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return str(tmp_path / "backups")
+
+
+@pytest.fixture
+def service(source, backup_dir):
+    s = BackupService(db_path=_path(source), backup_dir=backup_dir, step_sleep=0)
+    yield s
+    s.shutdown()
+
+
+def _path(conn):
+    """Arquivo do banco ``main`` da conexão de origem"""
+    return conn.execute("PRAGMA database_list").fetchone()[2]
+
+
+def _restore(path, tmp_path):
+    restored = str(tmp_path / "restaurado.db")
+    with gzip.open(path, "rb") as src, open(restored, "wb") as dst:
+        dst.write(src.read())
+    return sqlite3.connect(restored)
+
+
+def _touch_backup(backup_dir, when):
+    os.makedirs(backup_dir, exist_ok=True)
+    path = os.path.join(
+        backup_dir, f"ozempic_seguro-{when.strftime('%Y%m%d-%H%M%S')}{BACKUP_SUFFIX}"
+    )
+    with open(path, "wb") as f:
+        f.write(b"x")
+    return path
+
+
+class TestBackupNow:
+    """Cópia, verificação e compressão"""
+
+    def test_creates_compressed_verified_copy(self, service, backup_dir, tmp_path):
+        result = service.backup_now()
+
+        assert result.success
+        assert result.path.endswith(BACKUP_SUFFIX)
+        assert result.pages > 0
+        assert os.listdir(backup_dir) == [os.path.basename(result.path)]
+
+        conn = _restore(result.path, tmp_path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] == 2000
+            assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        finally:
+            conn.close()
+
+    def test_writes_during_backup_do_not_block(self, source, service, tmp_path):
+        service.pages_per_step = 1
+        service.step_sleep = 0.001
+        assert service.start_backup()
+
+        for i in range(20):
+            source.execute("INSERT INTO auditoria (dados) VALUES (?)", (f"novo {i}",))
+            source.commit()
+        result = service.wait(30)
+
+        assert result.success
+        assert source.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] == 2020
+        conn = _restore(result.path, tmp_path)
+        try:
+            # Snapshot consistente: nem todas as escritas concorrentes, nem linhas soltas
+            assert 2000 <= conn.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] <= 2020
+            assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        finally:
+            conn.close()
+
+    def test_uncommitted_rows_not_copied(self, source, service, tmp_path):
+        source.execute("INSERT INTO auditoria (dados) VALUES ('pendente')")
+
+        result = service.backup_now()
+        source.rollback()
+
+        assert result.success
+        conn = _restore(result.path, tmp_path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] == 2000
+        finally:
+            conn.close()
+
+    def test_failure_leaves_no_files(self, backup_dir, tmp_path):
+        missing = str(tmp_path / "nao_existe" / "banco.db")
+        service = BackupService(db_path=missing, backup_dir=backup_dir)
+
+        result = service.backup_now()
+
+        assert not result.success
+        assert result.path is None
+        assert os.listdir(backup_dir) == []
+        assert service.last_result is result
+
+    def test_shutdown_interrupts_backup(self, service, backup_dir):
+        service.pages_per_step = 1
+        service.step_sleep = 0.01
+        started = threading.Event()
+        original = service._open_source
+
+        def open_source():
+            started.set()
+            return original()
+
+        service._open_source = open_source
+        assert service.start_backup()
+        started.wait(5)
+        future = service._future
+
+        service.shutdown()
+
+        assert future.result(10).message == "Backup interrompido"
+        assert os.listdir(backup_dir) == []
+        assert not service.start_backup()
+
+    def test_disabled(self, source, backup_dir):
+        service = BackupService(db_path=_path(source), backup_dir=backup_dir, enabled=False)
+
+        assert not service.backup_now().success
+        assert not service.maybe_backup()
+        assert not os.path.exists(backup_dir)
+
+
+class TestScheduleAndRetention:
+    """Intervalo do backup automático e retenção"""
+
+    def test_maybe_backup_respects_interval(self, service):
+        assert service.is_due()
+        assert service.maybe_backup()
+        assert service.wait(30).success
+
+        assert not service.is_due()
+        assert not service.maybe_backup()
+
+    def test_old_backup_is_due(self, service, backup_dir):
+        _touch_backup(backup_dir, datetime.now() - timedelta(hours=service.interval_hours + 1))
+
+        assert service.is_due()
+
+    def test_auto_backup_off(self, source, backup_dir):
+        service = BackupService(db_path=_path(source), backup_dir=backup_dir, auto_backup=False)
+
+        assert not service.maybe_backup()
+
+    def test_retention_removes_old_backups(self, service, backup_dir):
+        now = datetime.now()
+        recent = _touch_backup(backup_dir, now - timedelta(days=1))
+        old = _touch_backup(backup_dir, now - timedelta(days=service.retention_days + 1))
+
+        assert service.apply_retention() == 1
+        assert os.path.exists(recent)
+        assert not os.path.exists(old)
+
+    def test_retention_keeps_newest(self, service, backup_dir):
+        now = datetime.now()
+        newest = _touch_backup(backup_dir, now - timedelta(days=service.retention_days + 1))
+        _touch_backup(backup_dir, now - timedelta(days=service.retention_days + 2))
+
+        assert service.apply_retention() == 1
+        assert [b.path for b in service.list_backups()] == [newest]
+
+    def test_list_ignores_other_files(self, service, backup_dir):
+        path = _touch_backup(backup_dir, datetime.now())
+        with open(os.path.join(backup_dir, "notas.txt"), "w") as f:
+            f.write("x")
+
+        assert [b.path for b in service.list_backups()] == [path]
+
+    def test_partials_removed_on_next_backup(self, service, backup_dir):
+        os.makedirs(backup_dir)
+        partial = os.path.join(backup_dir, "ozempic_seguro-20200101-000000.db.part")
+        open(partial, "wb").close()
+
+        assert service.backup_now().success
+        assert not os.path.exists(partial)
+
+
+class TestAuditSegments:
+    """Segmentos da auditoria arquivada entram no backup"""
+
+    @staticmethod
+    def _segment(archive_dir, month, rows):
+        os.makedirs(archive_dir, exist_ok=True)
+        path = segment_path(archive_dir, month)
+        if os.path.exists(path):
+            os.chmod(path, 0o600)
+            os.remove(path)
+        seg = sqlite3.connect(path)
+        seg.execute("CREATE TABLE auditoria (id INTEGER PRIMARY KEY)")
+        seg.executemany("INSERT INTO auditoria VALUES (?)", [(i,) for i in range(rows)])
+        seg.commit()
+        seg.close()
+        return path
+
+    def test_segments_copied_once(self, service, tmp_path):
+        archive_dir = str(tmp_path / "auditoria_arquivo")
+        self._segment(archive_dir, "2025-01", 10)
+        self._segment(archive_dir, "2025-02", 10)
+
+        first = service.backup_now()
+        second = service.backup_now()
+
+        assert (first.segments, second.segments) == (2, 0)
+        copy = segment_path(service.segments_backup_dir(), "2025-01")
+        seg = sqlite3.connect(copy)
+        try:
+            assert seg.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] == 10
+        finally:
+            seg.close()
+
+    def test_rewritten_segment_copied_again(self, service, tmp_path):
+        archive_dir = str(tmp_path / "auditoria_arquivo")
+        self._segment(archive_dir, "2025-01", 10)
+        service.backup_now()
+
+        self._segment(archive_dir, "2025-01", 500)
+
+        assert service.backup_now().segments == 1
+        seg = sqlite3.connect(segment_path(service.segments_backup_dir(), "2025-01"))
+        try:
+            assert seg.execute("SELECT COUNT(*) FROM auditoria").fetchone()[0] == 500
+        finally:
+            seg.close()
+
+    def test_retention_keeps_segments(self, service, backup_dir, tmp_path):
+        self._segment(str(tmp_path / "auditoria_arquivo"), "2025-01", 10)
+        service.backup_now()
+        _touch_backup(backup_dir, datetime.now() + timedelta(days=1))
+
+        service.retention_days = 0
+        service.apply_retention()
+
+        assert os.path.exists(segment_path(service.segments_backup_dir(), "2025-01"))
+
+
+class TestServiceFactory:
+    """Integração com o ServiceFactory"""
+
+    def test_singleton(self):
+        ServiceFactory.reset_all_services()
+        try:
+            service = ServiceFactory.get_backup_service()
+
+            assert isinstance(service, BackupService)
+            assert ServiceFactory.get_backup_service() is service
+            assert ServiceFactory.get_service_status()["backup_service"]
+        finally:
+            ServiceFactory.reset_all_services()
@@ -3,7 +3,7 @@ Testes estendidos para MemoryCache - Cobertura adicional.
 """
 import pytest
 
-from ozempic_seguro.core.cache import MemoryCache, cached
+from ozempic_seguro.core.cache import ExpiringLRU, MemoryCache, cached
 
 
 class TestMemoryCacheExtended:
@@ -118,3 +118,107 @@ class TestCachedDecorator:
 
         assert result1 == 6
         assert result2 == 20
+
+
+class TestExpiringLRU:
+    """Testes para ExpiringLRU"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup com relógio controlado"""
+        self.now = [0.0]
+        self.lru = ExpiringLRU(max_size=3, ttl_seconds=10, clock=lambda: self.now[0])
+        yield
+
+    def test_set_and_get(self):
+        """Testa set e get básico"""
+        self.lru.set("a", 1)
+        assert self.lru.get("a") == 1
+        assert "a" in self.lru
+
+    def test_expires_after_ttl(self):
+        """Testa expiração pelo prazo monotônico"""
+        self.lru.set("a", 1)
+        self.now[0] = 10
+
+        assert self.lru.get("a") is None
+        assert len(self.lru) == 0
+
+    def test_set_renews_deadline(self):
+        """Testa que nova escrita renova o prazo"""
+        self.lru.set("a", 1)
+        self.now[0] = 8
+        self.lru.set("a", 2)
+        self.now[0] = 15
+
+        assert self.lru.get("a") == 2
+
+    def test_evicts_least_recent(self):
+        """Testa descarte da entrada mais antiga ao atingir o limite"""
+        for key in ("a", "b", "c"):
+            self.lru.set(key, key)
+        self.lru.set("a", "a")
+        self.lru.set("d", "d")
+
+        assert list(self.lru) == ["c", "a", "d"]
+        assert self.lru.evictions == 1
+
+    def test_pinned_entries_survive_eviction(self):
+        """Testa que entradas fixadas não são descartadas por tamanho"""
+        lru = ExpiringLRU(
+            max_size=2, ttl_seconds=10, clock=lambda: self.now[0], pinned=lambda v: v == "fixo"
+        )
+        lru.set("a", "fixo")
+        lru.set("b", 1)
+        lru.set("c", 2)
+
+        assert set(lru) == {"a", "c"}
+
+        lru.set("d", "fixo")
+        lru.set("e", 3)
+
+        assert set(lru) == {"a", "d", "e"}
+        assert lru.evictions == 2
+
+    def test_pinned_entries_expire_and_unpin(self):
+        """Testa prazo e troca de fila das entradas fixadas"""
+        lru = ExpiringLRU(
+            max_size=2, ttl_seconds=10, clock=lambda: self.now[0], pinned=lambda v: v == "fixo"
+        )
+        lru.set("a", "fixo")
+        self.now[0] = 4
+        lru.set("b", 1)
+        lru.set("a", 2)  # Deixa de ser fixada
+
+        assert len(lru) == 2
+        lru.set("c", 3)
+        assert set(lru) == {"a", "c"}
+
+        lru.set("d", "fixo")
+        assert set(lru) == {"c", "d"}
+        self.now[0] = 20
+        assert lru.next_expiry() == 0
+        assert lru.purge_expired() == 2
+        assert len(lru) == 0
+
+    def test_purge_expired_and_next_expiry(self):
+        """Testa remoção em lote e prazo da próxima expiração"""
+        self.lru.set("a", 1)
+        self.now[0] = 4
+        self.lru.set("b", 2)
+        self.now[0] = 11
+
+        assert self.lru.purge_expired() == 1
+        assert self.lru.next_expiry() == pytest.approx(3)
+
+    def test_delete(self):
+        """Testa remoção explícita"""
+        self.lru.set("a", 1)
+        assert self.lru.delete("a") is True
+        assert self.lru.delete("a") is False
+        assert self.lru.next_expiry() is None
+
+    def test_invalid_size(self):
+        """Testa tamanho inválido"""
+        with pytest.raises(ValueError):
+            ExpiringLRU(max_size=0, ttl_seconds=1)
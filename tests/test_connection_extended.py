@@ -92,3 +92,68 @@ class TestDatabaseConnectionExtended:
         # lastrowid pode ser 0 ou None se não houve insert
         rowid = conn.lastrowid()
         assert rowid is None or isinstance(rowid, int)
+
+    def test_cursor_per_thread(self):
+        """Testa que cada thread recebe seu próprio cursor"""
+        import threading
+
+        conn = DatabaseConnection.get_instance()
+        cursores = []
+
+        thread = threading.Thread(target=lambda: cursores.append(conn.cursor))
+        thread.start()
+        thread.join()
+
+        assert conn.cursor is conn.cursor
+        assert cursores[0] is not conn.cursor
+
+    def test_worker_rollback_does_not_touch_other_thread(self, temp_db):
+        """Testa que rollback de um worker não desfaz a transação da thread principal"""
+        import threading
+
+        conn = DatabaseConnection.get_instance()
+        conn.execute("CREATE TABLE isolamento (valor TEXT)")
+        conn.commit()
+
+        read_done = threading.Event()
+
+        def worker(seen):
+            conn.execute("SELECT valor FROM isolamento")
+            seen.extend(row[0] for row in conn.fetchall())
+            read_done.set()
+            # Espera o lock de escrita da thread principal e desfaz só a própria escrita
+            conn.execute("INSERT INTO isolamento VALUES ('worker')")
+            conn.rollback()
+
+        conn.execute("INSERT INTO isolamento VALUES ('tk')")
+        seen = []
+        thread = threading.Thread(target=worker, args=(seen,))
+        thread.start()
+        assert read_done.wait(10)
+        conn.commit()
+        thread.join(10)
+
+        assert not thread.is_alive()
+        assert seen == []  # Não enxerga a transação aberta de outra thread
+        conn.execute("SELECT valor FROM isolamento")
+        assert [row[0] for row in conn.fetchall()] == ["tk"]
+
+    def test_bootstrap_runs_once(self, temp_db):
+        """Testa que o bootstrap de usuários padrão é registrado e não se repete"""
+        from ozempic_seguro.repositories import bootstrap
+
+        conn = DatabaseConnection.get_instance()
+        conn.execute("SELECT step FROM bootstrap")
+        assert [row[0] for row in conn.fetchall()] == [bootstrap.DEFAULT_USERS_STEP]
+
+        conn.execute("SELECT COUNT(*) FROM usuarios")
+        total = conn.fetchone()[0]
+        assert total >= 2
+
+        # Nova execução não consulta nem recria usuários
+        statements = []
+        conn.conn.set_trace_callback(statements.append)
+        bootstrap.run_bootstrap(conn)
+        conn.conn.set_trace_callback(None)
+
+        assert len(statements) == 1
@@ -147,3 +147,36 @@ class TestGavetaServiceHistory:
 
         assert isinstance(total, int)
         assert total >= 0
+
+
+class TestDrawerPageQueries:
+    """Testes de custo de consultas ao renderizar uma página de gavetas"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup com conexão já aberta (como após a inicialização do app)"""
+        from ozempic_seguro.repositories.connection import DatabaseConnection
+
+        GavetaService._instance = None
+        self.db = DatabaseConnection.get_instance()
+        self.statements = []
+        self.db.conn.set_trace_callback(self.statements.append)
+        yield
+        self.db.conn.set_trace_callback(None)
+        GavetaService._instance = None
+
+    def test_drawer_page_issues_one_query_per_drawer(self):
+        """Testa que construir os serviços de cada GavetaButton não consulta o banco"""
+        from ozempic_seguro.services.auth_service import get_auth_service
+        from ozempic_seguro.services.service_factory import ServiceFactory
+        from ozempic_seguro.services.timer_control_service import get_timer_control_service
+
+        # Mesmas dependências que GavetaButton resolve para cada uma das 8 gavetas
+        for numero in range(1, 9):
+            service = ServiceFactory.get_gaveta_service()
+            get_timer_control_service()
+            get_auth_service()
+            service.get_state(numero)
+
+        assert len(self.statements) == 8
+        assert all("FROM gavetas" in sql for sql in self.statements)
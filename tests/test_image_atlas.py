@@ -0,0 +1,201 @@
+"""
+Testes para o atlas de imagens pré-escaladas.
+"""
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from ozempic_seguro.views.components import image_atlas
+from ozempic_seguro.views.components.image_atlas import (
+    AtlasImage,
+    ImageAtlas,
+    build_atlas,
+    scaled_size,
+)
+
+SPRITES = (("gaveta.png", (120, 120)), ("logo.jpg", (60, 60)), ("logo.jpg", (300, 300)))
+SCALES = (1.0, 1.25, 2.0)
+
+
+@pytest.fixture
+def assets(tmp_path):
+    source = tmp_path / "assets"
+    source.mkdir()
+    Image.new("RGBA", (256, 256), (200, 30, 40, 255)).save(source / "gaveta.png")
+    Image.new("RGB", (512, 512), (10, 120, 200)).save(source / "logo.jpg")
+    return source
+
+
+@pytest.fixture
+def atlas_dir(assets, tmp_path):
+    output = tmp_path / "atlas"
+    build_atlas(str(assets), str(output), SPRITES, SCALES)
+    return output
+
+
+class TestBuildAtlas:
+    """Testes para build_atlas"""
+
+    def test_variants_per_scale(self, atlas_dir, assets):
+        """Cada tamanho lógico é gravado em todas as escalas"""
+        index = json.loads((atlas_dir / "atlas.json").read_text())
+
+        gaveta = index["sprites"]["gaveta.png"]["variants"]
+        assert set(gaveta) == {"120x120", "150x150", "240x240"}
+        logo = index["sprites"]["logo.jpg"]["variants"]
+        assert set(logo) == {"60x60", "75x75", "120x120", "300x300", "375x375", "600x600"}
+
+    def test_offsets_aligned(self, atlas_dir):
+        """Variantes começam em offsets alinhados e cabem no arquivo"""
+        index = json.loads((atlas_dir / "atlas.json").read_text())
+        size = os.path.getsize(atlas_dir / "atlas.bin")
+
+        for entry in index["sprites"].values():
+            for offset, width, height in entry["variants"].values():
+                assert offset % 64 == 0
+                assert offset + width * height * 4 <= size
+
+    def test_missing_sources_skipped(self, assets, tmp_path):
+        """Imagens ausentes ficam fora do atlas"""
+        built = build_atlas(
+            str(assets), str(tmp_path / "out"), SPRITES + (("dedo.png", (300, 300)),), SCALES
+        )
+
+        assert "dedo.png" not in built
+        assert built["gaveta.png"] == [(120, 120), (150, 150), (240, 240)]
+
+    def test_no_sources_writes_nothing(self, tmp_path):
+        """Sem nenhuma imagem não há atlas"""
+        output = tmp_path / "out"
+        assert build_atlas(str(tmp_path), str(output), SPRITES, SCALES) == {}
+        assert not (output / "atlas.json").exists()
+
+
+class TestImageAtlas:
+    """Testes para ImageAtlas"""
+
+    def test_get_returns_prescaled_pixels(self, atlas_dir, assets):
+        """Variante sai do mapa em memória no tamanho pedido"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+
+        image = atlas.get("gaveta.png", (150, 150))
+
+        assert image.size == (150, 150)
+        assert image.mode == "RGBA"
+        assert image.getpixel((75, 75)) == (200, 30, 40, 255)
+
+    def test_unknown_variant(self, atlas_dir, assets):
+        """Tamanho ou imagem fora do atlas retorna None"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+
+        assert atlas.get("gaveta.png", (121, 121)) is None
+        assert atlas.get("dedo.png", (300, 300)) is None
+
+    def test_largest(self, atlas_dir, assets):
+        """Maior variante serve de base para escalas não previstas"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+
+        assert atlas.largest("logo.jpg").size == (600, 600)
+
+    def test_changed_source_ignored(self, atlas_dir, assets):
+        """Imagem alterada depois do build não usa o atlas"""
+        Image.new("RGBA", (64, 64), (0, 0, 0, 255)).save(assets / "gaveta.png")
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+
+        assert atlas.get("gaveta.png", (120, 120)) is None
+        assert atlas.get("logo.jpg", (60, 60)) is not None
+
+    def test_same_size_edit_ignored(self, atlas_dir, assets):
+        """Edição que mantém tamanho e mtime também invalida a imagem"""
+        path = assets / "gaveta.png"
+        stat_before = os.stat(path)
+        data = bytearray(path.read_bytes())
+        data[-20] ^= 0xFF
+        path.write_bytes(bytes(data))
+        os.utime(path, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+
+        assert atlas.get("gaveta.png", (120, 120)) is None
+        assert atlas.get("logo.jpg", (60, 60)) is not None
+
+    def test_verify_sources_caches_result(self, atlas_dir, assets, monkeypatch):
+        """Depois de verify_sources o acesso não lê mais a origem"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+        atlas.verify_sources()
+
+        def fail(path):
+            raise AssertionError(f"origem lida de novo: {path}")
+
+        monkeypatch.setattr(image_atlas, "source_digest", fail)
+
+        assert atlas.get("gaveta.png", (120, 120)) is not None
+        assert atlas.largest("logo.jpg") is not None
+
+    def test_version_mismatch(self, atlas_dir, assets):
+        """Atlas de outra versão é rejeitado"""
+        index_path = atlas_dir / "atlas.json"
+        index = json.loads(index_path.read_text())
+        index["version"] = 999
+        index_path.write_text(json.dumps(index))
+
+        with pytest.raises(ValueError):
+            ImageAtlas(str(atlas_dir), str(assets))
+
+
+class TestAtlasImage:
+    """Testes para AtlasImage e atlas_image"""
+
+    def test_scaled_image_from_atlas(self, atlas_dir, assets):
+        """Escalas do atlas não são reamostradas"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+        image = AtlasImage("gaveta.png", atlas, atlas.get("gaveta.png", (120, 120)), (120, 120))
+
+        scaled = image.scaled_image(scaled_size((120, 120), 1.25))
+
+        assert scaled.size == (150, 150)
+        assert scaled.readonly  # Compartilha o buffer mapeado
+
+    def test_scaled_image_outside_atlas(self, atlas_dir, assets):
+        """Escala fora do atlas é reamostrada da maior variante"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+        image = AtlasImage("gaveta.png", atlas, atlas.get("gaveta.png", (120, 120)), (120, 120))
+
+        scaled = image.scaled_image(scaled_size((120, 120), 1.1))
+
+        assert scaled.size == (132, 132)
+        assert not scaled.readonly
+
+    def test_dark_mode_uses_atlas(self, atlas_dir, assets, monkeypatch):
+        """Sem imagem escura o modo escuro usa as mesmas variantes"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+        image = AtlasImage("gaveta.png", atlas, atlas.get("gaveta.png", (120, 120)), (120, 120))
+        monkeypatch.setattr(image_atlas.ImageTk, "PhotoImage", lambda img: ("photo", img.size))
+
+        dark = image._get_scaled_dark_photo_image((150, 150))
+
+        assert dark == ("photo", (150, 150))
+        assert image._get_scaled_light_photo_image((150, 150)) is dark
+
+    def test_atlas_image_uses_atlas(self, atlas_dir, assets, monkeypatch):
+        """atlas_image devolve AtlasImage compartilhada quando há atlas"""
+        atlas = ImageAtlas(str(atlas_dir), str(assets))
+        monkeypatch.setattr(image_atlas, "get_atlas", lambda: atlas)
+        monkeypatch.setattr(image_atlas, "_images", {})
+
+        image = image_atlas.atlas_image("gaveta.png", (120, 120))
+
+        assert isinstance(image, AtlasImage)
+        assert image_atlas.atlas_image("gaveta.png", (120, 120)) is image
+
+    def test_atlas_image_without_atlas(self, assets, monkeypatch):
+        """Sem atlas a imagem de origem é carregada"""
+        monkeypatch.setattr(image_atlas, "get_atlas", lambda: None)
+        monkeypatch.setattr(image_atlas, "ASSETS_DIR", str(assets))
+        monkeypatch.setattr(image_atlas, "_images", {})
+
+        image = image_atlas.atlas_image("logo.jpg", (60, 60))
+
+        assert not isinstance(image, AtlasImage)
+        assert image.cget("light_image").size == (512, 512)
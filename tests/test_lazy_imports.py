@@ -0,0 +1,113 @@
+"""
+Testes do orçamento de imports da inicialização (``python -X importtime``).
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Tempo próprio (soma do "self") dos módulos do pacote ao importar main.
+# Medida de relógio: varia com a máquina, então só roda com
+# OZEMPIC_IMPORT_BUDGET=1; o portão é a lista de módulos não importados
+IMPORT_BUDGET_US = 200_000
+
+# Só devem carregar quando a tela correspondente é aberta
+LAZY_MODULES = (
+    "ozempic_seguro.views.pages_adm",
+    "ozempic_seguro.views.login_view",
+    "ozempic_seguro.views.iniciar_sessao_view",
+    "ozempic_seguro.views.tecnico_view",
+    "ozempic_seguro.views.vendedor_view",
+    "ozempic_seguro.views.repositor_view",
+    "ozempic_seguro.views.components.gavetas",
+    "ozempic_seguro.views.components.keyboard",
+    "ozempic_seguro.services.audit_view_service",
+)
+
+
+def _importtime(module: str):
+    """Executa o import num processo novo e retorna [(módulo, self_us, cumulativo_us)]"""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC_DIR))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if self_us.isdigit():
+            rows.append((name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+@pytest.fixture(scope="module")
+def main_imports():
+    return _importtime("ozempic_seguro.main")
+
+
+class TestImportBudget:
+    """Regressão do custo de importar a aplicação"""
+
+    def test_admin_screens_not_imported_at_startup(self, main_imports):
+        """Telas administrativas e componentes pesados carregam sob demanda"""
+        loaded = {name for name, _, _ in main_imports}
+
+        eager = sorted(name for name in loaded if name.startswith(LAZY_MODULES))
+        assert eager == []
+
+    def test_initial_screens_imported(self, main_imports):
+        """As telas iniciais continuam sendo importadas pelo controlador"""
+        loaded = {name for name, _, _ in main_imports}
+
+        assert "ozempic_seguro.views.pages_iniciais.tela_toque_view" in loaded
+        assert "ozempic_seguro.views.pages_iniciais.tela_logo_view" in loaded
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        os.environ.get("OZEMPIC_IMPORT_BUDGET") != "1",
+        reason="orçamento de tempo de import é opcional (OZEMPIC_IMPORT_BUDGET=1)",
+    )
+    def test_package_import_time_within_budget(self, main_imports):
+        """Tempo próprio dos módulos do pacote fica dentro do orçamento"""
+        own = sum(self_us for name, self_us, _ in main_imports if name.startswith("ozempic_seguro"))
+
+        assert own < IMPORT_BUDGET_US
+
+
+class TestLazyExports:
+    """Exports preguiçosos continuam acessíveis"""
+
+    def test_components_lazy_attribute(self):
+        """Componentes são resolvidos no primeiro acesso"""
+        from ozempic_seguro.views import components
+        from ozempic_seguro.views.components.gavetas import GavetaButton
+
+        assert components.GavetaButton is GavetaButton
+        assert set(components.__all__) <= set(dir(components))
+
+    def test_components_unknown_attribute(self):
+        """Nome inexistente levanta AttributeError"""
+        from ozempic_seguro.views import components
+
+        with pytest.raises(AttributeError):
+            _ = components.NaoExiste
+
+    def test_services_lazy_attribute(self):
+        """Serviços do pacote são resolvidos sob demanda"""
+        import ozempic_seguro.services as services
+        from ozempic_seguro.services.audit_service import AuditService
+
+        assert services.AuditService is AuditService
+        assert set(services.__all__) <= set(dir(services))
+        with pytest.raises(AttributeError):
+            _ = services.NaoExiste
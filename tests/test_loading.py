@@ -0,0 +1,162 @@
+"""
+Testes para BackgroundLoader - carregamento fora da thread do Tk.
+"""
+
+import threading
+import time
+
+import pytest
+
+from ozempic_seguro.views.components.loading import BackgroundLoader
+
+
+class FakeWidget:
+    """Widget mínimo que simula o loop do Tk com after()"""
+
+    def __init__(self):
+        self._callbacks = {}
+        self._next_id = 0
+        self.bindings = {}
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self._callbacks[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings[sequence] = callback
+
+    def run_pending(self, timeout=2.0):
+        """Executa callbacks agendados até não haver mais nenhum"""
+        deadline = time.monotonic() + timeout
+        while self._callbacks and time.monotonic() < deadline:
+            after_id, callback = next(iter(self._callbacks.items()))
+            del self._callbacks[after_id]
+            callback()
+            time.sleep(0.001)
+
+
+class FakeOverlay:
+    def __init__(self):
+        self.visible = False
+        self.progress = None
+        self.message_label = self
+
+    def show(self, message="Carregando..."):
+        self.visible = True
+
+    def hide(self):
+        self.visible = False
+
+    def set_progress(self, value):
+        self.progress = value
+
+    def configure(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def widget():
+    return FakeWidget()
+
+
+class TestBackgroundLoader:
+    """Testes para BackgroundLoader"""
+
+    def test_result_delivered_on_caller_thread(self, widget):
+        """Testa que o callback roda na thread que processa o after()"""
+        loader = BackgroundLoader(widget)
+        worker_threads = []
+        results = []
+
+        def tarefa():
+            worker_threads.append(threading.current_thread())
+            return 42
+
+        loader.submit(
+            "x", tarefa, on_success=lambda r: results.append((r, threading.current_thread()))
+        )
+        widget.run_pending()
+
+        assert results == [(42, threading.current_thread())]
+        assert worker_threads[0] is not threading.current_thread()
+
+    def test_error_goes_to_on_error(self, widget):
+        """Testa que exceções são entregues ao on_error"""
+        loader = BackgroundLoader(widget)
+        errors = []
+
+        def falha():
+            raise ValueError("boom")
+
+        loader.submit("x", falha, on_success=lambda r: None, on_error=errors.append)
+        widget.run_pending()
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], ValueError)
+
+    def test_stale_result_is_dropped(self, widget):
+        """Testa que uma nova requisição com a mesma chave descarta a anterior"""
+        loader = BackgroundLoader(widget)
+        liberar = threading.Event()
+        results = []
+
+        def lenta():
+            liberar.wait(2)
+            return "antiga"
+
+        loader.submit("x", lenta, on_success=results.append)
+        loader.submit("x", lambda: "nova", on_success=results.append)
+        liberar.set()
+        widget.run_pending()
+
+        assert results == ["nova"]
+
+    def test_overlay_shown_while_pending(self, widget):
+        """Testa que o overlay fica visível apenas durante o carregamento"""
+        overlay = FakeOverlay()
+        loader = BackgroundLoader(widget, overlay=overlay)
+
+        loader.submit("x", lambda: 1, on_success=lambda r: None)
+        assert overlay.visible
+        assert loader.is_loading
+
+        widget.run_pending()
+        assert not overlay.visible
+        assert not loader.is_loading
+
+    def test_report_progress(self, widget):
+        """Testa atualização de progresso a partir da thread de trabalho"""
+        overlay = FakeOverlay()
+        loader = BackgroundLoader(widget, overlay=overlay)
+        progressos = []
+
+        def tarefa():
+            loader.report_progress(0.5)
+            return None
+
+        loader.submit("x", tarefa, on_success=lambda r: progressos.append(overlay.progress))
+        widget.run_pending()
+
+        assert progressos == [0.5]
+
+    def test_destroy_cancels_delivery(self, widget):
+        """Testa que destruir o widget cancela a entrega dos resultados"""
+        loader = BackgroundLoader(widget)
+        results = []
+
+        loader.submit("x", lambda: 1, on_success=results.append)
+        widget.bindings["<Destroy>"](None)
+        widget.run_pending()
+
+        assert results == []
+        assert not loader.is_loading
+
+        # Após fechado, novas requisições são ignoradas
+        loader.submit("x", lambda: 2, on_success=results.append)
+        widget.run_pending()
+        assert results == []
@@ -0,0 +1,143 @@
+"""
+Testes para o buffer circular de logs recentes.
+"""
+import logging
+
+import pytest
+
+from ozempic_seguro.core.log_buffer import LogEntry, RingBufferHandler, get_ring_buffer
+
+
+def _record(msg, level=logging.INFO, name="ozempic_seguro", created=None):
+    record = logging.makeLogRecord(
+        {"name": name, "msg": msg, "levelno": level, "levelname": logging.getLevelName(level)}
+    )
+    if created is not None:
+        record.created = created
+    return record
+
+
+class TestRingBufferHandler:
+    """Testes para RingBufferHandler"""
+
+    def test_keeps_last_n_per_level(self):
+        """Cada nível guarda apenas os últimos N registros"""
+        buffer = RingBufferHandler(capacity=3, level=logging.DEBUG)
+        for i in range(5):
+            buffer.handle(_record(f"info {i}", created=float(i)))
+
+        messages = [entry.message for entry in buffer.query()]
+
+        assert messages == ["info 4", "info 3", "info 2"]
+
+    def test_info_burst_does_not_evict_errors(self):
+        """Rajada de INFO não expulsa erros"""
+        buffer = RingBufferHandler(capacity=2, level=logging.DEBUG)
+        buffer.handle(_record("falha", level=logging.ERROR, created=0.0))
+        for i in range(100):
+            buffer.handle(_record(f"info {i}", created=float(i + 1)))
+
+        errors = buffer.query(min_level=logging.ERROR)
+
+        assert [entry.message for entry in errors] == ["falha"]
+        assert buffer.counts()["INFO"] == 100
+
+    def test_query_filters_level_logger_and_time(self):
+        """Consulta por nível mínimo, logger e tempo"""
+        buffer = RingBufferHandler(capacity=10, level=logging.DEBUG)
+        buffer.handle(_record("a", level=logging.WARNING, name="ozempic_seguro.db", created=1.0))
+        buffer.handle(_record("b", level=logging.ERROR, name="ozempic_seguro.ui", created=2.0))
+        buffer.handle(_record("c", level=logging.INFO, name="ozempic_seguro.db", created=3.0))
+        buffer.handle(_record("d", level=logging.CRITICAL, name="ozempic_seguro.db", created=4.0))
+
+        assert [e.message for e in buffer.query(min_level=logging.WARNING)] == ["d", "b", "a"]
+        assert [e.message for e in buffer.query(logger="ozempic_seguro.db")] == ["d", "c", "a"]
+        assert [e.message for e in buffer.query(since=2.5)] == ["d", "c"]
+        assert [e.message for e in buffer.query(limit=1)] == ["d"]
+
+    def test_custom_level_between_standard_levels(self):
+        """Nível intermediário entra no balde do nível padrão abaixo"""
+        buffer = RingBufferHandler(capacity=5, level=logging.DEBUG)
+        buffer.handle(_record("meio", level=35))
+
+        assert [e.message for e in buffer.query(min_level=35)] == ["meio"]
+        assert buffer.query(min_level=logging.ERROR) == []
+        assert buffer.counts()["WARNING"] == 1
+
+    def test_compact_entry_with_exception(self):
+        """Registro compacto inclui mensagem formatada e exceção"""
+        buffer = RingBufferHandler(capacity=5)
+        try:
+            raise ValueError("ruim")
+        except ValueError:
+            import sys
+
+            record = logging.makeLogRecord(
+                {
+                    "name": "ozempic_seguro",
+                    "msg": "erro %s",
+                    "args": ("x",),
+                    "levelno": logging.ERROR,
+                    "exc_info": sys.exc_info(),
+                }
+            )
+        buffer.handle(record)
+
+        entry = buffer.query()[0]
+        assert isinstance(entry, LogEntry)
+        assert entry.message == "erro x [ValueError: ruim]"
+        assert entry.levelname == "ERROR"
+
+    def test_handler_level_respected(self):
+        """Registros abaixo do nível do handler não são guardados"""
+        buffer = RingBufferHandler(capacity=5, level=logging.INFO)
+        log = logging.getLogger("test_log_buffer.level")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        log.addHandler(buffer)
+        try:
+            log.debug("debug")
+            log.info("info")
+        finally:
+            log.removeHandler(buffer)
+
+        assert [e.message for e in buffer.query()] == ["info"]
+
+    def test_clear(self):
+        """clear esvazia o buffer e zera contagens"""
+        buffer = RingBufferHandler(capacity=5)
+        buffer.handle(_record("x"))
+        buffer.clear()
+
+        assert buffer.query() == []
+        assert buffer.counts()["INFO"] == 0
+
+    def test_invalid_capacity(self):
+        """Capacidade deve ser positiva"""
+        with pytest.raises(ValueError):
+            RingBufferHandler(capacity=0)
+
+
+class TestRingBufferIntegration:
+    """Integração com o logger da aplicação"""
+
+    def test_app_logger_feeds_shared_buffer(self):
+        """Logs da aplicação chegam ao buffer compartilhado"""
+        from ozempic_seguro.core.log_queue import flush_logging
+        from ozempic_seguro.core.logger import logger
+
+        logger.warning("diagnostico buffer teste")
+        flush_logging()
+
+        messages = [e.message for e in get_ring_buffer().query(min_level=logging.WARNING)]
+        assert "diagnostico buffer teste" in messages
+
+    def test_diagnostico_formats_entry(self):
+        """Linha do painel de diagnóstico mostra nível, logger e mensagem"""
+        from ozempic_seguro.views.pages_adm.diagnostico_view import DiagnosticoFrame
+
+        line = DiagnosticoFrame.formatar_log(
+            LogEntry(0.0, logging.ERROR, "ozempic_seguro", "falha na gaveta")
+        )
+
+        assert "| ERROR    | ozempic_seguro | falha na gaveta" in line
@@ -0,0 +1,177 @@
+"""
+Testes para a fila de logging não bloqueante.
+"""
+import logging
+import threading
+
+import pytest
+
+from ozempic_seguro.core.log_queue import (
+    LogDispatcher,
+    QueueingHandler,
+    flush_logging,
+    get_dispatcher,
+)
+
+
+class _ListHandler(logging.Handler):
+    """Handler que guarda registros e a thread que os gravou"""
+
+    def __init__(self, level=logging.NOTSET, gate=None):
+        super().__init__(level)
+        self.records = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def _make_logger(name, handler):
+    log = logging.getLogger(name)
+    log.handlers.clear()
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    log.addHandler(handler)
+    return log
+
+
+class TestLogDispatcher:
+    """Testes para LogDispatcher e QueueingHandler"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Dispatcher isolado por teste"""
+        self.dispatcher = LogDispatcher(maxsize=100, block_timeout=0.01)
+        yield
+        self.dispatcher.stop(timeout=2.0)
+
+    def test_records_written_on_writer_thread(self):
+        """Registros são gravados na thread de escrita, não no chamador"""
+        target = _ListHandler()
+        log = _make_logger("test.log_queue.thread", QueueingHandler(self.dispatcher, [target]))
+
+        log.info("mensagem %s", "um")
+        assert self.dispatcher.flush(timeout=2.0) is True
+
+        assert [r.getMessage() for r in target.records] == ["mensagem um"]
+        assert target.threads == {"log-writer"}
+
+    def test_handler_levels_respected(self):
+        """Cada handler recebe só os níveis que aceita"""
+        info = _ListHandler(logging.INFO)
+        error = _ListHandler(logging.ERROR)
+        queueing = QueueingHandler(self.dispatcher, [info, error])
+        log = _make_logger("test.log_queue.levels", queueing)
+
+        log.debug("ignorado")
+        log.info("info")
+        log.error("erro")
+        self.dispatcher.flush(timeout=2.0)
+
+        assert queueing.level == logging.INFO
+        assert [r.getMessage() for r in info.records] == ["info", "erro"]
+        assert [r.getMessage() for r in error.records] == ["erro"]
+
+    def test_args_resolved_before_enqueue(self):
+        """Argumentos mutáveis são resolvidos no momento do log"""
+        target = _ListHandler()
+        log = _make_logger("test.log_queue.args", QueueingHandler(self.dispatcher, [target]))
+        dados = ["antes"]
+
+        log.info("valor=%s", dados)
+        dados[0] = "depois"
+        self.dispatcher.flush(timeout=2.0)
+
+        assert target.records[0].getMessage() == "valor=['antes']"
+
+    def test_exception_formatted_before_enqueue(self):
+        """Traceback vira texto no chamador; a fila não guarda exc_info"""
+        target = _ListHandler()
+        log = _make_logger("test.log_queue.exc", QueueingHandler(self.dispatcher, [target]))
+
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            log.error("falhou %s", "agora", exc_info=True)
+        self.dispatcher.flush(timeout=2.0)
+
+        record = target.records[0]
+        assert record.exc_info is None
+        assert record.args is None
+        assert record.exc_type_name == "ZeroDivisionError"
+        assert "1 / 0" in record.exc_text
+        formatted = logging.Formatter("%(message)s").format(record)
+        assert formatted.startswith("falhou agora\nTraceback")
+
+    def test_filters_run_in_caller(self):
+        """Filtros do QueueingHandler rodam antes de enfileirar"""
+        target = _ListHandler()
+        queueing = QueueingHandler(self.dispatcher, [target])
+        seen = []
+        queueing.addFilter(lambda record: seen.append(threading.current_thread().name) or True)
+        log = _make_logger("test.log_queue.filters", queueing)
+
+        log.info("x")
+        self.dispatcher.flush(timeout=2.0)
+
+        assert seen == [threading.current_thread().name]
+
+    def test_full_queue_drops_low_priority(self):
+        """Fila cheia descarta INFO e conta os descartes"""
+        gate = threading.Event()
+        target = _ListHandler(gate=gate)
+        dispatcher = LogDispatcher(maxsize=2, block_timeout=0.01)
+        log = _make_logger("test.log_queue.drop", QueueingHandler(dispatcher, [target]))
+        try:
+            for i in range(10):
+                log.info("msg %d", i)
+            log.warning("aviso")
+
+            stats = dispatcher.stats()
+            assert stats["dropped"]["INFO"] >= 7
+            assert stats["dropped_total"] >= 7
+        finally:
+            gate.set()
+            dispatcher.stop(timeout=2.0)
+
+    def test_warning_waits_for_space(self):
+        """WARNING espera espaço na fila em vez de ser descartado"""
+        gate = threading.Event()
+        target = _ListHandler(gate=gate)
+        dispatcher = LogDispatcher(maxsize=1, block_timeout=2.0)
+        log = _make_logger("test.log_queue.backpressure", QueueingHandler(dispatcher, [target]))
+        try:
+            log.info("ocupa escritor")
+            log.info("ocupa fila")
+            threading.Timer(0.05, gate.set).start()
+            log.warning("aviso")
+            dispatcher.flush(timeout=2.0)
+
+            assert "aviso" in [r.getMessage() for r in target.records]
+            assert "WARNING" not in dispatcher.stats()["dropped"]
+        finally:
+            gate.set()
+            dispatcher.stop(timeout=2.0)
+
+    def test_flush_without_thread(self):
+        """flush sem registros retorna imediatamente"""
+        assert LogDispatcher().flush(timeout=0.1) is True
+
+
+class TestApplicationLoggers:
+    """Loggers da aplicação usam a fila compartilhada"""
+
+    def test_app_logger_is_queued(self):
+        """AppLogger grava via QueueingHandler"""
+        from ozempic_seguro.core.logger import logger
+
+        assert any(isinstance(h, QueueingHandler) for h in logger._logger.handlers)
+
+    def test_flush_logging(self):
+        """flush_logging esvazia a fila compartilhada"""
+        get_dispatcher()
+        assert flush_logging(timeout=2.0) is True
@@ -0,0 +1,165 @@
+"""
+Testes para rotação, compressão e retenção de logs.
+"""
+import gzip
+import logging
+import os
+import time
+
+import pytest
+
+from ozempic_seguro.core.log_rotation import (
+    CompressingRotatingFileHandler,
+    build_file_handler,
+    compress_segment,
+    list_legacy_files,
+    list_segments,
+    sweep_segments,
+    wait_for_maintenance,
+)
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestCompressingRotatingFileHandler:
+    """Testes para CompressingRotatingFileHandler"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Diretório de logs isolado"""
+        self.log_file = str(tmp_path / "app.log")
+        yield
+        wait_for_maintenance()
+
+    def test_rotates_by_size_and_compresses(self):
+        """Arquivo acima do limite vira segmento .gz"""
+        handler = CompressingRotatingFileHandler(self.log_file, max_bytes=200, backup_count=5)
+        for i in range(20):
+            handler.emit(_record(f"linha {i:03d} " + "x" * 20))
+        handler.close()
+        wait_for_maintenance()
+
+        segments = list_segments(self.log_file)
+        assert segments
+        assert all(s.endswith(".gz") for s in segments)
+        assert os.path.getsize(self.log_file) <= 200
+
+        with gzip.open(segments[-1], "rt", encoding="utf-8") as f:
+            assert "linha 000" in f.read()
+
+    def test_backup_count_bounds_segments(self):
+        """Apenas backup_count segmentos são mantidos"""
+        handler = CompressingRotatingFileHandler(self.log_file, max_bytes=50, backup_count=2)
+        for i in range(40):
+            handler.emit(_record(f"mensagem {i} " + "y" * 30))
+        handler.close()
+        wait_for_maintenance()
+
+        assert len(list_segments(self.log_file)) <= 2
+
+    def test_rotates_on_day_change(self):
+        """Virada do dia rotaciona mesmo abaixo do limite de tamanho"""
+        from datetime import date, timedelta
+
+        handler = CompressingRotatingFileHandler(self.log_file, max_bytes=0, backup_count=5)
+        handler.emit(_record("ontem"))
+        handler._day = date.today() - timedelta(days=1)
+        handler.emit(_record("hoje"))
+        handler.close()
+        wait_for_maintenance()
+
+        assert len(list_segments(self.log_file)) == 1
+        with open(self.log_file, encoding="utf-8") as f:
+            assert f.read().strip() == "hoje"
+
+    def test_recovers_uncompressed_segments_on_start(self):
+        """Segmentos deixados sem compressão são comprimidos na abertura"""
+        leftover = self.log_file + ".20250101-000000"
+        with open(leftover, "w", encoding="utf-8") as f:
+            f.write("pendente\n")
+
+        CompressingRotatingFileHandler(self.log_file).close()
+        wait_for_maintenance()
+
+        assert not os.path.exists(leftover)
+        assert os.path.exists(leftover + ".gz")
+
+
+class TestSegmentMaintenance:
+    """Testes de compressão e retenção"""
+
+    def test_compress_segment(self, tmp_path):
+        """Segmento é substituído pelo .gz"""
+        segment = tmp_path / "security.json.20250101-000000"
+        segment.write_text('{"a": 1}\n', encoding="utf-8")
+
+        target = compress_segment(str(segment))
+
+        assert target == str(segment) + ".gz"
+        assert not segment.exists()
+        with gzip.open(target, "rt", encoding="utf-8") as f:
+            assert f.read() == '{"a": 1}\n'
+
+    def test_compress_missing_segment(self, tmp_path):
+        """Segmento inexistente é ignorado"""
+        assert compress_segment(str(tmp_path / "nada.log.1")) is None
+
+    def test_sweep_removes_expired_segments(self, tmp_path):
+        """Segmentos mais velhos que a retenção são apagados"""
+        base = str(tmp_path / "app.log")
+        old = tmp_path / "app.log.20200101-000000.gz"
+        new = tmp_path / "app.log.20990101-000000.gz"
+        old.write_bytes(b"x")
+        new.write_bytes(b"y")
+        ancient = time.time() - 100 * 86400
+        os.utime(old, (ancient, ancient))
+
+        removed = sweep_segments(base, backup_count=10, retention_days=30)
+
+        assert removed == 1
+        assert list_segments(base) == [str(new)]
+
+    def test_sweep_ignores_other_logs(self, tmp_path):
+        """Arquivos de outros logs não são tocados"""
+        (tmp_path / "security.json.20200101-000000.gz").write_bytes(b"x")
+
+        assert sweep_segments(str(tmp_path / "app.log"), backup_count=0) == 0
+
+    def test_sweep_expires_legacy_daily_files(self, tmp_path):
+        """Arquivos app_AAAAMMDD.log antigos expiram pela retenção"""
+        base = str(tmp_path / "app.log")
+        old = tmp_path / "app_20200101.log"
+        recent = tmp_path / "app_20261018.log"
+        other = tmp_path / "app_backup.log"
+        for path in (old, recent, other):
+            path.write_text("x")
+        ancient = time.time() - 100 * 86400
+        os.utime(old, (ancient, ancient))
+        os.utime(other, (ancient, ancient))
+
+        removed = sweep_segments(base, backup_count=0, retention_days=30)
+
+        assert removed == 1
+        assert not old.exists()
+        assert recent.exists()
+        assert other.exists()
+        assert list_legacy_files(base) == [str(recent)]
+
+    def test_build_file_handler_follows_config(self, tmp_path):
+        """LOG_ROTATION decide o tipo de handler"""
+        from unittest.mock import patch
+
+        from ozempic_seguro.config import LoggingConfig
+
+        path = str(tmp_path / "x.log")
+        handler = build_file_handler(path)
+        assert isinstance(handler, CompressingRotatingFileHandler)
+        handler.close()
+
+        with patch.object(LoggingConfig, "LOG_ROTATION", False):
+            plain = build_file_handler(path)
+        assert type(plain) is logging.FileHandler
+        plain.close()
+        wait_for_maintenance()
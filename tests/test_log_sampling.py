@@ -0,0 +1,245 @@
+"""
+Testes para o limite de taxa de logs repetitivos.
+"""
+import logging
+import threading
+
+from ozempic_seguro.config import LoggingConfig
+from ozempic_seguro.core.log_queue import QueueingHandler, queue_handlers
+from ozempic_seguro.core.log_sampling import (
+    RateLimitFilter,
+    RateLimitRule,
+    flush_rate_limits,
+    rules_from_config,
+)
+from ozempic_seguro.core.scheduler import Scheduler
+
+
+class _FakeScheduler:
+    """Guarda as tarefas agendadas sem executá-las"""
+
+    def __init__(self):
+        self.calls = []
+
+    def call_later(self, delay, callback):
+        task = _FakeTask()
+        self.calls.append((delay, callback, task))
+        return task
+
+
+class _FakeTask:
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def handle(self, record):
+        self.records.append(record)
+        return True
+
+
+def _record(msg, name="app", level=logging.INFO, args=()):
+    return logging.makeLogRecord(
+        {
+            "name": name,
+            "msg": msg,
+            "args": args,
+            "levelno": level,
+            "levelname": logging.getLevelName(level),
+        }
+    )
+
+
+def _make_filter(now, rules=(), burst=3, window=10.0):
+    sink = _ListHandler()
+    sched = _FakeScheduler()
+    rate_limit = RateLimitFilter(
+        rules=rules,
+        default_burst=burst,
+        default_window=window,
+        clock=lambda: now[0],
+        scheduler=sched,
+    )
+    rate_limit.bind(sink)
+    return rate_limit, sink, sched
+
+
+class TestRateLimitFilter:
+    """Testes para RateLimitFilter"""
+
+    def test_burst_then_suppress(self):
+        """Passam os primeiros N registros da janela"""
+        now = [0.0]
+        rate_limit, _, _ = _make_filter(now)
+
+        results = [rate_limit.filter(_record("Cache hit: %s", args=(i,))) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert rate_limit.suppressed_total == 2
+
+    def test_summary_emitted_when_window_rolls(self):
+        """Nova janela emite o resumo dos suprimidos"""
+        now = [0.0]
+        rate_limit, sink, sched = _make_filter(now)
+        for _ in range(5):
+            rate_limit.filter(_record("Cache hit"))
+
+        now[0] = 10.0
+        assert rate_limit.filter(_record("Cache hit")) is True
+
+        assert len(sink.records) == 1
+        summary = sink.records[0]
+        assert summary.suppressed_count == 2
+        assert "2 mensagens semelhantes suprimidas" in summary.getMessage()
+        assert summary.name == "app"
+        assert sched.calls[0][2].cancelled
+
+    def test_scheduled_summary_delay_matches_window_end(self):
+        """Resumo é agendado para o fim da janela"""
+        now = [0.0]
+        rate_limit, sink, sched = _make_filter(now)
+        for _ in range(3):
+            rate_limit.filter(_record("x"))
+        now[0] = 4.0
+        rate_limit.filter(_record("x"))
+        rate_limit.filter(_record("x"))
+
+        assert len(sched.calls) == 1
+        delay, callback, _ = sched.calls[0]
+        assert delay == 6.0
+
+        callback()
+        assert sink.records[0].suppressed_count == 2
+
+    def test_summary_uses_highest_suppressed_level(self):
+        """Resumo herda o nível mais alto entre os suprimidos"""
+        now = [0.0]
+        rule = RateLimitRule("Login attempt for locked user", burst=1, window=60.0)
+        rate_limit, sink, _ = _make_filter(now, rules=(rule,))
+
+        rate_limit.filter(_record("Login attempt for locked user: a", level=logging.INFO))
+        rate_limit.filter(_record("Login attempt for locked user: b", level=logging.INFO))
+        rate_limit.filter(_record("Login attempt for locked user: c", level=logging.WARNING))
+        rate_limit.flush()
+
+        assert sink.records[0].levelno == logging.WARNING
+
+    def test_rule_groups_formatted_messages(self):
+        """Regra agrupa mensagens montadas com f-string pelo prefixo"""
+        now = [0.0]
+        rule = RateLimitRule("Login attempt for locked user", burst=2, window=60.0)
+        rate_limit, _, _ = _make_filter(now, rules=(rule,), burst=100)
+
+        results = [
+            rate_limit.filter(_record(f"Login attempt for locked user: u{i}")) for i in range(4)
+        ]
+
+        assert results == [True, True, False, False]
+
+    def test_rule_logger_prefix(self):
+        """Regra com logger só vale para esse logger"""
+        now = [0.0]
+        rule = RateLimitRule("Tick", burst=1, window=10.0, logger="ozempic_seguro.timer")
+        rate_limit, _, _ = _make_filter(now, rules=(rule,), burst=None)
+
+        assert rate_limit.filter(_record("Tick", name="ozempic_seguro.timer"))
+        assert not rate_limit.filter(_record("Tick", name="ozempic_seguro.timer"))
+        assert rate_limit.filter(_record("Tick", name="outro"))
+        assert rate_limit.filter(_record("Tick", name="outro"))
+
+    def test_errors_without_rule_never_suppressed(self):
+        """ERROR sem regra explícita sempre passa"""
+        now = [0.0]
+        rate_limit, _, _ = _make_filter(now, burst=1)
+
+        assert all(rate_limit.filter(_record("falha", level=logging.ERROR)) for _ in range(10))
+
+    def test_distinct_templates_counted_separately(self):
+        """Templates diferentes têm contagens próprias"""
+        now = [0.0]
+        rate_limit, _, _ = _make_filter(now, burst=1)
+
+        assert rate_limit.filter(_record("a %s", args=(1,)))
+        assert rate_limit.filter(_record("b %s", args=(1,)))
+        assert not rate_limit.filter(_record("a %s", args=(2,)))
+
+    def test_summary_records_bypass_filter(self):
+        """Linhas de resumo não são limitadas"""
+        now = [0.0]
+        rate_limit, _, _ = _make_filter(now, burst=0)
+        summary = _record("resumo")
+        summary.suppressed_count = 5
+
+        assert rate_limit.filter(summary) is True
+
+    def test_keys_are_bounded(self):
+        """Número de chaves rastreadas é limitado"""
+        now = [0.0]
+        rate_limit = RateLimitFilter(
+            rules=(),
+            default_burst=1,
+            max_keys=100,
+            clock=lambda: now[0],
+            scheduler=_FakeScheduler(),
+        )
+        for i in range(1000):
+            rate_limit.filter(_record(f"mensagem {i}"))
+
+        assert len(rate_limit._windows) == 100
+
+    def test_flush_rate_limits_emits_pending(self):
+        """flush_rate_limits emite resumos de todos os filtros"""
+        now = [0.0]
+        rate_limit, sink, _ = _make_filter(now, burst=1)
+        rate_limit.filter(_record("x"))
+        rate_limit.filter(_record("x"))
+
+        assert flush_rate_limits() >= 1
+        assert sink.records[0].suppressed_count == 1
+        assert rate_limit.flush() == 0
+
+    def test_scheduler_emits_summary_after_window(self):
+        """Com o agendador real, o resumo sai sem novos registros"""
+        sched = Scheduler(name="test-rate-limit")
+        emitted = threading.Event()
+        sink = _ListHandler()
+        sink.handle = lambda record: (sink.records.append(record), emitted.set())
+        try:
+            rate_limit = RateLimitFilter(
+                rules=(), default_burst=1, default_window=0.05, scheduler=sched
+            )
+            rate_limit.bind(sink)
+            rate_limit.filter(_record("x"))
+            rate_limit.filter(_record("x"))
+
+            assert emitted.wait(1.0)
+            assert sink.records[0].suppressed_count == 1
+        finally:
+            sched.shutdown()
+
+
+class TestRateLimitIntegration:
+    """Integração com a fila de logging e configuração"""
+
+    def test_queue_handlers_binds_filter(self):
+        """queue_handlers liga o filtro ao handler criado"""
+        rate_limit = RateLimitFilter(rules=(), scheduler=_FakeScheduler())
+        handler = queue_handlers([logging.NullHandler()], filters=[rate_limit])
+
+        assert isinstance(handler, QueueingHandler)
+        assert rate_limit._emit == handler.handle
+
+    def test_rules_from_config(self):
+        """Regras padrão vêm de LoggingConfig"""
+        rules = rules_from_config()
+
+        assert len(rules) == len(LoggingConfig.LOG_RATE_LIMITS)
+        assert any(r.message_prefix.startswith("Login attempt for locked") for r in rules)
+        assert rules_from_config([("x", 1, 2.0, "app")])[0] == RateLimitRule("x", 1, 2.0, "app")
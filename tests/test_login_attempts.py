@@ -2,8 +2,7 @@
 Testes para LoginAttemptsManager - Controle de tentativas de login.
 """
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import patch
+import sys
 
 from ozempic_seguro.session.login_attempts import LoginAttemptsManager
 from ozempic_seguro.config import Config
@@ -133,25 +132,25 @@ class TestLoginAttemptsManager:
         assert status["locked"] is True
         assert "bloqueado" in status["message"].lower() or "minuto" in status["message"].lower()
 
-    @patch("ozempic_seguro.session.login_attempts.datetime")
-    def test_lockout_expires(self, mock_datetime):
+    def test_lockout_expires(self):
         """Testa que bloqueio expira após tempo configurado"""
         username = "test_user_lockout_expire"
 
-        # Tempo inicial
-        initial_time = datetime(2025, 1, 1, 10, 0, 0)
-        mock_datetime.now.return_value = initial_time
+        # Relógio monotônico controlado pelo teste
+        now = [1000.0]
+        manager = LoginAttemptsManager(clock=lambda: now[0])
 
         # Bloquear usuário
         for _ in range(Config.Security.MAX_LOGIN_ATTEMPTS):
-            self.manager.record_attempt(username, success=False)
+            manager.record_attempt(username, success=False)
+        assert manager.is_locked(username) is True
 
         # Avançar tempo além do lockout
-        future_time = initial_time + timedelta(minutes=Config.Security.LOCKOUT_DURATION_MINUTES + 1)
-        mock_datetime.now.return_value = future_time
+        now[0] += (Config.Security.LOCKOUT_DURATION_MINUTES + 1) * 60
 
         # Deve estar desbloqueado
-        assert self.manager.is_locked(username) is False
+        assert manager.is_locked(username) is False
+        assert manager.get_remaining_attempts(username) == Config.Security.MAX_LOGIN_ATTEMPTS
 
 
 class TestLoginAttemptsManagerEdgeCases:
@@ -242,3 +241,106 @@ class TestLoginAttemptsManagerEdgeCases:
         status = self.manager.get_status_message(username)
         assert status["locked"] is False
         assert status["remaining_attempts"] < Config.Security.MAX_LOGIN_ATTEMPTS
+
+    def test_concurrent_failed_attempts(self):
+        """Testa que tentativas simultâneas não perdem contagem"""
+        import threading
+
+        username = "concurrent_user"
+        max_attempts = Config.Security.MAX_LOGIN_ATTEMPTS
+        barrier = threading.Barrier(max_attempts)
+
+        def tentar():
+            barrier.wait()
+            self.manager.record_attempt(username, success=False)
+
+        threads = [threading.Thread(target=tentar) for _ in range(max_attempts)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert self.manager.get_remaining_attempts(username) == 0
+        assert self.manager.is_locked(username) is True
+
+    def test_still_locked_before_deadline(self):
+        """Testa que bloqueio continua vigente até o prazo"""
+        now = [0.0]
+        manager = LoginAttemptsManager(clock=lambda: now[0])
+        for _ in range(Config.Security.MAX_LOGIN_ATTEMPTS):
+            manager.record_attempt("quase", success=False)
+
+        now[0] += Config.Security.LOCKOUT_DURATION_MINUTES * 60 - 1
+
+        assert manager.is_locked("quase") is True
+        assert manager.get_remaining_time_seconds("quase") == 1
+
+    def test_idle_failures_expire(self):
+        """Testa que falhas antigas sem bloqueio expiram com a janela"""
+        now = [0.0]
+        manager = LoginAttemptsManager(clock=lambda: now[0])
+        manager.record_attempt("ocioso", success=False)
+
+        now[0] += Config.Security.LOCKOUT_DURATION_MINUTES * 60
+
+        assert manager.get_remaining_attempts("ocioso") == Config.Security.MAX_LOGIN_ATTEMPTS
+        assert manager.tracked_count() == 0
+
+
+class TestLoginAttemptsManagerBounded:
+    """Testes do limite de memória das tentativas"""
+
+    def test_evicts_oldest_username_when_full(self):
+        """Testa que o username mais antigo é descartado ao atingir o limite"""
+        manager = LoginAttemptsManager(max_entries=2)
+        manager.record_attempt("a", success=False)
+        manager.record_attempt("b", success=False)
+        manager.record_attempt("a", success=False)  # "a" passa a ser o mais recente
+        manager.record_attempt("c", success=False)
+
+        assert manager.tracked_count() == 2
+        assert manager.get_remaining_attempts("b") == Config.Security.MAX_LOGIN_ATTEMPTS
+        assert manager.get_remaining_attempts("a") == Config.Security.MAX_LOGIN_ATTEMPTS - 2
+
+    def test_lockout_survives_username_flood(self):
+        """Testa que inundar o LRU com usernames novos não derruba um bloqueio"""
+        manager = LoginAttemptsManager(max_entries=10)
+        for _ in range(Config.Security.MAX_LOGIN_ATTEMPTS):
+            manager.record_attempt("vitima", success=False)
+        assert manager.is_locked("vitima")
+
+        for i in range(100):
+            manager.record_attempt(f"descartavel_{i}", success=False)
+
+        assert manager.is_locked("vitima")
+        assert manager.tracked_count() == 10
+
+    def test_success_releases_entry(self):
+        """Testa que login bem-sucedido libera a entrada"""
+        manager = LoginAttemptsManager()
+        manager.record_attempt("ok", success=False)
+        manager.record_attempt("ok", success=True)
+
+        assert manager.tracked_count() == 0
+
+    @pytest.mark.slow
+    def test_memory_flat_with_one_million_usernames(self):
+        """Testa que 1M de usernames distintos não aumenta a memória"""
+        resource = pytest.importorskip("resource")
+        max_entries = 1000
+        manager = LoginAttemptsManager(max_entries=max_entries)
+        record = manager.record_attempt
+        table = manager._login_attempts._data
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        sizes = []
+        for i in range(1_000_000):
+            record(f"brute_{i}", False)
+            if i % 100_000 == 99_999:
+                sizes.append(sys.getsizeof(table))
+        rss_growth_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+        assert manager.tracked_count() == max_entries
+        assert max(sizes) <= 2 * min(sizes)
+        # Sem limite, 1M de entradas ocuparia centenas de MB
+        assert rss_growth_kb < 16 * 1024
@@ -0,0 +1,208 @@
+"""
+Testes para a manutenção do banco em segundo plano.
+"""
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from ozempic_seguro.repositories.connection import DatabaseConnection
+from ozempic_seguro.repositories.maintenance import (
+    TASKS,
+    DatabaseMaintenance,
+    MaintenanceResult,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "manutencao.db")
+
+
+@pytest.fixture
+def writer(db_path):
+    """Conexão da aplicação: mantida aberta para o WAL não ser esvaziado no fechamento"""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("PRAGMA journal_mode = WAL").fetchall()
+    conn.execute("PRAGMA wal_autocheckpoint = 0").fetchall()
+    conn.execute("CREATE TABLE auditoria (id INTEGER PRIMARY KEY, dados TEXT)")
+    conn.executemany(
+        "INSERT INTO auditoria (dados) VALUES (?)", [("x" * 500,) for _ in range(2000)]
+    )
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def maintenance(db_path, clock):
+    m = DatabaseMaintenance(db_path, budget_ms=5000, clock=clock)
+    yield m
+    m.shutdown()
+
+
+def _by_task(results):
+    return {r.task: r for r in results}
+
+
+class TestCheckpoint:
+    """Checkpoint do WAL"""
+
+    def test_truncate_above_threshold(self, writer, maintenance):
+        maintenance.wal_truncate_bytes = 0
+        assert maintenance.wal_size() > 0
+
+        result = maintenance.run(["checkpoint"])[0]
+
+        assert result.status == "ok"
+        assert "TRUNCATE" in result.detail
+        assert maintenance.wal_size() == 0
+
+    def test_passive_below_threshold(self, writer, maintenance):
+        maintenance.wal_truncate_bytes = 1 << 40
+
+        result = maintenance.run(["checkpoint"])[0]
+
+        assert result.status == "ok"
+        assert "PASSIVE" in result.detail
+
+    def test_reader_makes_truncate_busy(self, writer, maintenance, db_path):
+        maintenance.wal_truncate_bytes = 0
+        reader = sqlite3.connect(db_path, isolation_level=None)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM auditoria").fetchone()
+        writer.execute("INSERT INTO auditoria (dados) VALUES ('novo')")
+        try:
+            result = maintenance.run(["checkpoint"])[0]
+        finally:
+            reader.close()
+
+        assert result.status == "busy"
+        assert "checkpoint" in maintenance.due_tasks()
+
+    def test_skipped_without_wal(self, maintenance, db_path):
+        sqlite3.connect(db_path).close()
+
+        assert maintenance.run(["checkpoint"])[0].status == "skipped"
+
+
+class TestOtherTasks:
+    """optimize e VACUUM incremental"""
+
+    def test_optimize(self, writer, maintenance):
+        assert maintenance.run(["optimize"])[0].status == "ok"
+
+    def test_incremental_vacuum_releases_pages(self, writer, maintenance):
+        writer.execute("DELETE FROM auditoria")
+        maintenance.vacuum_pages = 10
+
+        result = maintenance.run(["incremental_vacuum"])[0]
+
+        assert result.status == "ok"
+        assert result.detail.startswith("10 de ")
+
+    def test_incremental_vacuum_requires_auto_vacuum(self, maintenance, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.close()
+
+        result = maintenance.run(["incremental_vacuum"])[0]
+
+        assert result.status == "skipped"
+        assert "auto_vacuum" in result.detail
+
+
+class TestScheduling:
+    """Intervalos, orçamento e interrupção"""
+
+    def test_intervals(self, writer, maintenance, clock):
+        assert maintenance.due_tasks() == list(TASKS)
+
+        maintenance.run()
+        assert maintenance.due_tasks() == []
+
+        clock.now += maintenance.intervals["checkpoint"]
+        assert maintenance.due_tasks() == ["checkpoint"]
+
+    def test_budget_interrupts_long_task(self, writer, maintenance, monkeypatch):
+        def slow(conn):
+            conn.execute(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+                "SELECT COUNT(*) FROM n"
+            ).fetchone()
+            return "ok", ""
+
+        monkeypatch.setattr(maintenance, "_optimize", slow)
+        maintenance.budget_ms = 50
+
+        result = maintenance.run(["optimize", "incremental_vacuum"])
+
+        assert [r.task for r in result] == ["optimize"]
+        assert result[0].status == "interrupted"
+        assert "optimize" in maintenance.due_tasks()
+
+    def test_activity_stops_round(self, writer, maintenance):
+        maintenance.notify_activity()
+
+        assert maintenance.run() == []
+
+    def test_notify_idle_runs_in_background(self, writer, maintenance):
+        assert maintenance.notify_idle()
+
+        results = maintenance.wait(10)
+
+        assert [r.task for r in results] == list(TASKS)
+        assert maintenance.status()[0].task == "incremental_vacuum"
+        assert not maintenance.notify_idle()  # Nada vencido
+
+    def test_disabled(self, db_path):
+        m = DatabaseMaintenance(db_path, enabled=False)
+
+        assert not m.notify_idle()
+
+    def test_no_rounds_after_shutdown(self, writer, maintenance):
+        maintenance.shutdown()
+
+        assert not maintenance.notify_idle()
+
+
+class TestIntegration:
+    """Integração com conexão e diagnóstico"""
+
+    def test_new_database_uses_incremental_auto_vacuum(self, tmp_path):
+        DatabaseConnection._instance = None
+        try:
+            with patch.object(
+                DatabaseConnection, "_get_db_path", return_value=str(tmp_path / "novo.db")
+            ):
+                db = DatabaseConnection.get_instance()
+                db.execute("PRAGMA auto_vacuum")
+                assert db.fetchone()[0] == 2
+                assert db.db_path == str(tmp_path / "novo.db")
+        finally:
+            DatabaseConnection.reset_instance()
+
+    def test_diagnostico_formats_result(self):
+        from ozempic_seguro.views.pages_adm.diagnostico_view import DiagnosticoFrame
+
+        line = DiagnosticoFrame.formatar_manutencao(
+            MaintenanceResult("checkpoint", 0.0, 3.2, "ok", "TRUNCATE: 10/10 páginas")
+        )
+
+        assert "checkpoint" in line
+        assert "ok" in line
+        assert "3 ms" in line
+        assert line.endswith("TRUNCATE: 10/10 páginas")
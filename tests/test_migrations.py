@@ -0,0 +1,153 @@
+"""
+Testes para o manifesto e o executor de migrations.
+"""
+import builtins
+import os
+import sqlite3
+
+import pytest
+
+from ozempic_seguro.core.exceptions import MigrationError
+from ozempic_seguro.repositories.migrations import (
+    LATEST_VERSION,
+    MANIFEST,
+    MIGRATIONS_DIR,
+    Migration,
+    checksum,
+    run_migrations,
+)
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def _tables(connection):
+    return {
+        row[0]
+        for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+
+
+def _user_version(connection):
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _write_manifest(directory, scripts):
+    manifest = []
+    for version, (name, sql) in enumerate(scripts, start=1):
+        (directory / name).write_text(sql, encoding="utf-8")
+        manifest.append(Migration(version, name, checksum(sql)))
+    return tuple(manifest)
+
+
+class TestManifest:
+    """O manifesto acompanha os scripts do diretório"""
+
+    def test_manifest_lists_every_script(self):
+        scripts = sorted(f for f in os.listdir(MIGRATIONS_DIR) if f.endswith(".sql"))
+
+        assert [m.name for m in MANIFEST] == scripts
+
+    def test_versions_sequential(self):
+        assert [m.version for m in MANIFEST] == list(range(1, len(MANIFEST) + 1))
+        for migration in MANIFEST:
+            assert int(migration.name.split("_")[0]) == migration.version
+
+    @pytest.mark.parametrize("migration", MANIFEST, ids=lambda m: m.name)
+    def test_checksums_match(self, migration):
+        with open(os.path.join(MIGRATIONS_DIR, migration.name), encoding="utf-8") as f:
+            actual = checksum(f.read())
+
+        assert actual == migration.checksum, f"Atualize o MANIFEST: {migration.name} -> {actual}"
+
+    def test_checksum_ignores_crlf(self):
+        assert checksum("CREATE TABLE t (id);\r\n") == checksum("CREATE TABLE t (id);\n")
+
+
+class TestRunMigrations:
+    """Testes para run_migrations"""
+
+    def test_fresh_database(self, conn):
+        """Banco novo recebe todas as migrations e o user_version"""
+        applied = run_migrations(conn)
+
+        assert applied == [m.name for m in MANIFEST]
+        assert _user_version(conn) == LATEST_VERSION
+        assert {"usuarios", "bootstrap", "state_journal", "migrations"} <= _tables(conn)
+        rows = conn.execute("SELECT version, checksum FROM migrations ORDER BY version").fetchall()
+        assert rows == [(m.version, m.checksum) for m in MANIFEST]
+
+    def test_current_database_single_pragma(self, conn, monkeypatch):
+        """Banco em dia: uma leitura de pragma e nenhum acesso a arquivos"""
+        run_migrations(conn)
+
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("acesso ao sistema de arquivos")
+
+        monkeypatch.setattr(builtins, "open", fail)
+        monkeypatch.setattr(os, "listdir", fail)
+
+        assert run_migrations(conn) == []
+        assert statements == ["PRAGMA user_version"]
+
+    def test_legacy_history_upgraded(self, conn):
+        """Banco anterior ao manifesto ganha checksums sem reaplicar scripts"""
+        conn.execute(
+            "CREATE TABLE migrations (version INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        for migration in MANIFEST:
+            conn.execute(
+                "INSERT INTO migrations (version, name) VALUES (?, ?)",
+                (migration.version, migration.name),
+            )
+        conn.commit()
+
+        assert run_migrations(conn) == []
+        assert _user_version(conn) == LATEST_VERSION
+        assert "usuarios" not in _tables(conn)
+        recorded = [row[0] for row in conn.execute("SELECT checksum FROM migrations")]
+        assert recorded == [m.checksum for m in MANIFEST]
+
+    def test_only_pending_applied(self, conn, tmp_path):
+        """Apenas as versões novas rodam"""
+        manifest = _write_manifest(
+            tmp_path,
+            [("001_a.sql", "CREATE TABLE a (id INTEGER);"), ("002_b.sql", "CREATE TABLE b (id);")],
+        )
+        run_migrations(conn, manifest[:1], str(tmp_path))
+
+        assert run_migrations(conn, manifest, str(tmp_path)) == ["002_b.sql"]
+        assert _user_version(conn) == 2
+
+    def test_tampered_script_rejected(self, conn, tmp_path):
+        """Script diferente do manifesto não é aplicado"""
+        manifest = _write_manifest(tmp_path, [("001_a.sql", "CREATE TABLE a (id);")])
+        (tmp_path / "001_a.sql").write_text("DROP TABLE usuarios;", encoding="utf-8")
+
+        with pytest.raises(MigrationError):
+            run_migrations(conn, manifest, str(tmp_path))
+        assert _user_version(conn) == 0
+        assert "a" not in _tables(conn)
+
+    def test_failure_rolls_back_whole_batch(self, conn, tmp_path):
+        """Erro em uma migration desfaz o lote inteiro"""
+        manifest = _write_manifest(
+            tmp_path,
+            [("001_a.sql", "CREATE TABLE a (id);"), ("002_b.sql", "CREATE TABLE ???;")],
+        )
+
+        with pytest.raises(MigrationError):
+            run_migrations(conn, manifest, str(tmp_path))
+
+        assert _user_version(conn) == 0
+        assert "a" not in _tables(conn)
+        assert conn.execute("SELECT COUNT(*) FROM migrations").fetchone()[0] == 0
+        assert not conn.in_transaction
@@ -0,0 +1,107 @@
+"""
+Testes para os perfis de PRAGMA.
+"""
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from ozempic_seguro.config import Config
+from ozempic_seguro.repositories.connection import DatabaseConnection
+from ozempic_seguro.repositories.pragmas import (
+    PROFILE_ENV_VAR,
+    apply_pragmas,
+    current_pragmas,
+    pragma_statements,
+    resolve_profile,
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "pragmas.db"))
+    connection.execute("PRAGMA journal_mode = WAL").fetchall()
+    yield connection
+    connection.close()
+
+
+class TestResolveProfile:
+    """Testes para resolve_profile"""
+
+    def test_default_from_config(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+
+        name, settings = resolve_profile()
+
+        assert name == Config.Database.PRAGMA_PROFILE
+        assert settings is Config.Database.PRAGMA_PROFILES[name]
+
+    def test_env_var_overrides(self, monkeypatch):
+        monkeypatch.setenv(PROFILE_ENV_VAR, " Fast-Read ")
+
+        assert resolve_profile()[0] == "fast-read"
+
+    def test_explicit_name_wins(self, monkeypatch):
+        monkeypatch.setenv(PROFILE_ENV_VAR, "fast-read")
+
+        assert resolve_profile("balanced")[0] == "balanced"
+
+    def test_unknown_falls_back(self, monkeypatch):
+        monkeypatch.setenv(PROFILE_ENV_VAR, "turbo")
+
+        assert resolve_profile()[0] == Config.Database.PRAGMA_PROFILE
+
+
+class TestPragmaStatements:
+    """Testes para pragma_statements e apply_pragmas"""
+
+    def test_all_profiles_valid(self):
+        for settings in Config.Database.PRAGMA_PROFILES.values():
+            assert len(pragma_statements(settings)) == 6
+
+    def test_invalid_keyword_rejected(self):
+        with pytest.raises(ValueError):
+            pragma_statements({"synchronous": "FULL; DROP TABLE usuarios"})
+
+    def test_unknown_pragma_rejected(self):
+        with pytest.raises(ValueError):
+            pragma_statements({"journal_mode": "DELETE"})
+
+    def test_non_integer_rejected(self):
+        with pytest.raises(ValueError):
+            pragma_statements({"cache_size": "2000; DROP TABLE usuarios"})
+
+    @pytest.mark.parametrize("profile", sorted(Config.Database.PRAGMA_PROFILES))
+    def test_apply_profile(self, conn, profile):
+        settings = Config.Database.PRAGMA_PROFILES[profile]
+
+        apply_pragmas(conn, settings)
+        values = current_pragmas(conn)
+
+        assert values["synchronous"] == {"OFF": 0, "NORMAL": 1, "FULL": 2}[settings["synchronous"]]
+        assert values["temp_store"] == {"DEFAULT": 0, "MEMORY": 2}[settings["temp_store"]]
+        assert values["cache_size"] == settings["cache_size"]
+        assert values["busy_timeout"] == settings["busy_timeout"]
+        assert values["wal_autocheckpoint"] == settings["wal_autocheckpoint"]
+        assert not conn.in_transaction
+
+
+class TestConnectionProfile:
+    """DatabaseConnection aplica o perfil escolhido"""
+
+    def test_connection_uses_env_profile(self, tmp_path):
+        DatabaseConnection._instance = None
+        db_path = str(tmp_path / "perfil.db")
+        try:
+            with patch.dict(os.environ, {PROFILE_ENV_VAR: "balanced"}), patch.object(
+                DatabaseConnection, "_get_db_path", return_value=db_path
+            ):
+                db = DatabaseConnection.get_instance()
+
+                assert db.pragma_profile == "balanced"
+                assert current_pragmas(db.conn)["synchronous"] == 1
+                db.execute("SELECT COUNT(*) FROM usuarios")
+                assert db.fetchone()[0] >= 2
+        finally:
+            DatabaseConnection.reset_instance()
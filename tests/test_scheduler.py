@@ -0,0 +1,159 @@
+"""
+Testes para o agendador compartilhado de prazos.
+"""
+import threading
+import time
+
+import pytest
+
+from ozempic_seguro.core.scheduler import Scheduler, get_scheduler
+
+
+@pytest.fixture
+def scheduler():
+    sched = Scheduler(name="test-scheduler")
+    yield sched
+    sched.shutdown()
+
+
+class TestScheduler:
+    """Testes para Scheduler"""
+
+    def test_call_later_fires(self, scheduler):
+        """Tarefa é executada após o prazo"""
+        fired = threading.Event()
+        task = scheduler.call_later(0.02, fired.set)
+
+        assert fired.wait(1.0)
+        assert task.active is False
+
+    def test_cancel_prevents_execution(self, scheduler):
+        """Tarefa cancelada não executa"""
+        fired = threading.Event()
+        task = scheduler.call_later(0.05, fired.set)
+        task.cancel()
+
+        assert not fired.wait(0.15)
+        assert task.reschedule(1) is False
+
+    def test_reschedule_later_delays_execution(self, scheduler):
+        """Adiar o prazo atrasa a execução"""
+        fired_at = []
+        start = time.monotonic()
+        task = scheduler.call_later(0.05, lambda: fired_at.append(time.monotonic()))
+
+        assert task.reschedule(0.2) is True
+        time.sleep(0.4)
+
+        assert len(fired_at) == 1
+        assert fired_at[0] - start >= 0.2
+
+    def test_reschedule_earlier_fires_sooner(self, scheduler):
+        """Antecipar o prazo executa antes do prazo original"""
+        fired = threading.Event()
+        task = scheduler.call_later(30, fired.set)
+
+        task.reschedule(0.02)
+
+        assert fired.wait(1.0)
+
+    def test_tasks_fire_in_deadline_order(self, scheduler):
+        """Tarefas executam na ordem dos prazos"""
+        order = []
+        done = threading.Event()
+        scheduler.call_later(0.06, lambda: (order.append("b"), done.set()))
+        scheduler.call_later(0.02, lambda: order.append("a"))
+
+        assert done.wait(1.0)
+        assert order == ["a", "b"]
+
+    def test_callback_error_does_not_stop_scheduler(self, scheduler):
+        """Exceção em callback não derruba a thread"""
+        fired = threading.Event()
+
+        def falha():
+            raise RuntimeError("boom")
+
+        scheduler.call_later(0.01, falha)
+        scheduler.call_later(0.03, fired.set)
+
+        assert fired.wait(1.0)
+
+    def test_pending_count(self, scheduler):
+        """pending_count conta apenas tarefas ativas"""
+        t1 = scheduler.call_later(30, lambda: None)
+        scheduler.call_later(30, lambda: None)
+        t1.reschedule(10)  # Nova entrada no heap para a mesma tarefa
+
+        assert scheduler.pending_count() == 2
+        t1.cancel()
+        assert scheduler.pending_count() == 1
+
+    def test_many_reschedules_use_single_thread(self, scheduler):
+        """Reagendar repetidamente não cria threads nem cresce o heap"""
+        task = scheduler.call_later(30, lambda: None)
+        threads_before = threading.active_count()
+
+        for _ in range(10000):
+            task.reschedule(30)
+
+        assert threading.active_count() == threads_before
+        assert len(scheduler._heap) == 1
+
+    def test_remaining(self):
+        """remaining usa o relógio injetado"""
+        now = [100.0]
+        sched = Scheduler(clock=lambda: now[0])
+        try:
+            task = sched.call_later(60, lambda: None)
+            now[0] = 130.0
+            assert task.remaining() == pytest.approx(30.0)
+            task.cancel()
+            assert task.remaining() == 0.0
+        finally:
+            sched.shutdown()
+
+    def test_get_scheduler_singleton(self):
+        """get_scheduler retorna sempre a mesma instância"""
+        assert get_scheduler() is get_scheduler()
+
+
+class TestSchedulerIntegration:
+    """Integração com sessão e bloqueios"""
+
+    def test_session_activity_does_not_spawn_threads(self):
+        """update_activity reagenda o prazo sem criar threads"""
+        from ozempic_seguro.session.session_manager import SessionManager
+
+        manager = SessionManager.get_instance()
+        manager.set_current_user({"id": 1, "username": "admin", "tipo": "administrador"})
+        try:
+            task = manager._timeout_timer
+            threads_before = threading.active_count()
+
+            for _ in range(1000):
+                manager.update_activity()
+
+            assert manager._timeout_timer is task
+            assert threading.active_count() == threads_before
+        finally:
+            manager.logout()
+
+    def test_lockout_sweep_discards_expired_entries(self):
+        """Varredura descarta entradas vencidas e mantém as vigentes"""
+        from ozempic_seguro.session.login_attempts import LoginAttemptsManager
+
+        now = [0.0]
+        manager = LoginAttemptsManager(clock=lambda: now[0])
+        manager.record_attempt("vencido", success=False)
+        now[0] += 120
+        manager.record_attempt("vigente", success=False)
+        now[0] += manager._lockout_duration * 60 - 60
+
+        manager._sweep_expired()
+
+        assert manager.tracked_count() == 1
+        assert manager.get_remaining_attempts("vigente") < manager._max_login_attempts
+        assert manager._sweep_task is not None and manager._sweep_task.active
+        assert manager._sweep_task.remaining() == pytest.approx(60, abs=1)
+        manager._sweep_task.cancel()
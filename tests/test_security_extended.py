@@ -2,11 +2,21 @@
 Testes para módulo security - Hash de senhas.
 """
 
+import pytest
+
+from ozempic_seguro.repositories import security
 from ozempic_seguro.repositories.security import (
     hash_password,
     verify_password,
     is_bcrypt_hash,
+    get_hash_rounds,
+    needs_rehash,
+    calibrate_bcrypt_rounds,
+    configure_bcrypt_rounds,
+    get_default_rounds,
+    set_default_rounds,
 )
+from ozempic_seguro.config import Config
 
 
 class TestPasswordFunctions:
@@ -82,3 +92,74 @@ class TestPasswordFunctions:
         result = verify_password(password, invalid_hash)
 
         assert result is False
+
+
+class TestBcryptRounds:
+    """Testes para calibração e rehash do bcrypt"""
+
+    @pytest.fixture(autouse=True)
+    def reset_rounds(self, monkeypatch):
+        """Restaura custo padrão após cada teste"""
+        monkeypatch.delenv("OZEMPIC_BCRYPT_ROUNDS", raising=False)
+        set_default_rounds(None)
+        yield
+        set_default_rounds(None)
+
+    def test_default_rounds_from_config(self):
+        """Testa custo padrão vindo da configuração"""
+        assert get_default_rounds() == Config.Security.BCRYPT_ROUNDS
+
+    def test_default_rounds_from_env(self, monkeypatch):
+        """Testa que OZEMPIC_BCRYPT_ROUNDS é respeitado"""
+        monkeypatch.setenv("OZEMPIC_BCRYPT_ROUNDS", "11")
+
+        assert get_default_rounds() == 11
+        assert get_hash_rounds(hash_password("senha")) == 11
+
+    def test_env_rounds_clamped_to_minimum(self, monkeypatch):
+        """Testa que custo abaixo do mínimo é elevado"""
+        monkeypatch.setenv("OZEMPIC_BCRYPT_ROUNDS", "4")
+
+        assert get_default_rounds() == Config.Security.BCRYPT_MIN_ROUNDS
+
+    def test_invalid_env_rounds_ignored(self, monkeypatch):
+        """Testa que valor inválido cai no padrão"""
+        monkeypatch.setenv("OZEMPIC_BCRYPT_ROUNDS", "abc")
+
+        assert get_default_rounds() == Config.Security.BCRYPT_ROUNDS
+
+    def test_get_hash_rounds(self):
+        """Testa extração do custo do hash"""
+        assert get_hash_rounds(hash_password("senha", rounds=10)) == 10
+        assert get_hash_rounds("invalid_hash") is None
+
+    def test_needs_rehash(self):
+        """Testa detecção de hash com custo abaixo do desejado"""
+        hashed = hash_password("senha", rounds=10)
+
+        assert needs_rehash(hashed, rounds=11) is True
+        assert needs_rehash(hashed, rounds=10) is False
+        assert needs_rehash("invalid_hash") is False
+
+    def test_calibrate_respects_budget(self, monkeypatch):
+        """Testa que a calibração dobra o tempo a cada round"""
+        monkeypatch.setattr(security.time, "perf_counter", iter([0.0, 0.05]).__next__)
+
+        # 50ms no mínimo -> 100ms (11) -> 200ms (12) -> 400ms excede 250ms
+        assert calibrate_bcrypt_rounds(target_ms=250, min_rounds=10, max_rounds=16) == 12
+
+    def test_calibrate_clamped_to_limits(self, monkeypatch):
+        """Testa limites mínimo e máximo da calibração"""
+        monkeypatch.setattr(security.time, "perf_counter", iter([0.0, 1.0]).__next__)
+        assert calibrate_bcrypt_rounds(target_ms=10, min_rounds=10, max_rounds=16) == 10
+
+        monkeypatch.setattr(security.time, "perf_counter", iter([0.0, 0.0001]).__next__)
+        assert calibrate_bcrypt_rounds(target_ms=10_000, min_rounds=10, max_rounds=13) == 13
+
+    def test_configure_prefers_env(self, monkeypatch):
+        """Testa que variável de ambiente dispensa a calibração"""
+        monkeypatch.setenv("OZEMPIC_BCRYPT_ROUNDS", "11")
+        monkeypatch.setattr(security, "calibrate_bcrypt_rounds", lambda: pytest.fail())
+
+        assert configure_bcrypt_rounds() == 11
+        assert get_default_rounds() == 11
@@ -257,3 +257,82 @@ class TestServiceRegistryAdditional:
         # Serviço real deve continuar
         result = self.registry.get_service("real_svc", lambda: {"new": True})
         assert result == {"real": True}
+
+    def test_override_is_scoped(self):
+        """Testa que override vale apenas dentro do bloco"""
+        self.registry.register_service("svc", {"real": True})
+
+        with self.registry.override("svc", {"fake": True}):
+            assert self.registry.get_service("svc", lambda: None) == {"fake": True}
+
+        assert self.registry.get_service("svc", lambda: None) == {"real": True}
+
+    def test_override_restores_previous_mock(self):
+        """Testa que override aninhado restaura o mock anterior"""
+        self.registry.set_mock("svc", {"mock": True})
+
+        with self.registry.override("svc", {"inner": True}):
+            assert self.registry.get_service("svc", lambda: None) == {"inner": True}
+
+        assert self.registry.get_service("svc", lambda: None) == {"mock": True}
+
+
+class TestApplicationContainer:
+    """Testes para o container compartilhado usado pelas views"""
+
+    def test_view_services_are_shared(self):
+        """Testa que as funções get_* retornam sempre a mesma instância"""
+        from ozempic_seguro.services.auth_service import get_auth_service
+        from ozempic_seguro.services.audit_view_service import get_audit_view_service
+        from ozempic_seguro.services.timer_control_service import get_timer_control_service
+        from ozempic_seguro.services.user_management_service import get_user_management_service
+        from ozempic_seguro.services.user_registration_service import (
+            get_user_registration_service,
+        )
+
+        for getter in (
+            get_auth_service,
+            get_audit_view_service,
+            get_timer_control_service,
+            get_user_management_service,
+            get_user_registration_service,
+        ):
+            assert getter() is getter()
+
+    def test_services_share_dependencies(self):
+        """Testa que os serviços reutilizam o mesmo UserService e repositórios"""
+        user_service = ServiceFactory.get_user_service()
+
+        assert ServiceFactory.get_auth_service()._user_service is user_service
+        assert ServiceFactory.get_user_management_service()._user_service is user_service
+        assert ServiceFactory.get_user_registration_service()._user_service is user_service
+        assert (
+            ServiceFactory.get_audit_view_service()._audit_service
+            is ServiceFactory.get_audit_service()
+        )
+        assert user_service.audit_repo is ServiceFactory.get_audit_repository()
+
+    def test_override_replaces_service_for_views(self):
+        """Testa override de serviço resolvido pelas views"""
+        from unittest.mock import Mock
+        from ozempic_seguro.services.auth_service import get_auth_service
+
+        fake = Mock()
+        real = get_auth_service()
+
+        with ServiceFactory.override("auth_service", fake):
+            assert get_auth_service() is fake
+
+        assert get_auth_service() is real
+
+    def test_injected_dependencies(self):
+        """Testa injeção explícita de dependências nos construtores"""
+        from unittest.mock import Mock
+        from ozempic_seguro.services.auth_service import AuthService
+
+        user_service = Mock()
+        session = Mock()
+        service = AuthService(user_service=user_service, session_manager=session)
+
+        assert service._user_service is user_service
+        assert service._session_manager is session
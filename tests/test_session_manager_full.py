@@ -496,3 +496,106 @@ class TestSessionManagerAuditCallback:
         SessionManager.set_audit_callback(callback)
 
         assert SessionManager._audit_callback is callback
+
+
+class TestSessionManagerSnapshot:
+    """Testes do snapshot imutável e da concorrência entre atividade e expiração"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup para cada teste"""
+        self.session = SessionManager.get_instance()
+        self.session.cleanup()
+        yield
+        self.session.cleanup()
+
+    def test_snapshot_is_immutable(self):
+        """Testa que o snapshot não pode ser alterado"""
+        import dataclasses
+
+        self.session.set_current_user({"id": 7, "username": "snap", "tipo": "vendedor"})
+        snapshot = self.session.snapshot
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.user_id = 8
+        assert snapshot.user_id == 7
+        assert snapshot.tipo == "vendedor"
+
+    def test_update_activity_swaps_snapshot(self):
+        """Testa que atualizar atividade gera novo snapshot"""
+        self.session.set_current_user({"id": 1, "username": "a", "tipo": "vendedor"})
+        before = self.session.snapshot
+
+        self.session.update_activity()
+
+        assert self.session.snapshot is not before
+        assert before.user is self.session.snapshot.user
+
+    def test_expire_with_fresh_activity_keeps_session(self):
+        """Testa que prazo disparado após nova atividade não derruba a sessão"""
+        self.session.set_current_user({"id": 1, "username": "a", "tipo": "vendedor"})
+
+        self.session._expire_session()
+
+        assert self.session.is_logged_in() is True
+        assert self.session._timeout_timer is not None
+
+    def test_expire_after_timeout_logs_out(self):
+        """Testa expiração quando o prazo realmente venceu"""
+        from datetime import datetime, timedelta
+
+        self.session.set_current_user({"id": 1, "username": "a", "tipo": "vendedor"})
+        self.session._last_activity = datetime.now() - timedelta(minutes=60)
+
+        self.session._expire_session()
+
+        assert self.session.is_logged_in() is False
+        assert self.session.get_user_id() is None
+
+    @pytest.mark.slow
+    def test_activity_vs_expiry_stress(self):
+        """Testa atividade, expiração e leituras simultâneas sem estado inconsistente"""
+        import threading
+        from datetime import datetime, timedelta
+
+        user = {"id": 99, "username": "stress", "tipo": "administrador"}
+        stop = threading.Event()
+        errors = []
+
+        def activity():
+            while not stop.is_set():
+                self.session.update_activity()
+                if not self.session.is_logged_in():
+                    self.session.set_current_user(user)
+
+        def expiry():
+            while not stop.is_set():
+                self.session._last_activity = datetime.now() - timedelta(hours=1)
+                self.session._expire_session()
+
+        def reader():
+            while not stop.is_set():
+                state = self.session.snapshot
+                if state.user is None:
+                    if state.user_id is not None or state.tipo is not None:
+                        errors.append(state)
+                elif (
+                    state.user_id != 99
+                    or state.tipo != "administrador"
+                    or state.last_activity is None
+                ):
+                    errors.append(state)
+
+        self.session.set_current_user(user)
+        threads = [threading.Thread(target=fn) for fn in (activity, expiry, reader, reader)]
+        for t in threads:
+            t.start()
+        stop.wait(1.0)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        # Estado final coerente com o timer
+        state = self.session.snapshot
+        assert (state.user is None) == (self.session._timeout_timer is None)
@@ -0,0 +1,136 @@
+"""
+Testes para o pipeline de inicialização.
+"""
+import threading
+import time
+
+import pytest
+
+from ozempic_seguro.core.startup_pipeline import StartupPipeline, StartupStep
+from ozempic_seguro.core.startup_profiler import StartupProfiler
+
+
+@pytest.fixture
+def pipeline():
+    pipe = StartupPipeline(profiler=StartupProfiler(enabled=False))
+    yield pipe
+    pipe.shutdown()
+
+
+class TestStartupPipeline:
+    """Testes para StartupPipeline"""
+
+    def test_independent_steps_run_concurrently(self, pipeline):
+        """Etapas sem dependência entre si rodam em paralelo"""
+        # Cada etapa só passa da barreira se a outra estiver rodando ao mesmo tempo;
+        # em série, a primeira estoura o timeout e a etapa falha
+        barrier = threading.Barrier(2, timeout=2.0)
+        pipeline.add("db", barrier.wait)
+        pipeline.add("images", barrier.wait)
+
+        pipeline.start()
+        assert pipeline.wait(5.0)
+
+        assert pipeline.state("db") == StartupStep.DONE
+        assert pipeline.state("images") == StartupStep.DONE
+
+    def test_dependencies_respected(self, pipeline):
+        """Etapa só roda depois das dependências"""
+        order = []
+        pipeline.add("db", lambda: (time.sleep(0.05), order.append("db")))
+        pipeline.add("audit", lambda: order.append("audit"), depends=("db",))
+
+        pipeline.start()
+        assert pipeline.wait(2.0)
+
+        assert order == ["db", "audit"]
+
+    def test_ui_steps_run_on_polling_thread(self, pipeline):
+        """Etapas de UI rodam na thread que chama poll/wait"""
+        threads = {}
+        pipeline.add("db", lambda: threads.setdefault("db", threading.current_thread()))
+        pipeline.add(
+            "audit",
+            lambda: threads.setdefault("audit", threading.current_thread()),
+            depends=("db",),
+            ui=True,
+        )
+
+        pipeline.start()
+        assert pipeline.wait(2.0)
+
+        assert threads["audit"] is threading.current_thread()
+        assert threads["db"] is not threading.current_thread()
+
+    def test_poll_reports_remaining_steps(self, pipeline):
+        """poll devolve quantas etapas faltam"""
+        gate = threading.Event()
+        pipeline.add("db", gate.wait)
+
+        pipeline.start()
+        assert pipeline.poll() == 1
+        assert not pipeline.finished
+
+        gate.set()
+        assert pipeline.wait(2.0)
+        assert pipeline.poll() == 0
+        assert pipeline.elapsed_ms is not None
+
+    def test_failure_skips_dependents(self, pipeline):
+        """Falha pula as dependentes e não afeta as demais"""
+
+        def falha():
+            raise RuntimeError("banco indisponível")
+
+        ran = []
+        pipeline.add("db", falha)
+        pipeline.add("images", lambda: ran.append("images"))
+        pipeline.add("audit", lambda: ran.append("audit"), depends=("db",), ui=True)
+
+        pipeline.start()
+        assert pipeline.wait(2.0)
+
+        assert ran == ["images"]
+        failures = pipeline.failures()
+        assert set(failures) == {"db", "audit"}
+        assert "banco indisponível" in str(failures["db"])
+
+    def test_result_available(self, pipeline):
+        """Resultado da etapa fica disponível"""
+        pipeline.add("db", lambda: 42)
+        pipeline.start()
+        pipeline.wait(2.0)
+
+        assert pipeline.result("db") == 42
+
+    def test_wait_timeout(self, pipeline):
+        """wait devolve False se o prazo vencer"""
+        gate = threading.Event()
+        pipeline.add("db", gate.wait)
+        pipeline.start()
+
+        assert pipeline.wait(0.05) is False
+        gate.set()
+        assert pipeline.wait(2.0)
+
+    def test_invalid_registration(self, pipeline):
+        """Nome duplicado ou dependência desconhecida são rejeitados"""
+        pipeline.add("db", lambda: None)
+
+        with pytest.raises(ValueError):
+            pipeline.add("db", lambda: None)
+        with pytest.raises(ValueError):
+            pipeline.add("audit", lambda: None, depends=("inexistente",))
+
+    def test_steps_recorded_in_profiler(self):
+        """Cada etapa vira uma fase no trace"""
+        profiler = StartupProfiler(enabled=True)
+        pipe = StartupPipeline(profiler=profiler)
+        pipe.add("db", lambda: None)
+        pipe.add("audit", lambda: None, depends=("db",), ui=True)
+
+        pipe.start()
+        assert pipe.wait(2.0)
+
+        names = {event["name"] for event in profiler.events()}
+        assert {"startup.db", "startup.audit"} <= names
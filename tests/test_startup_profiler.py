@@ -0,0 +1,97 @@
+"""
+Testes para o profiler da inicialização.
+"""
+import json
+import time
+
+from ozempic_seguro.core.startup_profiler import (
+    CLI_FLAG,
+    ENV_VAR,
+    StartupProfiler,
+    _resolve_settings,
+    get_profiler,
+)
+
+
+class TestStartupProfiler:
+    """Testes para StartupProfiler"""
+
+    def test_disabled_records_nothing(self):
+        """Desligado, fases e instantes não são registrados"""
+        profiler = StartupProfiler(enabled=False)
+        with profiler.phase("db.migrations"):
+            pass
+        profiler.mark("first_frame")
+
+        assert profiler.events() == []
+        assert profiler.write() is None
+
+    def test_phase_records_complete_event(self):
+        """Fase vira evento "X" com duração em microssegundos"""
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase("frame.login", frame="login"):
+            time.sleep(0.01)
+
+        event = profiler.events()[0]
+        assert event["name"] == "frame.login"
+        assert event["cat"] == "frame"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 10000
+        assert event["args"] == {"frame": "login"}
+
+    def test_phase_recorded_even_on_error(self):
+        """Fase que falha ainda é registrada"""
+        profiler = StartupProfiler(enabled=True)
+        try:
+            with profiler.phase("db.connect"):
+                raise RuntimeError("falha")
+        except RuntimeError:
+            pass
+
+        assert [e["name"] for e in profiler.events()] == ["db.connect"]
+
+    def test_add_span_and_summary(self):
+        """Resumo em ordem cronológica com duração das fases"""
+        profiler = StartupProfiler(enabled=True)
+        profiler.add_span("imports", 1_000_000, 3_000_000)
+        profiler.add_span("images.decode", 3_000_000, 3_500_000)
+
+        assert profiler.summary() == [("imports", 2.0), ("images.decode", 0.5)]
+
+    def test_write_chrome_trace(self, tmp_path):
+        """Trace gravado é JSON no formato Trace Event"""
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase("tk.init"):
+            pass
+        profiler.mark("first_frame")
+        path = tmp_path / "sub" / "trace.json"
+
+        assert profiler.write(str(path)) == str(path)
+
+        trace = json.loads(path.read_text(encoding="utf-8"))
+        assert trace["displayTimeUnit"] == "ms"
+        phases = {e["ph"] for e in trace["traceEvents"]}
+        assert phases == {"X", "i"}
+        assert all({"name", "ts", "pid", "tid"} <= e.keys() for e in trace["traceEvents"])
+
+    def test_get_profiler_singleton(self):
+        """get_profiler retorna sempre a mesma instância"""
+        assert get_profiler() is get_profiler()
+
+
+class TestResolveSettings:
+    """Ativação por variável de ambiente ou linha de comando"""
+
+    def test_default_disabled(self):
+        assert _resolve_settings([], {}) == (False, None)
+
+    def test_env_flag(self):
+        assert _resolve_settings([], {ENV_VAR: "1"}) == (True, None)
+        assert _resolve_settings([], {ENV_VAR: "0"}) == (False, None)
+
+    def test_env_path(self):
+        assert _resolve_settings([], {ENV_VAR: "/tmp/t.json"}) == (True, "/tmp/t.json")
+
+    def test_cli_flag_overrides_env(self):
+        assert _resolve_settings([CLI_FLAG], {ENV_VAR: "0"}) == (True, None)
+        assert _resolve_settings([f"{CLI_FLAG}=out.json"], {}) == (True, "out.json")
@@ -0,0 +1,156 @@
+"""
+Testes para StateJournalRepository e recuperação de bloqueios após reinício.
+"""
+import time
+
+import pytest
+
+from ozempic_seguro.repositories.state_journal_repository import StateJournalRepository
+from ozempic_seguro.session.login_attempts import LOCKOUT_KEY_PREFIX, LoginAttemptsManager
+from ozempic_seguro.session.timer_manager import SYSTEM_BLOCK_KEY, TimerManager
+from ozempic_seguro.config import Config
+
+
+class TestStateJournalRepository:
+    """Testes para StateJournalRepository"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, temp_db):
+        """Setup com banco temporário"""
+        self.repo = StateJournalRepository()
+        yield
+
+    def test_save_and_load(self):
+        """Testa gravação e leitura de prazo vigente"""
+        now = time.time()
+        self.repo.save("system_block", now + 120)
+
+        active = self.repo.load_active(now=now)
+
+        assert active["system_block"] == pytest.approx(120)
+
+    def test_save_replaces(self):
+        """Testa que nova gravação substitui o prazo"""
+        now = time.time()
+        self.repo.save("k", now + 10)
+        self.repo.save("k", now + 50)
+
+        assert self.repo.load_active(now=now) == {"k": pytest.approx(50)}
+
+    def test_load_discards_expired(self):
+        """Testa que prazos vencidos são descartados na leitura"""
+        now = time.time()
+        self.repo.save("vencido", now - 1)
+        self.repo.save("vigente", now + 30)
+
+        assert set(self.repo.load_active(now=now)) == {"vigente"}
+        assert set(self.repo.load_active(now=now + 60)) == set()
+
+    def test_delete(self):
+        """Testa remoção de chave"""
+        self.repo.save("k", time.time() + 10)
+
+        assert self.repo.delete("k") is True
+        assert self.repo.load_active() == {}
+
+
+class TestBlockRecovery:
+    """Bloqueios persistidos sobrevivem a um novo processo"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, temp_db):
+        """Setup com banco temporário"""
+        self.repo = StateJournalRepository()
+        yield
+
+    def test_system_block_survives_restart(self):
+        """Testa que o bloqueio pós-abertura volta após reinício"""
+        timer = TimerManager()
+        timer.set_journal(self.repo)
+        timer.block_for_minutes(5)
+        timer.clear_block(persist=False)  # Encerramento da aplicação
+
+        restarted = TimerManager()
+        restarted.restore_block(self.repo.load_active()[SYSTEM_BLOCK_KEY])
+
+        assert restarted.is_blocked() is True
+        assert 290 <= restarted.get_remaining_time() <= 300
+        restarted.clear_block()
+
+    def test_clear_block_removes_from_journal(self):
+        """Testa que liberar o bloqueio apaga o registro"""
+        timer = TimerManager()
+        timer.set_journal(self.repo)
+        timer.block_for_minutes(5)
+        timer.clear_block()
+
+        assert SYSTEM_BLOCK_KEY not in self.repo.load_active()
+
+    def test_lockout_survives_restart(self):
+        """Testa que lockout de força bruta volta após reinício"""
+        manager = LoginAttemptsManager()
+        manager.set_journal(self.repo)
+        for _ in range(Config.Security.MAX_LOGIN_ATTEMPTS):
+            manager.record_attempt("atacante", success=False)
+
+        remaining = self.repo.load_active()[LOCKOUT_KEY_PREFIX + "atacante"]
+        restarted = LoginAttemptsManager()
+        restarted.restore_lockout("atacante", remaining)
+
+        assert restarted.is_locked("atacante") is True
+        assert restarted.get_remaining_attempts("atacante") == 0
+
+    def test_successful_login_clears_lockout(self):
+        """Testa que reset do lockout apaga o registro"""
+        manager = LoginAttemptsManager()
+        manager.set_journal(self.repo)
+        for _ in range(Config.Security.MAX_LOGIN_ATTEMPTS):
+            manager.record_attempt("usuario", success=False)
+
+        manager.reset("usuario")
+
+        assert self.repo.load_active() == {}
+
+    def test_failed_attempts_without_lock_not_journaled(self):
+        """Testa que falhas abaixo do limite não escrevem no banco"""
+        manager = LoginAttemptsManager()
+        manager.set_journal(self.repo)
+        manager.record_attempt("usuario", success=False)
+
+        assert self.repo.load_active() == {}
+
+    def test_session_manager_attach_restores_state(self, session_manager):
+        """Testa que attach_state_journal restaura bloqueio e lockout"""
+        now = time.time()
+        self.repo.save(SYSTEM_BLOCK_KEY, now + 60)
+        self.repo.save(LOCKOUT_KEY_PREFIX + "bloqueado", now + 60)
+
+        session_manager.attach_state_journal(self.repo)
+
+        assert session_manager.is_blocked() is True
+        assert session_manager.is_user_locked("bloqueado") is True
+        session_manager._timer.clear_block()
+
+    def test_is_blocked_does_not_query_journal(self, session_manager):
+        """Testa que is_blocked não consulta o diário"""
+
+        class Journal:
+            def __init__(self):
+                self.calls = 0
+
+            def load_active(self):
+                self.calls += 1
+                return {}
+
+            def save(self, key, expires_at):
+                self.calls += 1
+
+            def delete(self, key):
+                self.calls += 1
+
+        journal = Journal()
+        session_manager.attach_state_journal(journal)
+        for _ in range(100):
+            session_manager.is_blocked()
+
+        assert journal.calls == 1
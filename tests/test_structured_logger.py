@@ -118,6 +118,52 @@ class TestStructuredFormatter:
         assert "exception" in data
         assert data["exception"]["type"] == "ValueError"
 
+    def test_timestamp_uses_record_created(self):
+        """Timestamp vem da criação do registro, não da formatação"""
+        formatter = StructuredFormatter()
+        record = logging.makeLogRecord({"msg": "evento"})
+        record.created = 1700000000.25
+
+        data = json.loads(formatter.format(record))
+
+        assert data["timestamp"] == "2023-11-14T22:13:20.250000+00:00"
+
+    def test_timestamp_prefix_cached_per_second(self):
+        """Registros no mesmo segundo reaproveitam o prefixo em cache"""
+        formatter = StructuredFormatter()
+        first = logging.makeLogRecord({"msg": "a", "created": 1700000000.1})
+        second = logging.makeLogRecord({"msg": "b", "created": 1700000000.9})
+        later = logging.makeLogRecord({"msg": "c", "created": 1700000001.0})
+
+        formatter.format(first)
+        cached = formatter._ts_cache
+        formatter.format(second)
+        assert formatter._ts_cache is cached
+
+        data = json.loads(formatter.format(later))
+        assert data["timestamp"] == "2023-11-14T22:13:21.000000+00:00"
+
+    def test_extra_excludes_standard_attributes(self):
+        """Apenas campos não padrão vão para extra"""
+        formatter = StructuredFormatter()
+        plain = logging.makeLogRecord({"msg": "sem extras"})
+        with_extra = logging.makeLogRecord({"msg": "com extra", "event": "login"})
+
+        assert "extra" not in json.loads(formatter.format(plain))
+        assert json.loads(formatter.format(with_extra))["extra"] == {"event": "login"}
+
+    def test_stdlib_fallback_matches_fast_path(self):
+        """Sem orjson, a saída equivale à do caminho rápido"""
+        record = logging.makeLogRecord(
+            {"msg": "ação %s", "args": ("ç",), "created": 1700000000.5, "obj": object}
+        )
+        stdlib = json.loads(StructuredFormatter(use_orjson=False).format(record))
+        default = json.loads(StructuredFormatter().format(record))
+
+        assert stdlib == default
+        assert stdlib["message"] == "ação ç"
+        assert stdlib["extra"]["obj"] == str(object)
+
 
 class TestSensitiveDataFilter:
     """Testes para SensitiveDataFilter"""
@@ -200,6 +246,57 @@ class TestSensitiveDataFilter:
         assert "token" in filter.SENSITIVE_FIELDS
         assert "secret" in filter.SENSITIVE_FIELDS
 
+    def test_filter_masks_values_in_args(self):
+        """Testa mascaramento de segredo vindo nos argumentos"""
+        filter = SensitiveDataFilter()
+        record = logging.makeLogRecord({"msg": "dados: %s", "args": ("senha=abc123",)})
+
+        filter.filter(record)
+
+        assert "abc123" not in record.getMessage()
+        assert record.args is None
+
+    def test_filter_masks_multiple_fields_any_case(self):
+        """Testa mascaramento de vários campos com maiúsculas"""
+        filter = SensitiveDataFilter()
+        record = logging.makeLogRecord({"msg": "PASSWORD=um Token: 'dois' ok=tres"})
+
+        filter.filter(record)
+
+        message = record.getMessage()
+        assert "um" not in message.split() and "dois" not in message
+        assert "password=***REDACTED***" in message
+        assert "ok=tres" in message
+
+    def test_filter_masks_non_ascii_message(self):
+        """Testa mascaramento em texto com acentos"""
+        filter = SensitiveDataFilter()
+        record = logging.makeLogRecord({"msg": "usuário joão senha=segredo"})
+
+        filter.filter(record)
+
+        assert record.getMessage() == "usuário joão senha=***REDACTED***"
+
+    def test_filter_leaves_clean_record_untouched(self):
+        """Testa que registro sem campos sensíveis não é alterado"""
+        filter = SensitiveDataFilter()
+        record = logging.makeLogRecord({"msg": "Service accessed: %s", "args": ("x",)})
+
+        filter.filter(record)
+
+        assert record.msg == "Service accessed: %s"
+        assert record.args == ("x",)
+
+    def test_filter_redacts_sensitive_extras(self):
+        """Testa mascaramento de atributos extras sensíveis"""
+        filter = SensitiveDataFilter()
+        record = logging.makeLogRecord({"msg": "login", "auth_token": "abc", "event": "x"})
+
+        filter.filter(record)
+
+        assert record.auth_token == "***REDACTED***"
+        assert record.event == "x"
+
 
 class TestStructuredLogger:
     """Testes para StructuredLogger"""
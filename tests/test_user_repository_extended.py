@@ -121,3 +121,26 @@ class TestUserRepositoryExtended:
         if hasattr(self.repo, "get_user_stats"):
             stats = self.repo.get_user_stats()
             assert isinstance(stats, dict)
+
+    def test_authenticate_rehashes_weak_hash(self):
+        """Testa rehash em background de hash com custo antigo"""
+        from ozempic_seguro.repositories.security import hash_password, get_hash_rounds
+        from ozempic_seguro.repositories.security import get_default_rounds
+
+        username = f"rehash_{uuid.uuid4().hex[:8]}"
+        user_id = self.repo.create_user(username, "senha123", "Rehash User", "vendedor")
+        self.repo._db.execute(
+            "UPDATE usuarios SET senha_hash = ? WHERE id = ?",
+            (hash_password("senha123", rounds=10), user_id),
+        )
+        self.repo._db.commit()
+
+        user = self.repo.authenticate_user(username, "senha123")
+        assert user is not None
+        assert self.repo._pending_rehash.result(timeout=10) is True
+
+        self.repo._db.execute("SELECT senha_hash FROM usuarios WHERE id = ?", (user_id,))
+        new_hash = self.repo._db.fetchone()[0]
+        assert get_hash_rounds(new_hash) == get_default_rounds()
+        assert self.repo.authenticate_user(username, "senha123") is not None
+        assert self.repo._pending_rehash.done()